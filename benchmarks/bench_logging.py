@@ -0,0 +1,66 @@
+"""
+Benchmark for the cost of tick logging.
+
+Ticks a wide `Sequence` of `AlwaysSuccess` leaves with logging disabled,
+with logging enabled but filtered out by the logger level, and with 
+logging written to a file by the background listener.
+
+Usage:
+    python benchmarks/bench_logging.py --leaves 100 --ticks 2000
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from dendron import BehaviorTree
+from dendron.actions import AlwaysSuccess
+from dendron.controls import Sequence
+
+def make_tree(name : str, n_leaves : int) -> BehaviorTree:
+    root = Sequence([AlwaysSuccess("leaf") for _ in range(n_leaves)], name="root")
+    return BehaviorTree(name, root, num_workers=1)
+
+def time_ticks(tree : BehaviorTree, n_ticks : int) -> float:
+    start = time.perf_counter()
+    for _ in range(n_ticks):
+        tree.tick_once()
+    return time.perf_counter() - start
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--leaves", type=int, default=100)
+    parser.add_argument("--ticks", type=int, default=2000)
+    args = parser.parse_args()
+
+    results = {}
+
+    tree = make_tree("bench-off", args.leaves)
+    results["disabled"] = time_ticks(tree, args.ticks)
+
+    tree = make_tree("bench-filtered", args.leaves)
+    tree.enable_logging()
+    tree.root.set_log_level(logging.DEBUG)
+    tree.logger.setLevel(logging.WARNING)
+    results["filtered"] = time_ticks(tree, args.ticks)
+    tree.disable_logging()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tree = make_tree("bench-file", args.leaves)
+        tree.enable_logging()
+        tree.set_log_filename(os.path.join(tmp, "bench.log"))
+        results["file"] = time_ticks(tree, args.ticks)
+        start = time.perf_counter()
+        tree.disable_logging()
+        drain = time.perf_counter() - start
+
+    n_node_ticks = args.ticks * (args.leaves + 1)
+    print(f"leaves: {args.leaves}  ticks: {args.ticks}")
+    for mode, elapsed in results.items():
+        print(f"{mode:>10}: {args.ticks / elapsed:10.1f} ticks/s  {1e9 * elapsed / n_node_ticks:8.0f} ns per node tick")
+    print(f"{'drain':>10}: {drain:.3f} s to flush the file log after ticking")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark for node naming.
+
+Builds many small trees whose nodes all request the same name, so that
+every name after the first in each tree needs a suffix. With per-tree 
+naming the cost per node stays flat as the number of nodes grows.
+
+Usage:
+    python benchmarks/bench_naming.py --nodes 1000000 --tree-size 1000
+"""
+
+import argparse
+import gc
+import time
+
+from dendron import BehaviorTree
+from dendron.actions import AlwaysSuccess
+from dendron.controls import Sequence
+
+def build_trees(n_nodes : int, tree_size : int) -> float:
+    start = time.perf_counter()
+    built = 0
+    while built < n_nodes:
+        k = min(tree_size, n_nodes - built)
+        root = Sequence([AlwaysSuccess("action") for _ in range(k)], name="root")
+        tree = BehaviorTree("bench", root, num_workers=1)
+        tree.executor.shutdown()
+        built += k
+    return time.perf_counter() - start
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=1_000_000)
+    parser.add_argument("--tree-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    # warm up with a small run.
+    build_trees(10 * args.tree_size, args.tree_size)
+    gc.collect()
+
+    elapsed = build_trees(args.nodes, args.tree_size)
+    print(f"nodes: {args.nodes}  tree size: {args.tree_size}")
+    print(f"total: {elapsed:.3f} s  per node: {1e9 * elapsed / args.nodes:.0f} ns")
+
+if __name__ == "__main__":
+    main()
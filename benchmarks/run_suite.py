@@ -0,0 +1,420 @@
+"""
+CPU-only benchmark suite for dendron.
+
+Measures tick throughput of deep and wide `Sequence` and `Fallback`
+trees, `Blackboard` get/set throughput (by key, and by slot on a
+`SlotBlackboard`), `create_from_groot` parse time on a large synthetic
+XML file, subtree instantiation, `AsyncAction` round-trip latency, and the per-call overhead of language model nodes
+excluding the model's own compute. The LM benchmarks use a tiny,
+randomly initialized Llama built locally by `tiny_lm.py`, so nothing is
+downloaded. The replay benchmark ticks many sessions against a 
+`ReplayLM` to measure scheduling overhead and concurrency.
+
+Each measurement is the best of `--repeat` runs. Results are printed and
+can be written as JSON with `--output`. Passing a previous results file
+to `--compare` prints the change for every benchmark and exits with
+status 1 if any of them is worse by more than `--threshold`.
+
+Usage:
+    python benchmarks/run_suite.py --output results.json
+    python benchmarks/run_suite.py --compare results.json --threshold 0.1
+    python benchmarks/run_suite.py --filter tick --quick
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List
+
+from dendron import BehaviorTree, BehaviorTreeFactory, Blackboard, NodeStatus, SlotBlackboard
+from dendron.actions import AlwaysSuccess, AlwaysFailure, AsyncAction
+from dendron.controls import Sequence, Fallback
+
+@dataclass
+class Result:
+    name : str
+    value : float
+    unit : str
+    # "higher" if larger values are better (throughput), "lower" otherwise.
+    better : str
+
+BENCHMARKS : Dict[str, Callable] = {}
+
+def benchmark(name : str) -> Callable:
+    def register(fn : Callable) -> Callable:
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+def best_of(repeat : int, fn : Callable) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def tick_rate(tree : BehaviorTree, n_ticks : int, repeat : int) -> float:
+    def run():
+        for _ in range(n_ticks):
+            tree.tick_once()
+    return n_ticks / best_of(repeat, run)
+
+### Trees
+
+def deep_sequence(depth : int):
+    node = AlwaysSuccess("leaf")
+    for i in range(depth):
+        node = Sequence([node], name="seq")
+    return node
+
+def deep_fallback(depth : int):
+    # every level fails its first child and falls back to the next level.
+    node = AlwaysSuccess("leaf")
+    for i in range(depth):
+        node = Fallback([AlwaysFailure("fail"), node], name="fallback")
+    return node
+
+def wide_sequence(width : int):
+    return Sequence([AlwaysSuccess("leaf") for _ in range(width)], name="seq")
+
+def wide_fallback(width : int):
+    return Fallback([AlwaysFailure("fail") for _ in range(width - 1)] + [AlwaysSuccess("leaf")], name="fallback")
+
+@benchmark("tick")
+def bench_tick(args) -> List[Result]:
+    results = []
+    size = args.size
+    shapes = {
+        "deep_sequence" : deep_sequence(size),
+        "deep_fallback" : deep_fallback(size),
+        "wide_sequence" : wide_sequence(size),
+        "wide_fallback" : wide_fallback(size),
+    }
+    for shape, root in shapes.items():
+        tree = BehaviorTree(shape, root, num_workers=1)
+        n_nodes = len(tree.node_paths)
+        rate = tick_rate(tree, args.ticks, args.repeat)
+        results.append(Result(f"tick/{shape}", rate, "ticks/s", "higher"))
+        results.append(Result(f"tick/{shape}/per_node", 1e9 / (rate * n_nodes), "ns", "lower"))
+        tree.executor.shutdown()
+    return results
+
+### Blackboard
+
+@benchmark("blackboard")
+def bench_blackboard(args) -> List[Result]:
+    n = args.ops
+    keys = [f"key{i}" for i in range(1000)]
+    bb = Blackboard()
+    for k in keys:
+        bb[k] = 0
+
+    def sets():
+        for i in range(n):
+            bb[keys[i % 1000]] = i
+
+    def gets():
+        for i in range(n):
+            bb[keys[i % 1000]]
+
+    # the same accesses on a SlotBlackboard, by key and by slot.
+    slot_bb = SlotBlackboard()
+    for k in keys:
+        slot_bb[k] = 0
+    slots = [slot_bb.slot(k) for k in keys]
+
+    def slot_key_sets():
+        for i in range(n):
+            slot_bb[keys[i % 1000]] = i
+
+    def slot_key_gets():
+        for i in range(n):
+            slot_bb[keys[i % 1000]]
+
+    def slot_sets():
+        for i in range(n):
+            slot_bb.set_slot(slots[i % 1000], i)
+
+    def slot_gets():
+        for i in range(n):
+            slot_bb.get_slot(slots[i % 1000])
+
+    return [
+        Result("blackboard/set", n / best_of(args.repeat, sets), "ops/s", "higher"),
+        Result("blackboard/get", n / best_of(args.repeat, gets), "ops/s", "higher"),
+        Result("blackboard/slot_bb_key_set", n / best_of(args.repeat, slot_key_sets), "ops/s", "higher"),
+        Result("blackboard/slot_bb_key_get", n / best_of(args.repeat, slot_key_gets), "ops/s", "higher"),
+        Result("blackboard/slot_set", n / best_of(args.repeat, slot_sets), "ops/s", "higher"),
+        Result("blackboard/slot_get", n / best_of(args.repeat, slot_gets), "ops/s", "higher"),
+    ]
+
+### Factory
+
+def make_factory() -> BehaviorTreeFactory:
+    factory = BehaviorTreeFactory()
+    factory.register_simple_action("Work", lambda: NodeStatus.SUCCESS)
+    factory.register_simple_condition("Check", lambda: NodeStatus.SUCCESS)
+    return factory
+
+NODE_MODEL = """  <TreeNodesModel>
+    <Action ID="Work"/>
+    <Condition ID="Check"/>
+  </TreeNodesModel>
+"""
+
+def write_large_xml(filename : str, n_nodes : int) -> None:
+    # a wide root of small Sequences, each with a condition and an action.
+    n_groups = max(1, n_nodes // 3)
+    with open(filename, "w") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<root BTCPP_format="4" main_tree_to_execute="Main">\n')
+        f.write('  <BehaviorTree ID="Main">\n    <Sequence>\n')
+        for i in range(n_groups):
+            f.write(f'      <Sequence>\n        <Check key{i % 10}="v{i}"/>\n        <Work/>\n      </Sequence>\n')
+        f.write('    </Sequence>\n  </BehaviorTree>\n')
+        f.write(NODE_MODEL)
+        f.write('</root>\n')
+
+def write_subtree_xml(filename : str, n_instances : int, subtree_size : int) -> None:
+    with open(filename, "w") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<root BTCPP_format="4" main_tree_to_execute="Main">\n')
+        f.write('  <BehaviorTree ID="Main">\n    <Sequence>\n')
+        for _ in range(n_instances):
+            f.write('      <SubTree ID="Child"/>\n')
+        f.write('    </Sequence>\n  </BehaviorTree>\n')
+        f.write('  <BehaviorTree ID="Child">\n    <Sequence>\n')
+        for _ in range(subtree_size):
+            f.write('      <Work/>\n')
+        f.write('    </Sequence>\n  </BehaviorTree>\n')
+        f.write(NODE_MODEL)
+        f.write('</root>\n')
+
+@benchmark("factory")
+def bench_factory(args) -> List[Result]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        large = os.path.join(tmp, "large.xml")
+        write_large_xml(large, args.xml_nodes)
+        elapsed = best_of(args.repeat, lambda: make_factory().create_from_groot(large))
+        results.append(Result("factory/parse_large_xml", elapsed, "s", "lower"))
+        results.append(Result("factory/parse_large_xml/per_node", 1e9 * elapsed / args.xml_nodes, "ns", "lower"))
+
+        n_instances = max(1, args.xml_nodes // 100)
+        subtrees = os.path.join(tmp, "subtrees.xml")
+        write_subtree_xml(subtrees, n_instances, 100)
+        elapsed = best_of(args.repeat, lambda: make_factory().create_from_groot(subtrees))
+        results.append(Result("factory/subtree_instantiation", 1e6 * elapsed / n_instances, "us/subtree", "lower"))
+    return results
+
+### AsyncAction
+
+@benchmark("async")
+def bench_async(args) -> List[Result]:
+    node = AsyncAction("async", lambda: NodeStatus.SUCCESS)
+    tree = BehaviorTree("async", node, num_workers=1)
+    n = max(1, args.ticks // 10)
+
+    def round_trips():
+        for _ in range(n):
+            tree.tick_while_running()
+
+    elapsed = best_of(args.repeat, round_trips)
+    tree.executor.shutdown()
+    return [Result("async/round_trip", 1e6 * elapsed / n, "us", "lower")]
+
+### LM nodes
+
+class ModelTimer:
+    """
+    Accumulates the time an HFLM spends inside the model itself, by
+    wrapping its `_model_generate` and `_model_call` methods on the
+    instance.
+    """
+    def __init__(self, lm) -> None:
+        self.elapsed = 0.0
+        for method in ("_model_generate", "_model_call"):
+            setattr(lm, method, self.wrap(getattr(lm, method)))
+
+    def wrap(self, fn : Callable) -> Callable:
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.elapsed += time.perf_counter() - start
+        return timed
+
+def lm_overhead(tree : BehaviorTree, model_name : str, n_calls : int, repeat : int) -> float:
+    timer = ModelTimer(tree.get_model(model_name))
+    if tree.tick_once() != NodeStatus.SUCCESS:
+        raise RuntimeError(f"{tree.tree_name} failed to tick")
+    best = float("inf")
+    for _ in range(repeat):
+        timer.elapsed = 0.0
+        start = time.perf_counter()
+        for _ in range(n_calls):
+            tree.tick_once()
+        total = time.perf_counter() - start
+        best = min(best, (total - timer.elapsed) / n_calls)
+    return best
+
+@benchmark("lm")
+def bench_lm(args) -> List[Result]:
+    import torch
+    from tiny_lm import build_tiny_lm, make_prompt
+    from dendron.actions import GenerateAction, LogLikelihoodAction
+    from dendron.configs import HFLMConfig, LMActionConfig
+
+    results = []
+    n_calls = max(1, args.lm_calls)
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = build_tiny_lm(tmp)
+        model_cfg = HFLMConfig(model_path, device="cpu", dtype=torch.float32)
+
+        node = GenerateAction(model_cfg, LMActionConfig(node_name="generate", max_new_tokens=8))
+        tree = BehaviorTree("lm-generate", node, num_workers=1)
+        tree.blackboard[node.input_key] = make_prompt(32)
+        overhead = lm_overhead(tree, model_path, n_calls, args.repeat)
+        results.append(Result("lm/generate/overhead", 1e6 * overhead, "us/call", "lower"))
+
+        node = LogLikelihoodAction(model_cfg, LMActionConfig(node_name="loglikelihood"))
+        tree = BehaviorTree("lm-loglikelihood", node, num_workers=1)
+        tree.blackboard[node.prompt_key] = make_prompt(32)
+        tree.blackboard[node.completions_key] = [make_prompt(4, offset) for offset in range(4)]
+        overhead = lm_overhead(tree, model_path, n_calls, args.repeat)
+        results.append(Result("lm/loglikelihood/overhead", 1e6 * overhead, "us/call", "lower"))
+    return results
+
+@benchmark("replay")
+def bench_replay(args) -> List[Result]:
+    from concurrent import futures
+    from dendron.actions import GenerateAction
+    from dendron.configs import HFLMConfig, LMActionConfig
+    from dendron.replay_lm import LatencyModel, ReplayLM
+
+    def make_sessions(lm, n):
+        trees = []
+        for i in range(n):
+            tree = BehaviorTree(f"session-{i}", num_workers=1)
+            tree.set_model("replay", lm)
+            node = GenerateAction(HFLMConfig("replay", device="cpu"), LMActionConfig(node_name="generate"))
+            tree.set_root(node)
+            tree.blackboard[node.input_key] = f"prompt {i}"
+            trees.append(tree)
+        return trees
+
+    def make_lm(latency):
+        lm = ReplayLM(latency=latency)
+        lm.add("generate_until", ["prompt 0", {}], "a recorded response")
+        return lm
+
+    results = []
+    trees = make_sessions(make_lm(LatencyModel.none()), args.sessions)
+
+    def tick_all():
+        for tree in trees:
+            tree.tick_once()
+
+    elapsed = best_of(args.repeat, tick_all)
+    results.append(Result("replay/overhead", 1e6 * elapsed / len(trees), "us/tick", "lower"))
+
+    # sessions ticked from a pool of threads against a model with a 
+    # realistic latency distribution.
+    trees = make_sessions(make_lm(LatencyModel.lognormal(args.replay_latency, 0.5)), args.sessions)
+    with futures.ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        elapsed = best_of(args.repeat, lambda: list(pool.map(BehaviorTree.tick_once, trees)))
+    results.append(Result("replay/concurrent", len(trees) / elapsed, "ticks/s", "higher"))
+    return results
+
+### Running and comparing
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python" : platform.python_version(),
+        "platform" : platform.platform(),
+        "processor" : platform.processor(),
+        "commit" : commit,
+        "time" : time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+def compare(results : List[Result], baseline_file : str, threshold : float) -> bool:
+    with open(baseline_file) as f:
+        baseline = {r["name"] : r for r in json.load(f)["results"]}
+
+    ok = True
+    print(f"\ncompared with {baseline_file} (threshold {threshold:.0%}):")
+    for r in results:
+        old = baseline.get(r.name)
+        if old is None or old["value"] == 0:
+            print(f"{r.name:>40}: no baseline")
+            continue
+        change = (r.value - old["value"]) / old["value"]
+        worse = -change if r.better == "higher" else change
+        status = "ok"
+        if worse > threshold:
+            status = "REGRESSION"
+            ok = False
+        elif worse < -threshold:
+            status = "improved"
+        print(f"{r.name:>40}: {old['value']:12.4g} -> {r.value:12.4g} {r.unit:<10} {change:+7.1%}  {status}")
+    return ok
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="compare with a previous results file")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change that counts as a regression")
+    parser.add_argument("--filter", action="append", default=[], choices=sorted(BENCHMARKS), help="only run these benchmarks")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--size", type=int, default=100, help="depth or width of the tick benchmark trees")
+    parser.add_argument("--ticks", type=int, default=1000)
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--xml-nodes", type=int, default=30_000)
+    parser.add_argument("--lm-calls", type=int, default=20)
+    parser.add_argument("--sessions", type=int, default=1000, help="trees in the replay benchmark")
+    parser.add_argument("--concurrency", type=int, default=64, help="threads ticking sessions in the replay benchmark")
+    parser.add_argument("--replay-latency", type=float, default=0.005, help="median replayed model latency in seconds")
+    parser.add_argument("--quick", action="store_true", help="shrink every benchmark for a smoke test")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.repeat = 1
+        args.ticks = 50
+        args.ops = 10_000
+        args.xml_nodes = 1000
+        args.lm_calls = 2
+        args.sessions = 100
+
+    # tiny_lm lives next to this script.
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    results = []
+    for name, fn in BENCHMARKS.items():
+        if args.filter and name not in args.filter:
+            continue
+        for r in fn(args):
+            print(f"{r.name:>40}: {r.value:12.4g} {r.unit}")
+            results.append(r)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"environment" : environment(), "results" : [asdict(r) for r in results]}, f, indent=2)
+
+    if args.compare and not compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
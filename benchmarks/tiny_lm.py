@@ -0,0 +1,77 @@
+"""
+Build a tiny, randomly initialized Llama checkpoint and tokenizer on
+disk, so that language model nodes can be exercised on a CPU without
+downloading anything. The model is far too small to produce meaningful
+text; it only exists to measure the plumbing around model calls.
+
+Usage:
+    python benchmarks/tiny_lm.py /tmp/tiny-llama
+"""
+
+import argparse
+
+import torch
+from tokenizers import Tokenizer, models, pre_tokenizers, trainers
+from transformers import LlamaConfig, LlamaForCausalLM, PreTrainedTokenizerFast
+
+# Word-level vocabulary: "w0" ... "w{VOCAB_WORDS - 1}", plus specials.
+VOCAB_WORDS = 256
+
+def make_prompt(n_words : int, offset : int = 0) -> str:
+    """
+    A prompt of `n_words` in-vocabulary words, each one token.
+    """
+    return " ".join(f"w{(offset + i) % VOCAB_WORDS}" for i in range(n_words))
+
+def build_tiny_lm(path : str, seed : int = 0) -> str:
+    """
+    Write a tiny Llama checkpoint and its tokenizer to `path`.
+
+    Args:
+        path (`str`):
+            The directory to write to.
+        seed (`int`):
+            The seed for the random weights.
+
+    Returns:
+        `str`: `path`, for passing to `HFLMConfig`.
+    """
+    tokenizer = Tokenizer(models.WordLevel(unk_token="<unk>"))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    trainer = trainers.WordLevelTrainer(special_tokens=["<unk>", "<s>", "</s>", "<pad>"])
+    tokenizer.train_from_iterator([make_prompt(VOCAB_WORDS)], trainer)
+
+    hf_tokenizer = PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer,
+        unk_token="<unk>",
+        bos_token="<s>",
+        eos_token="</s>",
+        pad_token="<pad>",
+    )
+    hf_tokenizer.save_pretrained(path)
+
+    torch.manual_seed(seed)
+    config = LlamaConfig(
+        vocab_size=len(hf_tokenizer),
+        hidden_size=32,
+        intermediate_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        num_key_value_heads=2,
+        max_position_embeddings=512,
+        bos_token_id=hf_tokenizer.bos_token_id,
+        eos_token_id=hf_tokenizer.eos_token_id,
+        pad_token_id=hf_tokenizer.pad_token_id,
+    )
+    LlamaForCausalLM(config).save_pretrained(path)
+    return path
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    build_tiny_lm(args.path, args.seed)
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,9 @@ from .basic_types import NodeType, NodeStatus
 from .behavior_tree import BehaviorTree 
 from .behavior_tree_factory import BehaviorTreeFactory
 from .blackboard import Blackboard, BlackboardEntryMetadata
+from .blackboard_view import BlackboardView
+from .slot_blackboard import SlotBlackboard
+from .concurrent_blackboard import ConcurrentBlackboard
 from .condition_node import ConditionNode 
 from .control_node import ControlNode 
 from .decorator_node import DecoratorNode 
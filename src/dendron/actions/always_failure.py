@@ -1,5 +1,6 @@
 from ..action_node import ActionNode
 from ..tree_node import NodeStatus
+from ..dataflow import BlackboardAccess
 
 class AlwaysFailure(ActionNode):
     """
@@ -9,6 +10,9 @@ class AlwaysFailure(ActionNode):
         name (`str`):
             The given name of this node.
     """
+    # touches no blackboard keys.
+    declared_access = BlackboardAccess()
+
     def __init__(self, name : str) -> None:
         super().__init__(name)
 
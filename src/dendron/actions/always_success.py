@@ -1,6 +1,7 @@
 from ..action_node import ActionNode
 from ..basic_types import NodeStatus
 from ..blackboard import Blackboard
+from ..dataflow import BlackboardAccess
 
 class AlwaysSuccess(ActionNode):
     """
@@ -10,6 +11,9 @@ class AlwaysSuccess(ActionNode):
         name (`str`):
             The given name of this node.
     """
+    # touches no blackboard keys.
+    declared_access = BlackboardAccess()
+
     def __init__(self, name : str) -> None:
         super().__init__(name)
 
@@ -4,6 +4,7 @@ from ..basic_types import NodeStatus
 from typing import Callable
 
 from concurrent import futures
+import traceback
 
 class AsyncAction(ActionNode):
     """
@@ -17,8 +18,9 @@ class AsyncAction(ActionNode):
     Internally, this node maintains a future to store the eventual
     result of the asynchronous computation.
 
-    Asynchronous execution is handled by the node's tree's executor,
-    which means this node cannot run without an enclosing tree.
+    Asynchronous execution is handled by the node's tree's executor
+    (through `BehaviorTree.submit`), which means this node cannot run
+    without an enclosing tree.
 
     Args:
         name (`str`):
@@ -40,23 +42,54 @@ class AsyncAction(ActionNode):
         """
         self.status = NodeStatus.IDLE
         self.fut = None
+        self.dirty = False
+
+    def halt_node(self) -> None:
+        """
+        Cancel the node's future, if it has not started running, and 
+        reset the node. A callback that is already running cannot be 
+        interrupted; its result is discarded.
+        """
+        if self.fut is not None:
+            self.fut.cancel()
+        self.reset()
+
+    def _on_done(self, fut : futures.Future) -> None:
+        # Ignore futures that were cancelled or abandoned by a reset.
+        if fut is self.fut and not fut.cancelled() and fut.exception() is None:
+            self.set_status(fut.result())
 
     def tick(self) -> NodeStatus:
         """
         Asynchronously execute this node's callback.
 
+        If an enclosing `Timeout` has published a deadline that passes
+        while the callback is pending, the future is cancelled and the 
+        node returns `FAILURE`.
+
         Returns:
             `NodeStatus`: The status contained in the node's future, or
             `RUNNING` if the node is not yet done.
         """
         if self.fut is None:
-            self.fut = self.tree.executor.submit(self.cb)
-
-        self.fut.add_done_callback(lambda f: self.set_status(f.result()))
+            self.fut = self.tree.submit(self, self.cb)
+            self.fut.add_done_callback(self._on_done)
 
         if self.fut.done():
-            old_status = self.status
+            # read the result directly: the done callback may not have run
+            # yet on the worker thread.
+            if self.fut.exception() is None:
+                status = self.fut.result()
+            else:
+                print(f"Exception in node {self.name}:")
+                print("".join(traceback.format_exception(self.fut.exception())))
+                status = NodeStatus.FAILURE
             self.reset()
-            return old_status
-        else:
-            return NodeStatus.RUNNING
+            return status
+
+        remaining = self.time_remaining()
+        if remaining is not None and remaining <= 0:
+            self.halt_node()
+            return NodeStatus.FAILURE
+
+        return NodeStatus.RUNNING
@@ -245,7 +245,22 @@ class CausalLMAction(ActionNode):
 
             input_ids = self.tokenizer(input_text, return_tensors="pt").to(self.model.device)
             
-            generated_ids = self.model.generate(**input_ids, max_new_tokens=self.max_new_tokens, pad_token_id=self.tokenizer.pad_token_id, do_sample=self.do_sample, top_p=self.top_p)
+            # Stop generating at the deadline of an enclosing Timeout.
+            gen_kwargs = {}
+            remaining = self.time_remaining()
+            if remaining is not None:
+                if remaining <= 0:
+                    return NodeStatus.FAILURE
+                gen_kwargs["max_time"] = remaining
+
+            generated_ids = self.model.generate(**input_ids, max_new_tokens=self.max_new_tokens, pad_token_id=self.tokenizer.pad_token_id, do_sample=self.do_sample, top_p=self.top_p, **gen_kwargs)
+
+            if remaining is not None and self.time_remaining() <= 0:
+                return NodeStatus.FAILURE
+
+            if self.tracer is not None:
+                n_in = input_ids["input_ids"].shape[-1]
+                self.tracer.record_tokens(self, n_in, generated_ids.shape[-1] - n_in)
 
             output_text = self.tokenizer.batch_decode(generated_ids, skip_special_tokens=True, clean_up_tokenization_spaces=False)[0]
 
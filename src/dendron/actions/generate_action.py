@@ -51,7 +51,8 @@ class GenerateAction(ActionNode):
 
     def set_tree(self, tree : BehaviorTree) -> None:
         self.tree = tree
-        self.set_blackboard(tree.blackboard)
+        if self.blackboard is None:
+            self.set_blackboard(tree.blackboard)
         tree.add_model(self.model_config)
 
     def set_model(self, new_model) -> None:
@@ -120,13 +121,27 @@ class GenerateAction(ActionNode):
             if self.input_processor:
                 input_text = self.input_processor(input_text)
 
-            output_text = self.tree.get_model(self.model_config.model_name).generate_until(
-                [(input_text, 
-                  {'max_new_tokens': self.max_new_tokens, 
-                   "temperature": self.temperature, 
-                   "do_sample": self.do_sample
-                  })], 
-                disable_tqdm=True)[0]
+            gen_kwargs = {
+                'max_new_tokens': self.max_new_tokens, 
+                "temperature": self.temperature, 
+                "do_sample": self.do_sample
+            }
+
+            # Stop generating at the deadline of an enclosing Timeout.
+            remaining = self.time_remaining()
+            if remaining is not None:
+                if remaining <= 0:
+                    return NodeStatus.FAILURE
+                gen_kwargs["max_time"] = remaining
+
+            model = self.tree.get_model(self.model_config.model_name)
+            output_text = model.generate_until([(input_text, gen_kwargs)], disable_tqdm=True)[0]
+
+            if self.tracer is not None and self.tracer.wants_tokens:
+                self.tracer.record_tokens(self, len(model.tok_encode(input_text)), len(model.tok_encode(output_text)))
+
+            if remaining is not None and self.time_remaining() <= 0:
+                return NodeStatus.FAILURE
 
             if self.output_processor:
                 output_text = self.output_processor(output_text)
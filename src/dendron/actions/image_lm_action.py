@@ -261,7 +261,22 @@ class ImageLMAction(ActionNode):
                 input_text, input_image = self.input_processor(input_text, input_image)
 
             input_ids = self.processor(text=input_text, images=input_image, return_tensors="pt").to(self.model.device, self.torch_dtype)
-            generated_ids = self.model.generate(**input_ids, max_new_tokens=self.max_new_tokens, do_sample=self.do_sample, top_p=self.top_p)
+            # Stop generating at the deadline of an enclosing Timeout.
+            gen_kwargs = {}
+            remaining = self.time_remaining()
+            if remaining is not None:
+                if remaining <= 0:
+                    return NodeStatus.FAILURE
+                gen_kwargs["max_time"] = remaining
+
+            generated_ids = self.model.generate(**input_ids, max_new_tokens=self.max_new_tokens, do_sample=self.do_sample, top_p=self.top_p, **gen_kwargs)
+
+            if remaining is not None and self.time_remaining() <= 0:
+                return NodeStatus.FAILURE
+
+            if self.tracer is not None:
+                n_in = input_ids["input_ids"].shape[-1]
+                self.tracer.record_tokens(self, n_in, generated_ids.shape[-1] - n_in)
             output_text = self.processor.batch_decode(generated_ids, skip_special_tokens=True, clean_up_tokenization_spaces=False)[0]
 
             if self.output_processor:
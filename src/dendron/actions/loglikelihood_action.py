@@ -91,11 +91,21 @@ class LogLikelihoodAction(ActionNode):
             if self.input_processor:
                 prompt, completions = self.input_processor(prompt, completions)
             
-            # Create iterator of (prompt, completion) pairs
-            prompt_completion_pairs = ((prompt, completion) for completion in completions)
-            
+            # Create list of (prompt, completion) pairs
+            prompt_completion_pairs = [(prompt, completion) for completion in completions]
+
+            # Scoring cannot be stopped part way, so only check that the
+            # deadline of an enclosing Timeout has not already passed.
+            remaining = self.time_remaining()
+            if remaining is not None and remaining <= 0:
+                return NodeStatus.FAILURE
+
             # Compute log-likelihoods
-            log_probs = self.tree.get_model(self.model_config.model_name).loglikelihood(prompt_completion_pairs, disable_tqdm=True)
+            model = self.tree.get_model(self.model_config.model_name)
+            log_probs = model.loglikelihood(prompt_completion_pairs, disable_tqdm=True)
+
+            if self.tracer is not None and self.tracer.wants_tokens:
+                self.tracer.record_tokens(self, sum(len(model.tok_encode(p + c)) for p, c in prompt_completion_pairs), 0)
 
             if self.output_processor:
                 log_probs = self.output_processor(log_probs)
@@ -119,5 +129,6 @@ class LogLikelihoodAction(ActionNode):
                 The behavior tree this node belongs to.
         """
         self.tree = tree
-        self.set_blackboard(tree.blackboard)
+        if self.blackboard is None:
+            self.set_blackboard(tree.blackboard)
         tree.add_model(self.model_config)
\ No newline at end of file
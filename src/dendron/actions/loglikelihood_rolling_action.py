@@ -113,7 +113,17 @@ class LogLikelihoodRollingAction(ActionNode):
             if self.input_processor:
                 input_text = self.input_processor(input_text)
             
-            output_probs = self.tree.get_model(self.model_config.model_name).loglikelihood_rolling([input_text], disable_tqdm=True)[0]
+            # Scoring cannot be stopped part way, so only check that the
+            # deadline of an enclosing Timeout has not already passed.
+            remaining = self.time_remaining()
+            if remaining is not None and remaining <= 0:
+                return NodeStatus.FAILURE
+
+            model = self.tree.get_model(self.model_config.model_name)
+            output_probs = model.loglikelihood_rolling([input_text], disable_tqdm=True)[0]
+
+            if self.tracer is not None and self.tracer.wants_tokens:
+                self.tracer.record_tokens(self, len(model.tok_encode(input_text)), 0)
 
             if self.output_processor:
                 output_probs = self.output_processor(output_probs)
@@ -137,5 +147,6 @@ class LogLikelihoodRollingAction(ActionNode):
                 The behavior tree this node belongs to.
         """
         self.tree = tree
-        self.set_blackboard(tree.blackboard)
+        if self.blackboard is None:
+            self.set_blackboard(tree.blackboard)
         tree.add_model(self.model_config)
\ No newline at end of file
@@ -1,15 +1,34 @@
 from .basic_types import NodeType, NodeStatus, ModelConfig
 from .tree_node import TreeNode
+from .control_node import ControlNode
+from .decorator_node import DecoratorNode
 from .blackboard import Blackboard 
+from .dataflow import DataflowAnalysis
+from .naming import NameScope
+from .timers import TreeTimer
+from .rate_driver import RateDriver
+from .instrumentation.tracer import Tracer, TracerGroup
+from .instrumentation.node_stats import NodeStatsCollector
 
 from hflm import LM, HFLM
 
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Dict, Iterator, List
 
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import threading
 
 from concurrent import futures
 
+class _DeferredQueueHandler(QueueHandler):
+    """
+    A `QueueHandler` that enqueues records as they are, leaving message
+    formatting to the listener thread.
+    """
+    def prepare(self, record : logging.LogRecord) -> logging.LogRecord:
+        return record
+
 class BehaviorTree:
     """
     A `BehaviorTree` instance is a container for the nodes that make
@@ -36,14 +55,28 @@ class BehaviorTree:
             self.blackboard = Blackboard()
         else:
             self.blackboard = bb
-        
-        if self.root is not None:
-            self.root.set_blackboard(self.blackboard)
-            self.root.set_tree(self)
 
+        # Node names are unique within a tree. The indexes below are
+        # over the nodes of this tree. Paths are the names of the nodes 
+        # from the root down, separated by "/". 
+        self.names = NameScope()
+        self.nodes_by_name = {}
+        self.nodes_by_path = {}
+        self.nodes_by_type = {}
+        self.node_paths = {}
+        self.next_node_id = 0
+
+        # Tracers observing this tree, and the single object that nodes
+        # report to: None, one tracer, or a TracerGroup.
+        self.tracers = []
+        self.node_tracer = None
+        self.node_stats = None
+        
         self.num_workers = num_workers
         self.logger = None
         self.log_file_name = None
+        self.log_queue = None
+        self.log_listener = None
 
         # Mapping from model names to config objects.
         self.model_configs = {}
@@ -53,6 +86,31 @@ class BehaviorTree:
 
         self.executor = futures.ThreadPoolExecutor(max_workers=num_workers)
 
+        # Jobs submitted by nodes that have not finished yet, those of them
+        # still waiting for a worker, and an event set whenever one 
+        # finishes, so that a waiting tick loop wakes up.
+        self.n_pending_jobs = 0
+        self.n_queued_jobs = 0
+        self._jobs_lock = threading.Lock()
+        self._job_done = threading.Event()
+
+        # Timers scheduled by nodes. Due timers run at the start of a tick.
+        self.timer = TreeTimer()
+
+        # Deadlines published by Timeout nodes for the subtree they are 
+        # ticking, on the timer's clock. Each entry is the earliest of the
+        # deadlines enclosing it, so the last entry is the one in force.
+        # Each thread that ticks nodes (see `Sequence`'s parallel mode)
+        # has its own stack.
+        self._thread_state = threading.local()
+
+        # Attach the root last: nodes that use a model register it with
+        # the tree from set_tree, which needs the registries above.
+        if self.root is not None:
+            self.root.set_blackboard(self.blackboard)
+            self.root.set_tree(self)
+            self.index_subtree(self.root)
+
     def get_config(self, model_name : str) -> Optional[ModelConfig]:
         if model_name in self.model_configs:
             return self.model_configs[model_name]
@@ -67,31 +125,75 @@ class BehaviorTree:
         
     def add_model(self, model_config : ModelConfig) -> None:
         """
-        Add a model to the behavior tree's model registry.
+        Add a model to the behavior tree's model registry. If the registry
+        already has a model with the same name, that model is used and 
+        nothing is loaded.
         
         Args:
             model_config (ModelConfig):
                 Configuration object containing model parameters
         """
-        if model_config.model_name not in self.model_configs:
-            name = model_config.model_name
+        name = model_config.model_name
+        if name in self.models:
+            # already loaded, or supplied with set_model.
+            self.model_configs.setdefault(name, model_config)
+        else:
             self.model_configs[name] = model_config
+            # HFLM forwards unrecognized keyword arguments to 
+            # from_pretrained, so only pass quantization flags that are set.
+            quantization = {}
+            if model_config.load_in_4bit:
+                quantization["load_in_4bit"] = True
+            if model_config.load_in_8bit:
+                quantization["load_in_8bit"] = True
             self.models[name] = HFLM(
                 model=model_config.model,
                 device=model_config.device,
                 parallelize=model_config.parallelize,
-                load_in_4bit=model_config.load_in_4bit,
-                load_in_8bit=model_config.load_in_8bit
+                **quantization
             )
 
+    def set_model(self, model_name : str, model : LM, model_config : Optional[ModelConfig] = None) -> None:
+        """
+        Put a model that has already been created into the behavior tree's
+        model registry under `model_name`. Nodes whose configuration names
+        that model use it instead of loading their own, so this must be
+        called before those nodes are added to the tree. Any object with
+        the `hflm.LM` interface works, such as a `dendron.replay_lm.ReplayLM`.
+
+        Args:
+            model_name (`str`):
+                The name that nodes use for the model.
+            model (`hflm.LM`):
+                The model.
+            model_config (`Optional[ModelConfig]`):
+                An optional configuration object to return from 
+                `get_config`.
+        """
+        self.models[model_name] = model
+        if model_config is not None:
+            self.model_configs[model_name] = model_config
+        else:
+            self.model_configs.pop(model_name, None)
+
     def __getstate__(self):
         state = self.__dict__.copy()
         del state['executor']
+        del state['_jobs_lock']
+        del state['_job_done']
+        del state['_thread_state']
+        state['n_pending_jobs'] = 0
+        state['n_queued_jobs'] = 0
+        state['log_queue'] = None
+        state['log_listener'] = None
         return state
     
     def __setstate__(self, state):
         self.__dict__.update(state)
         self.executor = futures.ThreadPoolExecutor(max_workers=self.num_workers)
+        self._jobs_lock = threading.Lock()
+        self._job_done = threading.Event()
+        self._thread_state = threading.local()
 
     def __del__(self):
         self.disable_logging()
@@ -100,32 +202,51 @@ class BehaviorTree:
         """
         Turn on logging for every node in this tree. By default,
         each `tick()` call in every node results in a logging event.
+
+        Nodes only hand their log records to a queue. The records are
+        formatted and written by a background thread, so writing the log
+        (for example to a file set with `set_log_filename`) never blocks
+        the thread that is ticking the tree.
         """
         if self.logger is None:
             self.logger = logging.getLogger(self.tree_name)
             self.logger.setLevel(logging.DEBUG)
-            handler = logging.StreamHandler()
-            handler.setLevel(logging.DEBUG)
-            formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
+            self.log_queue = queue.SimpleQueue()
+            self.logger.addHandler(_DeferredQueueHandler(self.log_queue))
+            self._start_log_listener(logging.StreamHandler())
 
             if self.root is not None:
                 self.root.set_logger(self.logger)
 
     def disable_logging(self) -> None:
         """
-        Turn logging off. 
+        Turn logging off. Records that are still queued are written
+        before this method returns.
         """
         if self.logger is not None:
-            for h in self.logger.handlers:
+            for h in list(self.logger.handlers):
                 h.close()
                 self.logger.removeHandler(h)
+        self._stop_log_listener()
         self.logger = None
         self.log_file_name = None
         if self.root is not None:
             self.root.set_logger(None)
 
+    def _start_log_listener(self, handler : logging.Handler) -> None:
+        handler.setLevel(self.logger.level)
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+        self.log_listener = QueueListener(self.log_queue, handler, respect_handler_level=True)
+        self.log_listener.start()
+
+    def _stop_log_listener(self) -> None:
+        listener = getattr(self, "log_listener", None)
+        if listener is not None:
+            listener.stop()
+            for h in listener.handlers:
+                h.close()
+        self.log_listener = None
+
     def set_log_level(self, log_level) -> None:
         """
         Set the log level for the tree. This is a no-op if logging
@@ -154,6 +275,9 @@ class BehaviorTree:
             self.logger.setLevel(level_to_set)
             for h in self.logger.handlers:
                 h.setLevel(level_to_set)
+            if self.log_listener is not None:
+                for h in self.log_listener.handlers:
+                    h.setLevel(level_to_set)
 
             if self.root is not None:
                 self.root.set_log_level(level_to_set)
@@ -173,23 +297,13 @@ class BehaviorTree:
                 with that name.
         """
         if self.logger is not None:
-            for h in self.logger.handlers:
-                h.close()
-                self.logger.removeHandler(h)
-            
-            log_level = self.logger.level
-            f = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")            
+            self._stop_log_listener()
 
             if filename is None:
-                handler = logging.StreamHandler()
-                handler.setLevel(log_level)
-                handler.setFormatter(f)
-                self.logger.addHandler(handler)
+                self._start_log_listener(logging.StreamHandler())
             else:
-                handler = logging.FileHandler(filename)
-                handler.setLevel(log_level)
-                handler.setFormatter(f)
-                self.logger.addHandler(handler)                
+                self._start_log_listener(logging.FileHandler(filename))
+            self.log_file_name = filename
 
     def set_root(self, new_root : TreeNode) -> None:
         """
@@ -199,13 +313,269 @@ class BehaviorTree:
             new_root (`dendron.tree_node.TreeNode`):
                 The new root node.
         """
+        if self.root is not None:
+            self.unindex_subtree(self.root)
+
         self.root = new_root
 
         if self.logger is not None:
             self.root.set_logger(self.logger)
             self.root.set_log_level(self.logger.level)
 
+        new_root.set_blackboard(self.blackboard)
         new_root.set_tree(self)
+        self.index_subtree(new_root)
+
+    def attach_subtree(self, node : TreeNode, parent : TreeNode) -> None:
+        """
+        Bring a node that was just added below `parent` into this tree.
+        The node and its descendants are given this tree, the parent's 
+        blackboard, and the tree's logger if there is one, and are added 
+        to the node indexes. 
+        
+        Called by `ControlNode.add_child`, `ControlNode.add_children` and
+        `DecoratorNode.set_child`; there is usually no need to call it 
+        directly.
+
+        Args:
+            node (`dendron.tree_node.TreeNode`):
+                The newly added node.
+            parent (`dendron.tree_node.TreeNode`):
+                The node in this tree that `node` was added to.
+        """
+        if self.logger is not None:
+            node.set_logger(self.logger)
+            node.set_log_level(self.logger.level)
+
+        # the node takes its parent's blackboard, which may be a view (see
+        # `dendron.decorators.SubTree`).
+        node.set_blackboard(parent.blackboard if parent.blackboard is not None else self.blackboard)
+        node.set_tree(self)
+        self.index_subtree(node, parent)
+
+    def index_subtree(self, node : TreeNode, parent : Optional[TreeNode] = None) -> None:
+        """
+        Add `node` and all of its descendants to the node indexes. Each
+        node claims its name in the tree's `NameScope`, so a node whose
+        name is already used in this tree is renamed with a numeric 
+        suffix.
+
+        Args:
+            node (`dendron.tree_node.TreeNode`):
+                The root of the subtree to index.
+            parent (`Optional[TreeNode]`):
+                The parent of `node`, which must already be indexed. `None`
+                if `node` is the root of the tree.
+        """
+        prefix = "" if parent is None else self.node_paths[parent] + "/"
+        self._index_from(node, prefix)
+
+    def _index_from(self, node : TreeNode, prefix : str) -> None:
+        stack = [(node, prefix)]
+        while stack:
+            current, prefix = stack.pop()
+            current._name = self.names.claim(current.name)
+            path = prefix + current.name
+            self.node_paths[current] = path
+            self.nodes_by_path[path] = current
+            self.nodes_by_name[current.name] = current
+            self.nodes_by_type.setdefault(current.node_type(), {})[current] = None
+
+            current.node_id = self.next_node_id
+            self.next_node_id += 1
+            current.tracer = self.node_tracer
+            if self.node_tracer is not None:
+                self.node_tracer.register_node(current, path)
+
+            for child in reversed(BehaviorTree._child_nodes(current)):
+                stack.append((child, path + "/"))
+
+    def unindex_subtree(self, node : TreeNode) -> None:
+        """
+        Remove `node` and all of its descendants from the node indexes,
+        and release their names.
+
+        Args:
+            node (`dendron.tree_node.TreeNode`):
+                The root of the subtree to remove.
+        """
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            path = self.node_paths.pop(current, None)
+            if path is None:
+                continue
+            del self.nodes_by_path[path]
+            del self.nodes_by_name[current.name]
+            self.names.release(current.name)
+            del self.nodes_by_type[current.node_type()][current]
+            current.node_id = None
+            current.tracer = None
+
+            stack.extend(BehaviorTree._child_nodes(current))
+
+    def submit(self, node : TreeNode, fn : Callable, *args, **kwargs) -> futures.Future:
+        """
+        Run `fn(*args, **kwargs)` on this tree's executor on behalf of 
+        `node`. Nodes should use this rather than `executor.submit` so
+        that attached tracers can observe the job.
+
+        Args:
+            node (`dendron.tree_node.TreeNode`):
+                The node submitting the job.
+            fn (`Callable`):
+                The function to run.
+
+        Returns:
+            `concurrent.futures.Future`: The future for the job.
+        """
+        if self.node_tracer is not None:
+            fn = self.node_tracer.wrap_job(node, fn)
+        with self._jobs_lock:
+            self.n_pending_jobs += 1
+            self.n_queued_jobs += 1
+        fut = self.executor.submit(self._run_job, fn, args, kwargs)
+        fut.add_done_callback(self._on_job_done)
+        return fut
+
+    def _run_job(self, fn : Callable, args : tuple, kwargs : dict):
+        with self._jobs_lock:
+            self.n_queued_jobs -= 1
+        return fn(*args, **kwargs)
+
+    def _on_job_done(self, fut : futures.Future) -> None:
+        with self._jobs_lock:
+            self.n_pending_jobs -= 1
+            # a cancelled job never reached a worker.
+            if fut.cancelled():
+                self.n_queued_jobs -= 1
+        self._job_done.set()
+
+    def wait(self, max_wait : Optional[float] = None) -> None:
+        """
+        Block until there may be something new for the tree to do: a 
+        timer comes due, or a job submitted by a node finishes. Returns
+        immediately if a job has finished since the last tick, or if 
+        there are neither timers nor jobs to wait for.
+
+        Args:
+            max_wait (`Optional[float]`):
+                The longest time to wait, in seconds. Defaults to no limit.
+        """
+        timeout = max_wait
+        next_deadline = self.timer.next_deadline()
+        if next_deadline is not None:
+            until_timer = max(0.0, next_deadline - self.timer.now())
+            timeout = until_timer if timeout is None else min(timeout, until_timer)
+        elif self.n_pending_jobs == 0:
+            return
+        self._job_done.wait(timeout)
+
+    def add_tracer(self, tracer : Tracer) -> None:
+        """
+        Attach a tracer to this tree. The tracer is told about every node
+        in the tree, and from then on observes every tick.
+
+        Args:
+            tracer (`dendron.instrumentation.Tracer`):
+                The tracer to attach.
+        """
+        self.tracers.append(tracer)
+        self._update_node_tracer()
+        for node, path in self.node_paths.items():
+            tracer.register_node(node, path)
+
+    def remove_tracer(self, tracer : Tracer) -> None:
+        """
+        Detach a tracer from this tree.
+
+        Args:
+            tracer (`dendron.instrumentation.Tracer`):
+                A tracer previously passed to `add_tracer`.
+        """
+        self.tracers.remove(tracer)
+        self._update_node_tracer()
+
+    def enable_stats(self) -> None:
+        """
+        Start collecting per-node statistics: a latency histogram of every
+        node's ticks, how often it returned each status, and the tokens 
+        used by language model nodes. Does nothing if statistics are 
+        already being collected. See `stats`.
+        """
+        if self.node_stats is None:
+            self.node_stats = NodeStatsCollector()
+            self.add_tracer(self.node_stats)
+
+    def disable_stats(self) -> None:
+        """
+        Stop collecting per-node statistics and discard the ones collected.
+        """
+        if self.node_stats is not None:
+            self.remove_tracer(self.node_stats)
+            self.node_stats = None
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Get the per-node statistics collected since `enable_stats` was 
+        called. Latencies are in seconds.
+
+        Returns:
+            `Dict[str, dict]`: A map from node path to a dictionary with
+            keys `count`, `p50`, `p95`, `p99`, `max`, `mean`, 
+            `status_counts`, `tokens_in` and `tokens_out`. Empty if 
+            statistics are not enabled.
+        """
+        if self.node_stats is None:
+            return {}
+        return self.node_stats.summary()
+
+    def _update_node_tracer(self) -> None:
+        match len(self.tracers):
+            case 0:
+                self.node_tracer = None
+            case 1:
+                self.node_tracer = self.tracers[0]
+            case _:
+                self.node_tracer = TracerGroup(self.tracers)
+        for node in self.node_paths:
+            node.tracer = self.node_tracer
+
+    def rename_node(self, node : TreeNode, new_name : str) -> str:
+        """
+        Give a node of this tree a new name, keeping names unique and the
+        node indexes up to date. This is called when a node's `name` is
+        assigned, so there is usually no need to call it directly.
+
+        Args:
+            node (`dendron.tree_node.TreeNode`):
+                The node to rename.
+            new_name (`str`):
+                The requested name.
+
+        Returns:
+            `str`: The name the node should use. This differs from 
+            `new_name` if that name is already in use in this tree.
+        """
+        path = self.node_paths.get(node)
+        if path is None:
+            return new_name
+
+        # The paths of all descendants change, so re-index the subtree.
+        prefix = path[:len(path) - len(node.name)]
+        self.unindex_subtree(node)
+        node._name = new_name
+        self._index_from(node, prefix)
+        return node.name
+
+    @staticmethod
+    def _child_nodes(node : TreeNode) -> List[TreeNode]:
+        if isinstance(node, ControlNode):
+            return node.children
+        elif isinstance(node, DecoratorNode):
+            return [] if node.child_node is None else [node.child_node]
+        else:
+            return []
 
     def status(self) -> Optional[NodeStatus]:
         """
@@ -246,8 +616,8 @@ class BehaviorTree:
 
     def get_node_by_name(self, name : str) -> Optional[TreeNode]:
         """
-        Search for a node by its name. Forwards the call to the current
-        root node.
+        Look up a node by its name. This is a constant-time lookup in the
+        tree's name index.
 
         Args:
             name (`str`):
@@ -257,44 +627,210 @@ class BehaviorTree:
             `Optional[TreeNode]`: Either a node with the given name,
             or None.
         """
-        if self.root is not None:
-            return self.root.get_node_by_name(name)
-        else:
+        return self.nodes_by_name.get(name)
+
+    def get_node_by_path(self, path : str) -> Optional[TreeNode]:
+        """
+        Look up a node by its path. A path is the list of node names from
+        the root of the tree down to the node, separated by "/".
+
+        Args:
+            path (`str`):
+                The path of the node we are looking for.
+
+        Returns:
+            `Optional[TreeNode]`: Either the node at the given path, or
+            None.
+        """
+        return self.nodes_by_path.get(path)
+
+    def get_node_path(self, node : TreeNode) -> Optional[str]:
+        """
+        Get the path of a node in this tree.
+
+        Args:
+            node (`dendron.tree_node.TreeNode`):
+                A node in this tree.
+
+        Returns:
+            `Optional[str]`: The path of the node, or None if the node is
+            not part of this tree.
+        """
+        return self.node_paths.get(node)
+
+    def nodes_of_type(self, node_type : NodeType) -> Iterator[TreeNode]:
+        """
+        Iterate over the nodes of this tree that have a given type.
+
+        Args:
+            node_type (`dendron.basic_types.NodeType`):
+                The type of node we want.
+
+        Returns:
+            `Iterator[TreeNode]`: An iterator over the matching nodes.
+        """
+        return iter(self.nodes_by_type.get(node_type, {}))
+
+    def dataflow(self) -> DataflowAnalysis:
+        """
+        Analyze which blackboard keys the nodes of this tree read and
+        write, and how the nodes depend on each other through them.
+
+        Returns:
+            `dendron.dataflow.DataflowAnalysis`: The analysis of the tree
+            as it is now.
+        """
+        return DataflowAnalysis(self.root)
+
+    @property
+    def deadlines(self) -> List[float]:
+        """
+        The stack of deadlines published for the calling thread, latest
+        last.
+        """
+        state = self._thread_state
+        try:
+            return state.deadlines
+        except AttributeError:
+            state.deadlines = []
+            return state.deadlines
+
+    def push_deadline(self, deadline : float) -> None:
+        """
+        Publish a deadline for the nodes ticked until the matching
+        `pop_deadline`. Deadlines nest: a deadline later than one already
+        in force does not extend it.
+
+        Args:
+            deadline (`float`):
+                The deadline, on the clock of `BehaviorTree.timer`.
+        """
+        if self.deadlines:
+            deadline = min(deadline, self.deadlines[-1])
+        self.deadlines.append(deadline)
+
+    def pop_deadline(self) -> None:
+        """
+        Withdraw the deadline published by the last `push_deadline`.
+        """
+        self.deadlines.pop()
+
+    def deadline(self) -> Optional[float]:
+        """
+        Get the deadline in force for the node being ticked.
+
+        Returns:
+            `Optional[float]`: The deadline, on the clock of 
+            `BehaviorTree.timer`, or `None` if there is no deadline.
+        """
+        return self.deadlines[-1] if self.deadlines else None
+
+    def time_remaining(self) -> Optional[float]:
+        """
+        Get the time left before the deadline in force.
+
+        Returns:
+            `Optional[float]`: The time left in seconds, which is negative
+            if the deadline has passed, or `None` if there is no deadline.
+        """
+        if not self.deadlines:
             return None
+        return self.deadlines[-1] - self.timer.now()
 
     def tick_once(self) -> Optional[NodeStatus]:
         """
         Instruct the root of the tree to execute its `tick()` function.
         
-        This is the primary interface to run a `BehaviorTree`.
+        This is the primary interface to run a `BehaviorTree`. Node 
+        timers that have come due are run first (see `TreeTimer`).
 
         Returns:
             `NodeStatus`: The status returned by the root.
         """
-        if self.root is not None:
-            return self.root.execute_tick()
-        else:
+        if self.root is None:
             return None
 
-    def tick_while_running(self) -> Optional[NodeStatus]:
+        self._job_done.clear()
+        self.timer.run_due()
+
+        tracer = self.node_tracer
+        if tracer is not None:
+            tracer.begin_tick()
+
+        status = self.root.execute_tick()
+
+        if tracer is not None:
+            tracer.end_tick(status)
+
+        return status
+
+    def tick_while_running(self, max_wait : Optional[float] = None) -> Optional[NodeStatus]:
         """
         Repeatedly `tick()` the behavior tree as long as the status
         returned by the root is `RUNNING`. 
 
-        At present, this is only possible if the tree contains one or
-        more asynchronous nodes.
+        Between ticks, the tree sleeps until the next timer comes due or
+        an asynchronous job finishes (see `wait`), rather than spinning.
+        A tree that is running with neither timers nor jobs pending, such
+        as one with a node that polls, is ticked again immediately. Set
+        `max_wait` to also poll such nodes while timers or jobs are 
+        pending.
+
+        Args:
+            max_wait (`Optional[float]`):
+                The longest time to sleep between ticks, in seconds. 
+                Defaults to no limit.
 
         Returns:
             `NodeStatus`: The status ultimately returned by the root.
         """
         if self.root is not None:
-            status = self.root.execute_tick()
+            status = self.tick_once()
             while status == NodeStatus.RUNNING:
-                status = self.root.execute_tick()
+                self.wait(max_wait)
+                status = self.tick_once()
             return status
         else:
             return None
 
+    def tick_at_rate(self, hz : float, policy : str = "skip", max_ticks : Optional[int] = None, stop_when_done : bool = False, spin : float = 0.0, thread : bool = False) -> RateDriver:
+        """
+        Tick the tree at a fixed rate, such as 50 Hz for a control loop,
+        with drift-free scheduling on a monotonic clock. See `RateDriver`
+        for the handling of ticks that overrun their period.
+
+        Args:
+            hz (`float`):
+                The tick rate, in ticks per second.
+            policy (`str`):
+                What to do about scheduled ticks missed by an overrun:
+                "skip" them or "catch_up" by ticking back to back. 
+                Defaults to "skip".
+            max_ticks (`Optional[int]`):
+                Stop after this many ticks. Defaults to no limit.
+            stop_when_done (`bool`):
+                Stop once the root returns a status other than `RUNNING`.
+                Defaults to `False`.
+            spin (`float`):
+                The time, in seconds, to busy-wait before each tick for 
+                lower jitter. Defaults to 0.
+            thread (`bool`):
+                If `True`, run the loop on a dedicated daemon thread and 
+                return at once; use `RateDriver.stop` to stop it. 
+                Otherwise run the loop on the calling thread until it
+                stops. Defaults to `False`.
+
+        Returns:
+            `dendron.rate_driver.RateDriver`: The driver, whose `stats`
+            hold the jitter, duration and overrun statistics of the loop.
+        """
+        driver = RateDriver(self, hz, policy=policy, max_ticks=max_ticks, stop_when_done=stop_when_done, spin=spin)
+        if thread:
+            driver.start()
+        else:
+            driver.run()
+        return driver
+
     def pretty_print(self) -> None:
         """
         Print an indented version of this tree to the command line. 
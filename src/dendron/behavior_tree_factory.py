@@ -12,16 +12,17 @@ from .actions import (
     ImageLMAction, 
     PipelineAction
 )
-from .decorators import Inverter
+from .decorators import Inverter, SubTree
 from .conditions import SimpleCondition
 from .blackboard import Blackboard
 from .behavior_tree import BehaviorTree
 from .basic_types import NodeType
 from .tree_node import TreeNode
-from .xml_utilities import cycle_free, get_parse_order
+from .xml_utilities import SubtreeGraph
 
 import xml.etree.ElementTree as ET 
 from copy import deepcopy
+from typing import List
 
 class BehaviorTreeFactory:
     """
@@ -168,11 +169,28 @@ class BehaviorTreeFactory:
         self.node_counts[name] = 0
         self.node_types[name] = NodeType.CONDITION
 
+
     def create_from_groot(self, xml_filename : str) -> BehaviorTree:
         """
         Create a `BehaviorTree` instance from an XML file generated by the 
         open-source Groot2 program.
 
+        The file is streamed with `iterparse` rather than loaded as a 
+        whole document. Nodes are built bottom-up using an explicit stack,
+        and each XML element is released as soon as its node has been 
+        built, so the memory used by the parser is proportional to the 
+        depth of the tree rather than the size of the file, and very deep
+        trees do not run into Python's recursion limit.
+
+        `SubTree` references are resolved once the whole file has been 
+        read, so a tree may refer to trees that are defined later in the
+        file. Port attributes of a `SubTree` element bind the subtree's 
+        keys without copying values: `port="{parent_key}"` remaps the 
+        subtree key `port` to `parent_key`, and `port="text"` binds it to
+        a constant (see `dendron.decorators.SubTree`). Other keys of the
+        subtree are shared with the parent, as with Groot's 
+        `_autoremap="true"`.
+
         Args:
             xml_filename (`str`):
                 The name of the file containing the XML.
@@ -183,205 +201,186 @@ class BehaviorTreeFactory:
         """
         self.current_blackboard = Blackboard()
 
-        xml_tree = ET.parse(xml_filename)
-        xml_root = xml_tree.getroot()
-
-        if not "BTCPP_format" in xml_root.attrib:
-            raise RuntimeError("XML missing BTCPP_format")
-        if xml_root.attrib["BTCPP_format"] != "4":
-            raise RuntimeError("BTCPP_format must be 4")
-
-        has_main_tree = "main_tree_to_execute" in xml_root.attrib
         main_tree_name = None
-        if has_main_tree:
-            main_tree_name = xml_root.attrib["main_tree_to_execute"]
-        
-        tree_nodes_xml = None
-        behavior_tree_xml = []
-        main_tree = None
-        for child in xml_root:
-            if child.tag == "TreeNodesModel":
-                tree_nodes_xml = child
-            elif child.tag == "BehaviorTree":
-                if "ID" in child.attrib and child.attrib["ID"] == main_tree_name:
-                    main_tree = child
-                else:
-                    behavior_tree_xml.append(child)
-
-        # load TreeNodesModel
-        for child in tree_nodes_xml:
-            match child.tag:
-                case "Action":
-                    self.node_types[child.attrib["ID"]] = NodeType.ACTION
-                case "Condition":
-                    self.node_types[child.attrib["ID"]] = NodeType.CONDITION
-                case "Control":
-                    self.node_types[child.attrib["ID"]] = NodeType.CONTROL
-                case "Decorator":
-                    self.node_types[child.attrib["ID"]] = NodeType.DECORATOR
-
-        if not has_main_tree and len(behavior_tree_xml) > 1:
-            raise RuntimeError("Multiple behavior trees but no main tree.")
-
-        if main_tree is None and len(behavior_tree_xml) == 1:
-            main_tree = behavior_tree_xml[0]
-
-        # load each behavior tree
-        ## convert the other trees
-        parse_order = get_parse_order(xml_root)
-        for tree_name in parse_order:
-            if tree_name == main_tree_name:
+        tree_ids = []
+        roots = {}
+        placeholders = {}
+
+        current_tree = None
+        elements = []
+        frames = []
+
+        for event, elem in ET.iterparse(xml_filename, events=("start", "end")):
+            if event == "start":
+                depth = len(elements)
+                if depth == 0:
+                    if not "BTCPP_format" in elem.attrib:
+                        raise RuntimeError("XML missing BTCPP_format")
+                    if elem.attrib["BTCPP_format"] != "4":
+                        raise RuntimeError("BTCPP_format must be 4")
+                    main_tree_name = elem.attrib.get("main_tree_to_execute")
+                elif depth == 1 and elem.tag == "BehaviorTree":
+                    current_tree = elem.attrib["ID"]
+                    tree_ids.append(current_tree)
+                    placeholders[current_tree] = []
+                elif depth >= 2 and current_tree is not None and elem.tag != "SubTree":
+                    # blackboard writes happen in document order, parents 
+                    # before children.
+                    for key in elem.attrib:
+                        self.current_blackboard[key] = elem.attrib[key]
+
+                elements.append(elem)
+                frames.append([])
                 continue
-            tree = None
-            for child in xml_root:
-                if child.tag != "BehaviorTree":
-                    continue
-                child_name = child.attrib["ID"]
-                if child_name != tree_name:
-                    continue
-                else:
-                    tree = self.parse_behavior_tree_groot(child_name, child)
-                    self.behavior_trees[tree_name] = tree
-
-        # parse the main tree last
-        main_tree = self.parse_behavior_tree_groot(main_tree.attrib["ID"], main_tree)
-        self.behavior_trees[main_tree_name] = main_tree
-
-        return main_tree
-        
-    def parse_behavior_tree_groot(self, tree_name, xml_node) -> BehaviorTree:
-        tree_type = self.node_types[xml_node[0].tag]
-        root_node = None
-        match tree_type:
-            case NodeType.ACTION:
-                root_node = self.parse_action_node_groot(xml_node[0])
-            case NodeType.CONDITION:
-                root_node = self.parse_condition_node_groot(xml_node[0])
-            case NodeType.CONTROL:
-                root_node = self.parse_control_node_groot(xml_node[0])
-            case NodeType.DECORATOR:
-                root_node = self.parse_decorator_node_groot(xml_node[0])
-            case NodeType.SUBTREE:
-                root_node = self.parse_subtree_node_groot(xml_node[0])
-
-        bt = BehaviorTree(tree_name, root_node)
-        return bt
 
-    def parse_action_node_groot(self, xml_node) -> ActionNode:
-        tag = xml_node.tag
-        if not tag in self.registry:
-            raise KeyError(f"Undefined action {tag}.")
-
-        node_id = self.node_counts[tag]
-        node_name = tag + "_" + str(node_id)
-    
-        if self.registry[tag] == SimpleAction:
-            f = self.functors[tag]
-            new_node = self.registry[tag](node_name, f)
-        else:
-            new_node = self.registry[tag](node_name)
-
-        self.node_counts[tag] += 1
-        
-        if xml_node.attrib:
-            for key in xml_node.attrib:
-                self.current_blackboard[key] = xml_node.attrib[key]
-                
-        return new_node
-
-    def parse_condition_node_groot(self, xml_node) -> ConditionNode:
-        tag = xml_node.tag
-        if not tag in self.registry:
-            raise KeyError(f"Undefined condition {tag}.")
-
-        node_id = self.node_counts[tag]
-        node_name = tag + "_" + str(node_id)
-
-        if self.registry[tag] == SimpleCondition:
-            f = self.functors[tag]
-            new_node = self.registry[tag](node_name, f)
-        else:
-            new_node = self.registry[tag](node_name)
-
-        self.node_counts[tag] += 1
-
-        if xml_node.attrib:
-            for key in xml_node.attrib:
-                self.current_blackboard[key] = xml_node.attrib[key]
-
-        return new_node
-
-    def parse_control_node_groot(self, xml_node) -> ControlNode:
-        tag = xml_node.tag
-        if not tag in self.registry:
-            raise KeyError(f"Undefined control {tag}.")
-
-        node_id = self.node_counts[tag]
-        node_name = tag + "_" + str(node_id)
+            elements.pop()
+            children = frames.pop()
+            depth = len(elements)
+            if depth == 0:
+                continue
 
-        self.node_counts[tag] += 1
+            if depth == 1:
+                if elem.tag == "BehaviorTree":
+                    if len(children) != 1:
+                        raise RuntimeError(f"BehaviorTree {current_tree} must have exactly one root node.")
+                    roots[current_tree] = children[0]
+                    current_tree = None
+            elif current_tree is not None:
+                if elem.tag == "SubTree":
+                    new_node = _SubTreePlaceholder(elem.attrib["ID"])
+                    for port, value in elem.attrib.items():
+                        if port in ("ID", "name") or port.startswith("_"):
+                            continue
+                        if value.startswith("{") and value.endswith("}"):
+                            new_node.remapping[port] = value[1:-1]
+                        else:
+                            new_node.values[port] = value
+                    placeholders[current_tree].append(new_node)
+                else:
+                    new_node = self.build_node_groot(elem.tag, children)
+                frames[-1].append(new_node)
+            elif depth == 2 and elements[1].tag == "TreeNodesModel":
+                self.register_node_model_groot(elem)
+
+            # The finished element is always the only remaining child of 
+            # its parent, so this removal is constant time.
+            elem.clear()
+            elements[-1].remove(elem)
+
+        if main_tree_name is None:
+            if len(tree_ids) > 1:
+                raise RuntimeError("Multiple behavior trees but no main tree.")
+            if len(tree_ids) == 1:
+                main_tree_name = tree_ids[0]
+        if main_tree_name not in roots:
+            raise RuntimeError(f"Main tree {main_tree_name} not found.")
+
+        # Resolve SubTree placeholders so that each tree is copied only
+        # after every tree it depends on has been fully resolved.
+        g = SubtreeGraph(tree_ids)
+        for tree_name in tree_ids:
+            for p in placeholders[tree_name]:
+                if p.subtree_id not in roots:
+                    raise KeyError(f"Undefined subtree {p.subtree_id}.")
+                g.set_edge(tree_name, p.subtree_id)
+
+        parse_order = g.topological_sort()
+        if len(parse_order) != len(tree_ids):
+            raise RuntimeError("SubTree references contain a cycle.")
 
-        if xml_node.attrib:
-            for key in xml_node.attrib:
-                self.current_blackboard[key] = xml_node.attrib[key]
+        for tree_name in parse_order:
+            for p in placeholders[tree_name]:
+                # TODO is deepcopy good enough?
+                subtree_root = deepcopy(roots[p.subtree_id])
+                if p.remapping or p.values:
+                    subtree_root = SubTree(f"SubTree_{p.subtree_id}", subtree_root, p.remapping, p.values)
+                if p.parent is None:
+                    roots[tree_name] = subtree_root
+                elif isinstance(p.parent, ControlNode):
+                    p.parent.children[p.index] = subtree_root
+                else:
+                    p.parent.set_child(subtree_root)
 
-        # parse children
-        child_nodes = []
-        for child_xml in xml_node:
-            if not child_xml.tag in self.registry:
-                raise RuntimeError(f"Unregistered node {child_xml.tag}")
+        for tree_name in parse_order:
+            self.behavior_trees[tree_name] = BehaviorTree(tree_name, roots[tree_name], self.current_blackboard)
 
-            match self.node_types[child_xml.tag]:
-                case NodeType.ACTION:
-                    child_node = self.parse_action_node_groot(child_xml)
-                case NodeType.CONDITION:
-                    child_node = self.parse_condition_node_groot(child_xml)
-                case NodeType.CONTROL:
-                    child_node = self.parse_control_node_groot(child_xml)
-                case NodeType.DECORATOR:
-                    child_node = self.parse_decorator_node_groot(child_xml)
-                case NodeType.SUBTREE:
-                    child_node = self.parse_subtree_node_groot(child_xml)
+        return self.behavior_trees[main_tree_name]
 
-            child_nodes.append(child_node)
+    def register_node_model_groot(self, xml_node) -> None:
+        """
+        Record the node type declared by one entry of a Groot 
+        `TreeNodesModel`.
 
-        new_node = self.registry[tag](node_name, child_nodes)
+        Args:
+            xml_node (`xml.etree.ElementTree.Element`):
+                An `Action`, `Condition`, `Control`, or `Decorator` element.
+        """
+        match xml_node.tag:
+            case "Action":
+                self.node_types[xml_node.attrib["ID"]] = NodeType.ACTION
+            case "Condition":
+                self.node_types[xml_node.attrib["ID"]] = NodeType.CONDITION
+            case "Control":
+                self.node_types[xml_node.attrib["ID"]] = NodeType.CONTROL
+            case "Decorator":
+                self.node_types[xml_node.attrib["ID"]] = NodeType.DECORATOR
+
+    def build_node_groot(self, tag : str, children : List[TreeNode]) -> TreeNode:
+        """
+        Build a single node from its Groot tag and its already-built 
+        children.
 
-        return new_node
+        Args:
+            tag (`str`):
+                The XML tag of the node, which must be registered.
+            children (`List[TreeNode]`):
+                The children of the node, in document order. Empty for
+                leaf nodes.
 
-    def parse_decorator_node_groot(self, xml_node) -> DecoratorNode:
-        tag = xml_node.tag
-        if not tag in self.registry:
-            raise KeyError(f"Undefined decorator {tag}.")
+        Returns:
+            `TreeNode`: The new node.
+        """
+        if not tag in self.registry or not tag in self.node_types:
+            raise KeyError(f"Undefined node {tag}.")
 
         node_id = self.node_counts[tag]
         node_name = tag + "_" + str(node_id)
-
         self.node_counts[tag] += 1
 
-        if xml_node.attrib:
-            for key in xml_node.attrib:
-                self.current_blackboard[key] = xml_node.attrib[key]
-
-        child_node = None
-        child_xml = xml_node[0]
-        match self.node_types[child_xml.tag]:
-            case NodeType.ACTION:
-                child_node = self.parse_action_node_groot(child_xml)
-            case NodeType.CONDITION:
-                child_node = self.parse_condition_node_groot(child_xml)
+        match self.node_types[tag]:
+            case NodeType.ACTION | NodeType.CONDITION:
+                if children:
+                    raise RuntimeError(f"Leaf node {tag} can't have children.")
+                if self.registry[tag] == SimpleAction or self.registry[tag] == SimpleCondition:
+                    new_node = self.registry[tag](node_name, self.functors[tag])
+                else:
+                    new_node = self.registry[tag](node_name)
             case NodeType.CONTROL:
-                child_node = self.parse_control_node_groot(child_xml)
+                new_node = self.registry[tag](children=children, name=node_name)
             case NodeType.DECORATOR:
-                child_node = self.parse_decorator_node_groot(child_xml)
-            case NodeType.SUBTREE:
-                child_node = self.parse_subtree_node_groot(child_xml)
+                if len(children) != 1:
+                    raise RuntimeError(f"Decorator {tag} must have exactly one child.")
+                new_node = self.registry[tag](node_name, children[0])
+            case _:
+                raise RuntimeError(f"Can't build node {tag} of type {self.node_types[tag]}.")
 
-        new_node = self.registry[tag](node_name, child_node)
-        return new_node
+        for index, child in enumerate(children):
+            if isinstance(child, _SubTreePlaceholder):
+                child.parent = new_node
+                child.index = index
 
-    def parse_subtree_node_groot(self, xml_node) -> TreeNode:
-        subtree_name = xml_node.attrib["ID"]
+        return new_node
 
-        # TODO is deepcopy good enough?
-        return deepcopy(self.behavior_trees[subtree_name].root)
\ No newline at end of file
+class _SubTreePlaceholder:
+    """
+    Stands in for a `SubTree` element until the tree it refers to has
+    been built. Records where the copied subtree root has to be placed.
+    """
+    __slots__ = ("subtree_id", "parent", "index", "remapping", "values")
+
+    def __init__(self, subtree_id : str) -> None:
+        self.subtree_id = subtree_id
+        self.parent = None
+        self.index = 0
+        self.remapping = {}
+        self.values = {}
@@ -1,7 +1,11 @@
-from dataclasses import dataclass
-from typing import Any, Iterator, Optional, Type
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 from copy import deepcopy
 
+import itertools
+import pickle
+import threading
+
 @dataclass
 class BlackboardEntryMetadata:
     key : str
@@ -20,16 +24,268 @@ class BlackboardEntryMetadata:
         type_field = f"{type_name:{self.print_len}.{self.print_len}}"
         return f"{key_field} | {desc_field} | {type_field}"
 
+@dataclass
+class BlackboardDelta:
+    """
+    The changes made to a blackboard between two versions, as returned by
+    `Blackboard.delta_since` and consumed by `Blackboard.apply_delta`.
+
+    Args:
+        since (`int`):
+            The checkpoint the delta starts from.
+        version (`int`):
+            The version of the blackboard the delta brings a copy up to.
+        values (`Dict[Any, Any]`):
+            The keys written since the checkpoint, with their values.
+        entries (`Dict[Any, Tuple[str, type]]`):
+            The description and type constructor of each written key.
+        deleted (`List[Any]`):
+            The keys deleted since the checkpoint.
+    """
+    since : int
+    version : int
+    values : Dict[Any, Any] = field(default_factory=dict)
+    entries : Dict[Any, Tuple[str, type]] = field(default_factory=dict)
+    deleted : List[Any] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.values) + len(self.deleted)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize this delta compactly, for sending to another process or
+        writing to a log.
+
+        Returns:
+            `bytes`: The serialized delta.
+        """
+        return pickle.dumps((self.since, self.version, self.values, self.entries, self.deleted), protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, data : bytes) -> "BlackboardDelta":
+        """
+        Deserialize a delta written by `to_bytes`.
+
+        Args:
+            data (`bytes`):
+                The serialized delta.
+
+        Returns:
+            `BlackboardDelta`: The delta.
+        """
+        return cls(*pickle.loads(data))
+
 class Blackboard:
     """
     A blackboard for a Behavior Tree. Implements a key-value mapping
     that is accessible by all of the nodes in a behavior tree.
+
+    From its first `checkpoint`, the blackboard keeps a write log: a 
+    version number that counts writes and deletions, and the version of
+    the last change to each key. `delta_since` uses it to find what 
+    changed since a checkpoint, at a cost in proportion to the number of
+    keys changed rather than the size of the blackboard. Only writes through
+    `[]`, `set` and deletions are logged; mutating a value in place is 
+    not a write. Logging a change is atomic, so threads writing different
+    keys at once (as in `Sequence`'s parallel mode) keep the log in
+    version order.
     """
 
     def __init__(self) -> None:
         self.entry_mapping = {}
         self.value_mapping = {}
         self.print_len = 16
+        self._init_log()
+        self._init_slots()
+
+    def _init_slots(self) -> None:
+        # Interned keys: slot i stands for slot_keys[i].
+        self.slot_ids : Dict[Any, int] = {}
+        self.slot_keys : List[Any] = []
+        # interning a new key takes this lock, so that keys interned on
+        # different threads at once get different slots.
+        self._slot_lock = threading.Lock()
+
+    def _init_log(self) -> None:
+        # Keys in the order of their last write (or deletion), with the 
+        # version of that change. The log is off (None) until the first
+        # checkpoint, so blackboards that are never synced pay nothing.
+        self.write_log : Optional[Dict[Any, int]] = None
+        self.delete_log : Dict[Any, int] = {}
+        self.version = 0
+        self._versions = itertools.count(1)
+        # Taking a version and moving the key to the end of the log happen
+        # together, so that the log stays in version order, which
+        # delta_since relies on, even with writers on several threads.
+        self._log_lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_versions", None)
+        state.pop("_log_lock", None)
+        state.pop("_slot_lock", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "version" in state:
+            self._versions = itertools.count(self.version + 1)
+            self._log_lock = threading.Lock()
+        self._slot_lock = threading.Lock()
+
+    def _log_write(self, key : Any) -> None:
+        if self.write_log is None:
+            return
+        with self._log_lock:
+            version = next(self._versions)
+            if self.delete_log:
+                self.delete_log.pop(key, None)
+            log = self.write_log
+            if key in log:
+                del log[key]
+            log[key] = version
+            self.version = version
+
+    def _log_delete(self, key : Any) -> None:
+        if self.write_log is None:
+            return
+        with self._log_lock:
+            version = next(self._versions)
+            self.write_log.pop(key, None)
+            self.delete_log.pop(key, None)
+            self.delete_log[key] = version
+            self.version = version
+
+    def checkpoint(self) -> int:
+        """
+        Get the current version of the blackboard, to pass to 
+        `delta_since` later.
+
+        Returns:
+            `int`: The version.
+        """
+        with self._log_lock:
+            if self.write_log is None:
+                # start logging. Everything written so far predates the 
+                # checkpoint, but still counts as a change since version 0.
+                self.version = next(self._versions)
+                self.write_log = dict.fromkeys(self.value_mapping, self.version)
+            return self.version
+
+    def delta_since(self, checkpoint : int) -> BlackboardDelta:
+        """
+        Collect the keys written or deleted since `checkpoint`.
+
+        Args:
+            checkpoint (`int`):
+                A version returned by `checkpoint`. Use 0 for everything.
+
+        Returns:
+            `BlackboardDelta`: The changes, with the current values of the
+            written keys.
+        """
+        if self.write_log is None:
+            # nothing has been logged: every key is new.
+            delta = BlackboardDelta(checkpoint, self.version)
+            for key in list(self.value_mapping):
+                delta.values[key] = self._raw_value(key)
+                entry = self.entry_mapping[key]
+                delta.entries[key] = (entry.description, entry.type_constructor)
+            return delta
+        # the logs are in order of last change, so stop at the first key
+        # that has not changed since the checkpoint.
+        with self._log_lock:
+            delta = BlackboardDelta(checkpoint, self.version)
+            written = []
+            for key in reversed(self.write_log):
+                if self.write_log[key] <= checkpoint:
+                    break
+                written.append(key)
+            for key in reversed(self.delete_log):
+                if self.delete_log[key] <= checkpoint:
+                    break
+                delta.deleted.append(key)
+        for key in written:
+            delta.values[key] = self._raw_value(key)
+            entry = self.entry_mapping[key]
+            delta.entries[key] = (entry.description, entry.type_constructor)
+        return delta
+
+    def _raw_value(self, key : Any) -> Any:
+        # The stored value, without conversion by the type constructor.
+        return self.value_mapping[key]
+
+    def apply_delta(self, delta : BlackboardDelta) -> None:
+        """
+        Apply the changes in `delta`, typically taken from another 
+        blackboard, to this blackboard, including the metadata of the 
+        written keys. The changes are logged here as ordinary writes and
+        deletions.
+
+        Args:
+            delta (`BlackboardDelta`):
+                The changes to apply.
+        """
+        for key in delta.deleted:
+            if key in self.entry_mapping:
+                del self[key]
+        for key, value in delta.values.items():
+            if key in delta.entries:
+                description, type_constructor = delta.entries[key]
+                self.register_entry(BlackboardEntryMetadata(key, description, type_constructor))
+            self[key] = value
+
+    def slot(self, key : Any) -> int:
+        """
+        Intern `key`, and get the integer slot that stands for it. Nodes
+        that use the same keys on every tick can resolve them to slots
+        once, for instance in `set_blackboard`, and then read and write
+        with `get_slot` and `set_slot`. A key keeps its slot for the life
+        of the blackboard, even if it is deleted and written again.
+
+        Args:
+            key (`Any`):
+                The key. It does not need to be in the blackboard yet.
+
+        Returns:
+            `int`: The slot.
+        """
+        slot = self.slot_ids.get(key)
+        if slot is None:
+            with self._slot_lock:
+                slot = self.slot_ids.get(key)
+                if slot is None:
+                    slot = len(self.slot_keys)
+                    self.slot_keys.append(key)
+                    self.slot_ids[key] = slot
+        return slot
+
+    def get_slot(self, slot : int) -> Any:
+        """
+        Get the value of the key interned as `slot`, as `[]` would. 
+        `dendron.slot_blackboard.SlotBlackboard` serves this by list 
+        indexing; other blackboards look up the key.
+
+        Args:
+            slot (`int`):
+                A slot returned by `slot`.
+
+        Returns:
+            `Any`: The value.
+        """
+        return self[self.slot_keys[slot]]
+
+    def set_slot(self, slot : int, value : Any) -> None:
+        """
+        Set the value of the key interned as `slot`, as `[]` would.
+
+        Args:
+            slot (`int`):
+                A slot returned by `slot`.
+            value (`Any`):
+                The new value.
+        """
+        self[self.slot_keys[slot]] = value
 
     def set_print_len(self, new_len : int) -> None:
         """
@@ -133,6 +389,7 @@ class Blackboard:
         """
         del self.value_mapping[key]
         del self.entry_mapping[key]
+        self._log_delete(key)
 
     def __setitem__(self, key : Any, value : Any) -> None:
         """
@@ -150,6 +407,18 @@ class Blackboard:
             self.register_entry(new_entry)
         self.value_mapping[key] = value 
 
+        # log the write (see _log_write), inline since this is hot.
+        log = self.write_log
+        if log is not None:
+            with self._log_lock:
+                version = next(self._versions)
+                if self.delete_log:
+                    self.delete_log.pop(key, None)
+                if key in log:
+                    del log[key]
+                log[key] = version
+                self.version = version
+
     def set(self, key : Any, value : Any) -> None:
         """
         Add a key-value pair to the blackboard. Wrapper around 
@@ -157,6 +426,28 @@ class Blackboard:
         """
         self.__setitem__(key, value)
 
+    def append(self, key : Any, value : Any, *args) -> None:
+        """
+        Append `value` to the list (or other container with an `append`
+        method, such as a `HistoryBuffer`) stored at `key`. Unlike 
+        appending to the value returned by `[]`, this counts as a write
+        to `key`, so it is seen by `delta_since` and by blackboards that
+        persist or share their values.
+
+        Args:
+            key (`Any`):
+                The key of the list.
+            value (`Any`):
+                The value to append.
+            *args:
+                Further arguments to the container's `append`.
+        """
+        self.value_mapping[key].append(value, *args)
+        self._log_write(key)
+
+    def __contains__(self, key : Any) -> bool:
+        return key in self.value_mapping
+
     def __iter__(self) -> Iterator:
         """
         Get an iterator over key-value pairs.
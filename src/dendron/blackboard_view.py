@@ -0,0 +1,168 @@
+from .blackboard import Blackboard, BlackboardDelta, BlackboardEntryMetadata
+
+from typing import Any, Dict, Iterator, Optional, Tuple, Type
+
+class BlackboardView(Blackboard):
+    """
+    A view of a parent blackboard under different key names, so that one
+    subtree definition can be reused with different inputs and outputs
+    without copying values or blackboards. This is what Groot calls port
+    remapping: the subtree reads and writes its own (local) key names,
+    and the view translates each one to a key of the parent.
+
+    Each key of the view resolves to a key of some blackboard:
+
+    - a key in `remapping` resolves to the parent key it maps to;
+    - a key in `values` holds a constant set when the view is built, and
+      lives in the view's own local blackboard;
+    - any other key resolves to the same key of the parent, or, if the
+      view is `isolated`, to the local blackboard, so that the subtree's
+      scratch keys do not leak into the parent.
+
+    Remapped keys are resolved with one dictionary lookup, also through
+    nested views: a remapping to a key of a parent view is resolved
+    through the parent when the view is built.
+
+    Args:
+        parent (`dendron.blackboard.Blackboard`):
+            The blackboard to view.
+        remapping (`Optional[Dict[Any, Any]]`):
+            A map from keys of the view to keys of the parent.
+        values (`Optional[Dict[Any, Any]]`):
+            Constant values for keys of the view.
+        isolated (`bool`):
+            Whether keys that are not remapped are kept out of the parent.
+            Defaults to `False`.
+        local (`Optional[dendron.blackboard.Blackboard]`):
+            The blackboard for constant and isolated keys. Defaults to a
+            new `Blackboard`.
+    """
+
+    def __init__(self, parent : Blackboard, remapping : Optional[Dict[Any, Any]] = None, values : Optional[Dict[Any, Any]] = None, isolated : bool = False, local : Optional[Blackboard] = None) -> None:
+        self.parent = parent
+        self.isolated = isolated
+        self.local = local if local is not None else Blackboard()
+        self.print_len = parent.print_len
+        self.fallback = self.local if isolated else parent
+        self._init_slots()
+
+        self.routes : Dict[Any, Tuple[Blackboard, Any]] = {}
+        for key, parent_key in (remapping or {}).items():
+            if isinstance(parent, BlackboardView):
+                self.routes[key] = parent._route(parent_key)
+            else:
+                self.routes[key] = (parent, parent_key)
+        for key, value in (values or {}).items():
+            self.routes[key] = (self.local, key)
+            self.local[key] = value
+
+    def _route(self, key : Any) -> Tuple[Blackboard, Any]:
+        route = self.routes.get(key)
+        if route is not None:
+            return route
+        if self.isolated or not isinstance(self.parent, BlackboardView):
+            return self.fallback, key
+        return self.parent._route(key)
+
+    def __getitem__(self, key : Any) -> Any:
+        bb, key = self._route(key)
+        return bb[key]
+
+    def __setitem__(self, key : Any, value : Any) -> None:
+        bb, key = self._route(key)
+        bb[key] = value
+
+    def __delitem__(self, key : Any) -> None:
+        bb, key = self._route(key)
+        del bb[key]
+
+    def __contains__(self, key : Any) -> bool:
+        bb, key = self._route(key)
+        return key in bb
+
+    def append(self, key : Any, value : Any, *args) -> None:
+        bb, key = self._route(key)
+        bb.append(key, value, *args)
+
+    def register_entry(self, entry : BlackboardEntryMetadata) -> None:
+        bb, key = self._route(entry.key)
+        bb.register_entry(BlackboardEntryMetadata(key, entry.description, entry.type_constructor, entry.print_len))
+
+    def get_entry(self, key : Any) -> Any:
+        bb, key = self._route(key)
+        return bb.get_entry(key)
+
+    def set_entry(self, key : Any, description : Optional[str] = None, type_constructor : Optional[Type] = None) -> None:
+        bb, key = self._route(key)
+        bb.set_entry(key, description, type_constructor)
+
+    def checkpoint(self) -> int:
+        """
+        Not supported, and raises a `TypeError`: a view has no write log
+        of its own, since its keys live in several blackboards. Take 
+        checkpoints and deltas of the blackboards it views instead.
+        """
+        raise TypeError("a BlackboardView has no write log; use checkpoint on the blackboards it views")
+
+    def delta_since(self, checkpoint : int) -> BlackboardDelta:
+        """
+        Not supported, and raises a `TypeError`. See `checkpoint`.
+        """
+        raise TypeError("a BlackboardView has no write log; use delta_since on the blackboards it views")
+
+    def apply_delta(self, delta : BlackboardDelta) -> None:
+        """
+        Apply the changes in `delta` to the blackboards the view routes
+        its keys to. Keys of the delta are keys of the view.
+
+        Args:
+            delta (`dendron.blackboard.BlackboardDelta`):
+                The changes to apply.
+        """
+        for key in delta.deleted:
+            bb, bb_key = self._route(key)
+            if bb_key in bb.entry_mapping:
+                del bb[bb_key]
+        for key, value in delta.values.items():
+            if key in delta.entries:
+                description, type_constructor = delta.entries[key]
+                self.register_entry(BlackboardEntryMetadata(key, description, type_constructor))
+            self[key] = value
+
+    def __iter__(self) -> Iterator:
+        """
+        Get an iterator over the keys of the view that hold values: the
+        remapped and constant keys, and the keys of the local blackboard
+        or, if the view is not isolated, of the parent.
+
+        Returns:
+            `Iterator`: The iterator over the keys.
+        """
+        keys = {key : None for key in self.routes if key in self}
+        hidden = {route for route in self.routes.values()}
+        # routes are resolved through parent views, so the keys of a 
+        # parent view are resolved the same way before they are compared.
+        resolve = self.fallback._route if isinstance(self.fallback, BlackboardView) else lambda key: (self.fallback, key)
+        for key in self.fallback:
+            if resolve(key) not in hidden:
+                keys[key] = None
+        return iter(list(keys))
+
+    def __len__(self) -> int:
+        return len(list(iter(self)))
+
+    @property
+    def value_mapping(self) -> Dict[Any, Any]:
+        """
+        A snapshot of every key of the view and its value, as a plain
+        `dict`.
+        """
+        return {key : self[key] for key in self}
+
+    @property
+    def entry_mapping(self) -> Dict[Any, BlackboardEntryMetadata]:
+        """
+        A snapshot of the metadata of every key of the view, as a plain
+        `dict`.
+        """
+        return {key : self.get_entry(key) for key in self}
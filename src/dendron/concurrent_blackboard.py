@@ -0,0 +1,264 @@
+from .blackboard import Blackboard, BlackboardDelta, BlackboardEntryMetadata
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Type
+
+import threading
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "MISSING"
+
+class ConcurrentBlackboard(Blackboard):
+    """
+    A `Blackboard` that is safe to use from several threads at once, such
+    as the tick thread and the callbacks of `AsyncAction`s running on the
+    tree's executor.
+
+    Keys are hashed onto a fixed set of lock stripes. Every operation on a
+    key holds that key's stripe, so reading or writing a key (including
+    registering its metadata on first write) is atomic, while operations
+    on keys in different stripes proceed in parallel rather than queueing
+    on one global lock. On top of plain reads and writes, the blackboard
+    offers an atomic `compare_and_set`, an atomic read-modify-write
+    `update`, and multi-key `transaction`s.
+
+    Args:
+        n_stripes (`int`):
+            The number of lock stripes. More stripes mean less contention
+            between unrelated keys. Defaults to 64.
+    """
+
+    # Stands for a key that is not in the blackboard in `compare_and_set`
+    # and `update`.
+    MISSING = _Missing()
+
+    def __init__(self, n_stripes : int = 64) -> None:
+        if n_stripes <= 0:
+            raise ValueError("n_stripes must be positive")
+        super().__init__()
+        self.n_stripes = n_stripes
+        self._stripes = [threading.RLock() for _ in range(n_stripes)]
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state["_stripes"]
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._stripes = [threading.RLock() for _ in range(self.n_stripes)]
+
+    def _stripe(self, key : Any) -> int:
+        return hash(key) % self.n_stripes
+
+    def lock_for(self, key : Any) -> threading.RLock:
+        """
+        Get the lock that guards `key`. The lock is reentrant and shared
+        with the other keys of its stripe.
+
+        Args:
+            key (`Any`):
+                The key.
+
+        Returns:
+            `threading.RLock`: The lock.
+        """
+        return self._stripes[self._stripe(key)]
+
+    def register_entry(self, entry : BlackboardEntryMetadata) -> None:
+        with self.lock_for(entry.key):
+            super().register_entry(entry)
+
+    def set_entry(self, key : Any, description : Optional[str] = None, type_constructor : Optional[Type] = None) -> None:
+        with self.lock_for(key):
+            super().set_entry(key, description, type_constructor)
+
+    def __getitem__(self, key : Any) -> Any:
+        with self.lock_for(key):
+            return super().__getitem__(key)
+
+    def __setitem__(self, key : Any, value : Any) -> None:
+        with self.lock_for(key):
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key : Any) -> None:
+        with self.lock_for(key):
+            super().__delitem__(key)
+
+    def append(self, key : Any, value : Any, *args) -> None:
+        with self.lock_for(key):
+            super().append(key, value, *args)
+
+    def __contains__(self, key : Any) -> bool:
+        return key in self.value_mapping
+
+    def __iter__(self) -> Iterator:
+        """
+        Get an iterator over a snapshot of the keys, so that other threads
+        can add and remove keys during iteration.
+
+        Returns:
+            `Iterator`: The iterator over the keys.
+        """
+        return iter(list(self.value_mapping))
+
+    def compare_and_set(self, key : Any, expected : Any, value : Any) -> bool:
+        """
+        Atomically set `key` to `value` if its current value is
+        `expected`. Values are compared by identity, and then by `==`.
+
+        Args:
+            key (`Any`):
+                The key to set.
+            expected (`Any`):
+                The value the key must have, or
+                `ConcurrentBlackboard.MISSING` if the key must not be in
+                the blackboard.
+            value (`Any`):
+                The new value.
+
+        Returns:
+            `bool`: Whether the value was set.
+        """
+        with self.lock_for(key):
+            current = self.value_mapping.get(key, self.MISSING)
+            if current is not expected:
+                if current is self.MISSING or expected is self.MISSING or not current == expected:
+                    return False
+            super().__setitem__(key, value)
+            return True
+
+    def update(self, key : Any, fn : Callable[[Any], Any], default : Any = MISSING) -> Any:
+        """
+        Atomically replace the value of `key` with `fn(value)`.
+
+        Args:
+            key (`Any`):
+                The key to update.
+            fn (`Callable[[Any], Any]`):
+                A function from the current value to the new one. It runs
+                with the key's stripe locked, so it should be quick and
+                must not touch other keys.
+            default (`Any`):
+                The value passed to `fn` if the key is not in the
+                blackboard. If not given, a missing key is a `KeyError`.
+
+        Returns:
+            `Any`: The new value.
+        """
+        with self.lock_for(key):
+            if key in self.value_mapping:
+                current = super().__getitem__(key)
+            elif default is not self.MISSING:
+                current = default
+            else:
+                raise KeyError(f"Entry {key} not in blackboard.")
+            value = fn(current)
+            super().__setitem__(key, value)
+            return value
+
+    @contextmanager
+    def transaction(self, keys : Iterable[Any]) -> Iterator["ConcurrentBlackboard"]:
+        """
+        Lock several keys for the duration of a `with` block, so that a
+        group of reads and writes is atomic with respect to other threads:
+
+            with bb.transaction(["src", "dst"]):
+                bb["dst"] = bb["dst"] + bb["src"]
+                bb["src"] = 0
+
+        Stripes are locked in a fixed order, so transactions over
+        overlapping keys cannot deadlock each other. Inside the block,
+        only touch the keys that were named; locking other keys there
+        can deadlock with another transaction.
+
+        Args:
+            keys (`Iterable[Any]`):
+                The keys to lock.
+
+        Returns:
+            `Iterator[ConcurrentBlackboard]`: This blackboard.
+        """
+        stripes = sorted({self._stripe(key) for key in keys})
+        locked : List[threading.RLock] = []
+        try:
+            for i in stripes:
+                self._stripes[i].acquire()
+                locked.append(self._stripes[i])
+            yield self
+        finally:
+            for lock in reversed(locked):
+                lock.release()
+
+    def checkpoint(self) -> int:
+        """
+        Get the current version of the blackboard, to pass to 
+        `delta_since` later. Every stripe is locked, so that no write is
+        half logged.
+
+        Returns:
+            `int`: The version.
+        """
+        with self.transaction_all():
+            return super().checkpoint()
+
+    def delta_since(self, checkpoint : int) -> BlackboardDelta:
+        """
+        Collect the keys written or deleted since `checkpoint`. Every 
+        stripe is locked while the delta is collected, so the delta is a
+        consistent snapshot.
+
+        Args:
+            checkpoint (`int`):
+                A version returned by `checkpoint`. Use 0 for everything.
+
+        Returns:
+            `BlackboardDelta`: The changes, with the current values of the
+            written keys.
+        """
+        with self.transaction_all():
+            return super().delta_since(checkpoint)
+
+    @contextmanager
+    def transaction_all(self) -> Iterator["ConcurrentBlackboard"]:
+        """
+        Lock every key for the duration of a `with` block.
+
+        Returns:
+            `Iterator[ConcurrentBlackboard]`: This blackboard.
+        """
+        for lock in self._stripes:
+            lock.acquire()
+        try:
+            yield self
+        finally:
+            for lock in reversed(self._stripes):
+                lock.release()
+
+    def get_many(self, keys : Iterable[Any]) -> Dict[Any, Any]:
+        """
+        Atomically read several keys.
+
+        Args:
+            keys (`Iterable[Any]`):
+                The keys to read.
+
+        Returns:
+            `Dict[Any, Any]`: A map from each key to its value.
+        """
+        keys = list(keys)
+        with self.transaction(keys):
+            return {key : super(ConcurrentBlackboard, self).__getitem__(key) for key in keys}
+
+    def set_many(self, values : Dict[Any, Any]) -> None:
+        """
+        Atomically write several keys.
+
+        Args:
+            values (`Dict[Any, Any]`):
+                A map from keys to their new values.
+        """
+        with self.transaction(values.keys()):
+            for key, value in values.items():
+                super().__setitem__(key, value)
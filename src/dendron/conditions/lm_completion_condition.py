@@ -60,7 +60,8 @@ class LMCompletionCondition(ConditionNode):
                 The behavior tree this node belongs to.
         """
         self.tree = tree
-        self.set_blackboard(tree.blackboard)
+        if self.blackboard is None:
+            self.set_blackboard(tree.blackboard)
         tree.add_model(self.model_config)
 
     def tick(self) -> NodeStatus:
@@ -83,11 +84,21 @@ class LMCompletionCondition(ConditionNode):
             completions = self.blackboard[self.completions_key]
             success_fn = self.blackboard[self.success_fn_key]
 
-            log_probs = self.tree.get_model(self.model_config.model_name).loglikelihood(
-                ((input_prefix, s) for s in completions), 
+            # Scoring cannot be stopped part way, so only check that the
+            # deadline of an enclosing Timeout has not already passed.
+            remaining = self.time_remaining()
+            if remaining is not None and remaining <= 0:
+                return NodeStatus.FAILURE
+
+            model = self.tree.get_model(self.model_config.model_name)
+            log_probs = model.loglikelihood(
+                [(input_prefix, s) for s in completions], 
                 disable_tqdm=True
             )
 
+            if self.tracer is not None and self.tracer.wants_tokens:
+                self.tracer.record_tokens(self, sum(len(model.tok_encode(input_prefix + s)) for s in completions), 0)
+
             self.blackboard[self.logprobs_out_key] = {completions[i] : log_probs[i] for i in range(len(log_probs))}
 
             best_completion = completions[argmax(log_probs)]
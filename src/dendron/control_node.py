@@ -1,5 +1,5 @@
 from .basic_types import NodeType, NodeStatus
-from .tree_node import TreeNode
+from .tree_node import TreeNode, forwarding, forward_to_subtree
 from .blackboard import Blackboard
 
 import typing
@@ -10,9 +10,6 @@ import logging
 BehaviorTree = typing.NewType("BehaviorTree", None)
 
 class ControlNode(TreeNode):
-
-    _used_names = set(["control"])
-
     """
     Base class for a control node.
 
@@ -31,29 +28,9 @@ class ControlNode(TreeNode):
     def __init__(self, children : List[TreeNode] = None, name : str = "control") -> None:
         super().__init__()
         self.children : List[TreeNode] = children if children is not None else []
-        self._name = None
         self.name = name
 
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @name.setter
-    def name(self, value: str) -> None:
-        if self._name is not None:
-            ControlNode._used_names.remove(self._name)
-
-        if value in ControlNode._used_names:
-            suffix = 0
-            new_name = f"{value}_{suffix}"
-            while new_name in ControlNode._used_names:
-                suffix += 1
-                new_name = f"{value}_{suffix}"
-            value = new_name
-        
-        ControlNode._used_names.add(value)
-        self._name = value
-
+    @forwarding
     def set_tree(self, tree : BehaviorTree) -> None:
         """
         Set the tree of this node, and then have each of the children
@@ -63,13 +40,12 @@ class ControlNode(TreeNode):
             tree (`dendron.behavior_tree.BehaviorTree`):
                 The tree that will contain this node.
         """
-        self.tree = tree
-        for c in self.children:
-            c.set_tree(tree)
+        forward_to_subtree(self, "set_tree", "tree", tree)
 
     def children(self) -> List[TreeNode]:
         return self.children
 
+    @forwarding
     def set_logger(self, new_logger) -> None:
         """
         Set the logger for this node, and then forward the logger to the
@@ -79,39 +55,45 @@ class ControlNode(TreeNode):
             new_logger (`logging.Logger`):
                 The Logger to use.
         """
-        self.logger = new_logger
-        for c in self.children:
-            c.set_logger(new_logger)
+        forward_to_subtree(self, "set_logger", "logger", new_logger)
 
+    @forwarding
     def set_log_level(self, new_level) -> None:
         """
         Set the log level for this node, then forward that level for the
         children to use.
         """
-        self.log_level = new_level
-        for c in self.children:
-            c.set_log_level(new_level)
+        forward_to_subtree(self, "set_log_level", "log_level", new_level)
 
     def add_child(self, child : TreeNode) -> None:
         """
-        Add a new child node to the end of the list.
+        Add a new child node to the end of the list. If this node is
+        already part of a tree, the child is added to that tree as well.
 
         Args:
             child (`dendron.tree_node.TreeNode`):
                 The new child node.
         """
         self.children.append(child)
+        if self.tree is not None:
+            self.tree.attach_subtree(child, self)
 
     def add_children(self, children : List[TreeNode]) -> None:
         """
-        Add a list of children to the end of the list.
+        Add a list of children to the end of the list. If this node is
+        already part of a tree, the children are added to that tree as 
+        well.
 
         Args:
             children (`List[TreeNode]`):
                 The list of `TreeNode`s to add. 
         """
         self.children.extend(children)
+        if self.tree is not None:
+            for child in children:
+                self.tree.attach_subtree(child, self)
 
+    @forwarding
     def set_blackboard(self, bb : Blackboard) -> None:
         """
         Set the blackboard for this node, and then forward to the
@@ -121,9 +103,7 @@ class ControlNode(TreeNode):
             bb (`dendron.blackboard.Blackboard`):
                 The new blackboard to use.
         """
-        self.blackboard = bb
-        for child in self.children:
-            child.set_blackboard(bb)
+        forward_to_subtree(self, "set_blackboard", "blackboard", bb)
 
     def get_node_by_name(self, name : str) -> Optional[TreeNode]:
         """
@@ -189,15 +169,27 @@ class ControlNode(TreeNode):
 
     def halt_node(self) -> None:
         """
-        Reset the children and then reset this node.
+        Halt each dirty child and then reset this node.
         """
-        self.reset_children()
+        for child in self.children:
+            if child.dirty:
+                child.halt_node()
         self.reset_status()
+        self.dirty = False
 
-    def reset(self) -> None:
+    def reset_children(self) -> None:
         """
-        Instruct each child to reset.
+        Instruct each dirty child to reset. Children that have not run 
+        since they were last reset are skipped, along with their subtrees.
         """
         for child in self.children:
-            child.reset()
+            if child.dirty:
+                child.reset()
+
+    def reset(self) -> None:
+        """
+        Instruct each dirty child to reset.
+        """
+        self.reset_children()
+        self.dirty = False
     
\ No newline at end of file
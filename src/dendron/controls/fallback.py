@@ -5,9 +5,6 @@ from ..control_node import ControlNode
 from typing import List 
 
 class Fallback(ControlNode):
-
-    _used_names = set(["fallback"])
-
     """
     A Fallback node is a control node that ticks its children in 
     sequence, until a child returns `SUCCESS`, at which point it
@@ -24,50 +21,34 @@ class Fallback(ControlNode):
             node. Will be ticked in the order they are given.            
     """
 
-    def __init__(self, children : List[TreeNode] = [], name : str = "fallback") -> None:
+    def __init__(self, children : List[TreeNode] = None, name : str = "fallback") -> None:
         super().__init__(children)
 
-        self._name = None
         self.name = name
 
         self.current_child_idx = 0
 
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @name.setter
-    def name(self, value: str) -> None:
-        if self._name is not None:
-            Fallback._used_names.remove(self._name)
-
-        if value in Fallback._used_names:
-            suffix = 0
-            new_name = f"{value}_{suffix}"
-            while new_name in Fallback._used_names:
-                suffix += 1
-                new_name = f"{value}_{suffix}"
-            value = new_name
-        
-        Fallback._used_names.add(value)
-        self._name = value
-
     def reset(self) -> None:
         """
-        Set the current child index to 0 and instruct all children
-        to reset.
+        Set the current child index to 0 and instruct the children that
+        have run since the last reset to reset.
         """
+        # Children are ticked in order, starting from the first, and the
+        # index only moves forward until a reset, so children after the
+        # current one have not run.
+        for child in self.children[:self.current_child_idx + 1]:
+            if child.dirty:
+                child.reset()
         self.current_child_idx = 0
-        for child in self.children:
-            child.reset()
+        self.dirty = False
 
     def halt_node(self) -> None:
         """
         Set the current child index to 0 and instruct all children
-        to halt via the parent class `halt()`.
+        to halt via the parent class `halt_node()`.
         """
         self.current_child_idx = 0
-        ControlNode.halt(self)
+        ControlNode.halt_node(self)
 
     def tick(self) -> NodeStatus:
         """
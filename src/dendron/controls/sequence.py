@@ -1,71 +1,136 @@
 from ..basic_types import NodeType, NodeStatus
 from ..tree_node import TreeNode
 from ..control_node import ControlNode
+from ..dataflow import DataflowAnalysis
 
-from typing import List
+from typing import Dict, List, Optional
 
 class Sequence(ControlNode):
-
-    _used_names = set(["sequence"])
-    
     """
     A Sequence node is a control node that ticks its children in
     sequence, until a child returns `FAILURE`, at which point it
     returns `FAILURE`. If all children succeed, then the Sequence
     node returns `SUCCESS`. 
 
+    In parallel mode, consecutive children that do not touch the
+    blackboard in conflicting ways (see `dendron.dataflow`) are ticked
+    at the same time on the tree's executor, so that, for instance,
+    several LM actions that read and write different keys overlap.
+    Children are split into groups greedily: a group starting at the
+    current child extends over the following children for as long as
+    their subtrees' declared or inferred accesses pairwise do not
+    conflict. Children whose keys are unknown conflict with any child
+    that uses the blackboard, and so run alone. This includes a child
+    with a function added by `add_pre_tick` or `add_post_tick` that does
+    not declare its access with `dendron.dataflow.declare_access`, so a
+    post-tick function that passes a child's output on to the next
+    child keeps the two in order.
+
+    The statuses of a group are combined in child order, as if the
+    children had run one after another: the Sequence returns `RUNNING`
+    at the first child still running, without ticking again the
+    children after it that have finished, and the first failure in
+    order is the result, halting the children after it that are still
+    running. Children after a failure may still have run, since they
+    started together with the failing one.
+
+    Children ticked at the same time share the tree's blackboard. The
+    blackboards in dendron take care that concurrent writes to different
+    keys are logged in order, so that `checkpoint` and `delta_since` see
+    every one of them; a custom blackboard must do the same. Tracers see
+    the children's ticks from several threads (see `TickTracer`).
+
+    The groups are planned on the first tick, and again whenever the
+    list of children changes. Set `group_ends` to `None` to plan again
+    after changing the subtrees under the children, or their tick
+    functions.
+
     Args:
         name (`str`):
             The given name of this node.
         children (`List[TreeNode]`):
             A list of `TreeNode`s to initialize the children of this
             node. Will be ticked in the order they are given.
+        parallel (`bool`):
+            Whether to tick independent consecutive children at the same
+            time. Defaults to `False`.
     """
 
-    def __init__(self, children : List[TreeNode] = [], name : str = "sequence") -> None:
+    def __init__(self, children : List[TreeNode] = None, name : str = "sequence", parallel : bool = False) -> None:
         super().__init__(children)
 
-        self._name = None
         self.name = name
 
         self.current_child_idx = 0
 
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @name.setter
-    def name(self, value: str) -> None:
-        if self._name is not None:
-            Sequence._used_names.remove(self._name)
-
-        if value in Sequence._used_names:
-            suffix = 0
-            new_name = f"{value}_{suffix}"
-            while new_name in Sequence._used_names:
-                suffix += 1
-                new_name = f"{value}_{suffix}"
-            value = new_name
-
-        Sequence._used_names.add(value)
-        self._name = value
+        self.parallel = parallel
+        # For each child, the end of the group of children starting at
+        # it, and the children the groups were planned for.
+        self.group_ends : Optional[List[int]] = None
+        self.planned_children : Optional[List[TreeNode]] = None
+        # The statuses of the children after the current one that have
+        # finished, and the end of the children ticked since the last
+        # reset.
+        self.finished : Dict[int, NodeStatus] = {}
+        self.ticked_until = 0
 
     def reset(self) -> None:
         """
-        Set the current child index to 0 and instruct all children
-        to reset.
+        Set the current child index to 0 and instruct the children that
+        have run since the last reset to reset.
         """
+        # Children are ticked in order, starting from the first, and the
+        # index only moves forward until a reset, so children after the
+        # current one have not run, except for the rest of its group in
+        # parallel mode.
+        for child in self.children[:max(self.current_child_idx + 1, self.ticked_until)]:
+            if child.dirty:
+                child.reset()
         self.current_child_idx = 0
-        for child in self.children:
-            child.reset()
+        self.finished.clear()
+        self.ticked_until = 0
+        self.dirty = False
 
     def halt_node(self) -> None:
         """
         Set the current child index to 0 and instruct all children
-        to halt via the parent class `halt()`.
+        to halt via the parent class `halt_node()`.
         """
         self.current_child_idx = 0
-        ControlNode.halt(self)
+        self.finished.clear()
+        self.ticked_until = 0
+        ControlNode.halt_node(self)
+
+    def plan_groups(self) -> List[int]:
+        """
+        Get the groups of children that parallel mode ticks together,
+        planning them if the children have changed since they were last
+        planned.
+
+        Returns:
+            `List[int]`: For each child, the index after the last child
+            of the group that starts at it.
+        """
+        if self.group_ends is not None and self.planned_children == self.children:
+            return self.group_ends
+
+        analysis = DataflowAnalysis(self)
+        accesses = [analysis.subtree_access[child] for child in self.children]
+        n_children = len(accesses)
+
+        # A group that does not conflict still does not conflict without
+        # its first child, so group ends never decrease.
+        group_ends = []
+        end = 0
+        for start in range(n_children):
+            end = max(end, start + 1)
+            while end < n_children and not any(accesses[end].conflicts(accesses[i]) for i in range(start, end)):
+                end += 1
+            group_ends.append(end)
+
+        self.group_ends = group_ends
+        self.planned_children = list(self.children)
+        return group_ends
 
     def tick(self) -> NodeStatus:
         """
@@ -81,6 +146,9 @@ class Sequence(ControlNode):
         n_children = self.children_count()
         self.set_status(NodeStatus.RUNNING)
 
+        if self.parallel:
+            return self._tick_parallel(n_children)
+
         while(self.current_child_idx < n_children):
             current_child = self.children[self.current_child_idx]
 
@@ -105,6 +173,68 @@ class Sequence(ControlNode):
 
         return NodeStatus.SUCCESS
 
+    def _tick_parallel(self, n_children : int) -> NodeStatus:
+        group_ends = self.plan_groups()
+
+        while(self.current_child_idx < n_children):
+            start = self.current_child_idx
+            end = group_ends[start]
+            self.ticked_until = max(self.ticked_until, end)
+
+            pending = [i for i in range(start, end) if i not in self.finished]
+            for i, child_status in zip(pending, self._tick_children(pending)):
+                if child_status == NodeStatus.IDLE:
+                    raise RuntimeError("Child can't return IDLE")
+                if child_status != NodeStatus.RUNNING:
+                    self.finished[i] = child_status
+
+            for i in range(start, end):
+                child_status = self.finished.pop(i, NodeStatus.RUNNING)
+                match child_status:
+                    case NodeStatus.RUNNING:
+                        return NodeStatus.RUNNING
+                    case NodeStatus.FAILURE:
+                        for j in range(i + 1, self.ticked_until):
+                            if j not in self.finished and self.children[j].dirty:
+                                self.children[j].halt_node()
+                        self.reset()
+                        return child_status
+                    case NodeStatus.SUCCESS | NodeStatus.SKIPPED:
+                        self.current_child_idx = i + 1
+
+        self.reset()
+
+        return NodeStatus.SUCCESS
+
+    def _tick_children(self, indices : List[int]) -> List[NodeStatus]:
+        # Tick the first child on this thread and the others on the
+        # executor, publishing the deadline in force to them.
+        tree = self.tree
+        if tree is None or len(indices) == 1:
+            return [self.children[i].execute_tick() for i in indices]
+
+        deadline = tree.deadline()
+        futs = [tree.submit(self, self._tick_child, self.children[i], deadline) for i in indices[1:]]
+        statuses = [self._tick_child(self.children[indices[0]], deadline)]
+        for i, fut in zip(indices[1:], futs):
+            # A job still waiting for a worker runs here instead, so that
+            # nested parallel Sequences cannot use up the workers waiting
+            # on each other.
+            if fut.cancel():
+                statuses.append(self._tick_child(self.children[i], deadline))
+            else:
+                statuses.append(fut.result())
+        return statuses
+
+    def _tick_child(self, child : TreeNode, deadline : Optional[float]) -> NodeStatus:
+        if deadline is None:
+            return child.execute_tick()
+        self.tree.push_deadline(deadline)
+        try:
+            return child.execute_tick()
+        finally:
+            self.tree.pop_deadline()
+
     def pretty_repr(self, depth = 0) -> str:
         """
         Return a string representation of this node at the given depth.
@@ -118,6 +248,8 @@ class Sequence(ControlNode):
         """
         tabs = '\t'*depth
         repr = f"{tabs}Sequence {self.name}"
+        if self.parallel:
+            repr += " (parallel)"
         for child in self.children:
             child_repr = child.pretty_repr(depth+1)
             repr += f"\n{child_repr}"
@@ -0,0 +1,360 @@
+from .basic_types import NodeType
+from .control_node import ControlNode
+from .decorator_node import DecoratorNode
+from .tree_node import TreeNode
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+@dataclass(frozen=True)
+class BlackboardAccess:
+    """
+    The blackboard keys a node (or a subtree) reads and writes. An
+    `opaque` access stands for a node whose keys are unknown, such as a
+    callback that did not declare them; it is assumed to read and write
+    every key.
+
+    Args:
+        reads (`FrozenSet[Any]`):
+            The keys read.
+        writes (`FrozenSet[Any]`):
+            The keys written.
+        opaque (`bool`):
+            Whether the keys are unknown. Defaults to `False`.
+    """
+    reads : FrozenSet[Any] = frozenset()
+    writes : FrozenSet[Any] = frozenset()
+    opaque : bool = False
+
+    @classmethod
+    def of(cls, reads : Iterable[Any] = (), writes : Iterable[Any] = ()) -> "BlackboardAccess":
+        """
+        Build an access from any iterables of keys.
+
+        Args:
+            reads (`Iterable[Any]`):
+                The keys read.
+            writes (`Iterable[Any]`):
+                The keys written.
+
+        Returns:
+            `BlackboardAccess`: The access.
+        """
+        return cls(frozenset(reads), frozenset(writes))
+
+    def __or__(self, other : "BlackboardAccess") -> "BlackboardAccess":
+        return BlackboardAccess(self.reads | other.reads, self.writes | other.writes, self.opaque or other.opaque)
+
+    def is_empty(self) -> bool:
+        return not (self.reads or self.writes or self.opaque)
+
+    def conflicts(self, other : "BlackboardAccess") -> bool:
+        """
+        Check whether running this access and `other` in either order, or
+        at the same time, could give different results: one of them
+        writes a key that the other reads or writes, or either is opaque
+        and the other is not empty.
+
+        Args:
+            other (`BlackboardAccess`):
+                The other access.
+
+        Returns:
+            `bool`: Whether the accesses conflict.
+        """
+        if self.opaque or other.opaque:
+            return not (self.is_empty() or other.is_empty())
+        return not (self.writes.isdisjoint(other.reads)
+                    and self.writes.isdisjoint(other.writes)
+                    and self.reads.isdisjoint(other.writes))
+
+    def map_keys(self, fn : Callable[[Any], Any]) -> "BlackboardAccess":
+        """
+        Rename every key with `fn`.
+
+        Args:
+            fn (`Callable[[Any], Any]`):
+                A map from old keys to new keys.
+
+        Returns:
+            `BlackboardAccess`: The renamed access.
+        """
+        return BlackboardAccess(frozenset(map(fn, self.reads)), frozenset(map(fn, self.writes)), self.opaque)
+
+OPAQUE = BlackboardAccess(opaque=True)
+
+def declare_access(reads : Iterable[Any] = (), writes : Iterable[Any] = ()) -> Callable:
+    """
+    Declare the blackboard keys read and written by a callback, a node,
+    or a node class, for `DataflowAnalysis`:
+
+        @declare_access(reads=["document"], writes=["summary"])
+        def summarize():
+            ...
+
+        node = SimpleAction("summarize", summarize)
+
+    Args:
+        reads (`Iterable[Any]`):
+            The keys read.
+        writes (`Iterable[Any]`):
+            The keys written.
+
+    Returns:
+        `Callable`: A decorator that sets the `declared_access` attribute
+        of its argument and returns it.
+    """
+    access = BlackboardAccess.of(reads, writes)
+    def mark(target):
+        target.declared_access = access
+        return target
+    return mark
+
+# Attributes through which nodes name the keys they use.
+_READ_KEY_ATTRS = ("input_key", "text_input_key", "image_input_key", "prompt_key", "completions_key", "success_fn_key")
+_WRITE_KEY_ATTRS = ("output_key", "logprobs_out_key")
+_CALLBACK_ATTRS = ("callback", "cb")
+
+def node_access(node : TreeNode) -> BlackboardAccess:
+    """
+    Get the blackboard access of a single node, in the node's own key
+    names, not counting its children. In order of precedence, the
+    access is:
+
+    - the node's `declared_access` (see `declare_access`), if set on the
+      node or its class;
+    - the `declared_access` of the node's callback, for nodes such as
+      `SimpleAction`, `SimpleCondition` and `AsyncAction`, or `OPAQUE`
+      if the callback has none;
+    - the keys named by the node's `input_key`, `text_input_key`,
+      `image_input_key`, `prompt_key`, `completions_key` and
+      `success_fn_key` attributes (read) and `output_key` and
+      `logprobs_out_key` attributes (written);
+    - empty for control nodes and decorators, which only direct the
+      flow of ticks;
+    - `OPAQUE` otherwise.
+
+    The functions added with `add_pre_tick` and `add_post_tick` run as
+    part of the node's tick, so the `declared_access` of each one is
+    added to the node's access. A node with a tick function that does
+    not declare its access is `OPAQUE`.
+
+    Args:
+        node (`dendron.tree_node.TreeNode`):
+            The node.
+
+    Returns:
+        `BlackboardAccess`: The access.
+    """
+    access = _tick_access(node)
+    for fns in (node.pre_tick_fns, node.post_tick_fns):
+        for f in fns:
+            declared = getattr(f, "declared_access", None)
+            if declared is None:
+                return OPAQUE
+            access = access | declared
+    return access
+
+def _tick_access(node : TreeNode) -> BlackboardAccess:
+    # The access of the node's tick, without its tick functions.
+    declared = getattr(node, "declared_access", None)
+    if declared is not None:
+        return declared
+
+    for attr in _CALLBACK_ATTRS:
+        callback = getattr(node, attr, None)
+        if callback is not None:
+            declared = getattr(callback, "declared_access", None)
+            return declared if declared is not None else OPAQUE
+
+    reads = [getattr(node, attr) for attr in _READ_KEY_ATTRS if getattr(node, attr, None) is not None]
+    writes = [getattr(node, attr) for attr in _WRITE_KEY_ATTRS if getattr(node, attr, None) is not None]
+    if reads or writes:
+        return BlackboardAccess.of(reads, writes)
+
+    if isinstance(node, (ControlNode, DecoratorNode)):
+        return BlackboardAccess()
+    return OPAQUE
+
+class LocalKey(NamedTuple):
+    """
+    A key that a `dendron.decorators.SubTree` keeps out of the parent
+    blackboard: a constant binding, or any unmapped key of an isolated
+    subtree.
+    """
+    subtree : TreeNode
+    key : Any
+
+@dataclass
+class Dependency:
+    """
+    An ordering constraint between two nodes of a tree: `target` comes
+    after `source` in tick order and their accesses conflict on `keys`.
+    `kind` is "raw" if `target` reads what `source` wrote, "war" if
+    `target` overwrites what `source` read, and "waw" if both write.
+    """
+    source : TreeNode
+    target : TreeNode
+    kind : str
+    keys : FrozenSet[Any]
+
+def _child_nodes(node : TreeNode) -> List[TreeNode]:
+    if isinstance(node, ControlNode):
+        return node.children
+    elif isinstance(node, DecoratorNode):
+        return [] if node.child_node is None else [node.child_node]
+    return []
+
+def _translate(subtree : TreeNode, key : Any) -> Any:
+    if isinstance(key, LocalKey):
+        return key
+    if key in subtree.remapping:
+        return subtree.remapping[key]
+    if key in subtree.values or subtree.isolated:
+        return LocalKey(subtree, key)
+    return key
+
+class DataflowAnalysis:
+    """
+    A static analysis of the blackboard keys read and written by the
+    nodes of a tree, as declared or inferred by `node_access`.
+
+    Keys are given as keys of the tree's blackboard: the keys of nodes
+    inside a `dendron.decorators.SubTree` are translated through its
+    remapping, and keys the subtree keeps to itself become `LocalKey`s.
+
+    - `access[node]` is the access of the node alone.
+    - `subtree_access[node]` is the access of the node and all of its
+      descendants, which is what running the node can touch.
+    - `readers[key]` and `writers[key]` list the nodes that read and
+      write a key, in tick order.
+    - `dependencies` lists the `Dependency`s between nodes, which form a
+      graph whose edges run forward in tick order.
+
+    The analysis reflects the tree when it was built; build a new one
+    after changing the tree.
+
+    Args:
+        root (`dendron.tree_node.TreeNode`):
+            The root of the tree to analyze.
+    """
+
+    def __init__(self, root : TreeNode) -> None:
+        self.root = root
+        self.access : Dict[TreeNode, BlackboardAccess] = {}
+        self.subtree_access : Dict[TreeNode, BlackboardAccess] = {}
+        self.readers : Dict[Any, List[TreeNode]] = {}
+        self.writers : Dict[Any, List[TreeNode]] = {}
+        self.opaque_nodes : List[TreeNode] = []
+        self.dependencies : List[Dependency] = []
+
+        # Visit in tick (pre-)order, keeping the SubTrees above each node
+        # so that keys can be translated into the root's names.
+        order : List[TreeNode] = []
+        stack : List[Tuple[TreeNode, Tuple[TreeNode, ...]]] = [(root, ())]
+        while stack:
+            node, subtrees = stack.pop()
+            order.append(node)
+            access = node_access(node)
+            for subtree in reversed(subtrees):
+                access = access.map_keys(lambda key, subtree=subtree: _translate(subtree, key))
+            self.access[node] = access
+
+            if node.node_type() == NodeType.SUBTREE:
+                subtrees = subtrees + (node,)
+            for child in reversed(_child_nodes(node)):
+                stack.append((child, subtrees))
+
+        for node in reversed(order):
+            access = self.access[node]
+            for child in _child_nodes(node):
+                access = access | self.subtree_access[child]
+            self.subtree_access[node] = access
+
+        for node in order:
+            access = self.access[node]
+            if access.opaque:
+                self.opaque_nodes.append(node)
+            for key in access.reads:
+                self.readers.setdefault(key, []).append(node)
+            for key in access.writes:
+                self.writers.setdefault(key, []).append(node)
+
+        self._build_dependencies(order)
+
+    def _build_dependencies(self, order : List[TreeNode]) -> None:
+        # For each key, the last node to write it and the nodes that read
+        # it since. An opaque node reads and writes every key.
+        last_writer : Dict[Any, TreeNode] = {}
+        readers_since : Dict[Any, List[TreeNode]] = {}
+        last_opaque : Optional[TreeNode] = None
+        seen : List[TreeNode] = []
+        edges : Dict[Tuple[TreeNode, TreeNode, str], set] = {}
+
+        def add(source, target, kind, key):
+            if source is not target:
+                edges.setdefault((source, target, kind), set()).add(key)
+
+        for node in order:
+            access = self.access[node]
+            if access.is_empty():
+                continue
+            if access.opaque:
+                for previous in seen:
+                    add(previous, node, "raw" if self.access[previous].writes or self.access[previous].opaque else "war", None)
+                last_opaque = node
+                last_writer.clear()
+                readers_since.clear()
+                seen.append(node)
+                continue
+
+            for key in access.reads:
+                source = last_writer.get(key, last_opaque)
+                if source is not None:
+                    add(source, node, "raw", key)
+            for key in access.writes:
+                source = last_writer.get(key, last_opaque)
+                if source is not None:
+                    add(source, node, "waw", key)
+                for reader in readers_since.get(key, ()):
+                    add(reader, node, "war", key)
+            for key in access.reads:
+                readers_since.setdefault(key, []).append(node)
+            for key in access.writes:
+                last_writer[key] = node
+                readers_since[key] = []
+            seen.append(node)
+
+        self.dependencies = [Dependency(source, target, kind, frozenset(k for k in keys if k is not None)) for (source, target, kind), keys in edges.items()]
+
+    def conflicts(self, a : TreeNode, b : TreeNode) -> bool:
+        """
+        Check whether the subtrees under two nodes touch the blackboard in
+        conflicting ways (see `BlackboardAccess.conflicts`), so that they
+        cannot safely run at the same time or in a different order.
+
+        Args:
+            a (`dendron.tree_node.TreeNode`):
+                A node of the tree.
+            b (`dendron.tree_node.TreeNode`):
+                Another node of the tree.
+
+        Returns:
+            `bool`: Whether they conflict.
+        """
+        return self.subtree_access[a].conflicts(self.subtree_access[b])
+
+    def dead_writes(self) -> Dict[Any, List[TreeNode]]:
+        """
+        Find the keys that nodes write but no node of the tree reads,
+        with their writers. Such writes are only useful to code outside
+        the tree. If any node is opaque, no write can be shown to be dead
+        and the result is empty.
+
+        Returns:
+            `Dict[Any, List[TreeNode]]`: A map from each dead key to the
+            nodes that write it.
+        """
+        if self.opaque_nodes:
+            return {}
+        return {key : nodes for key, nodes in self.writers.items() if key not in self.readers}
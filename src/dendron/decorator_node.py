@@ -1,5 +1,6 @@
 from .basic_types import NodeType, NodeStatus
-from .tree_node import TreeNode
+from .blackboard import Blackboard
+from .tree_node import TreeNode, forwarding, forward_to_subtree
 
 import typing
 from typing import Optional, List
@@ -9,9 +10,6 @@ import logging
 BehaviorTree = typing.NewType("BehaviorTree", None)
 
 class DecoratorNode(TreeNode):
-
-    _used_names = set(["decorator"])
-    
     """
     A decorator is a "wrapper" around a single node. The purpose of 
     the decorator is to modify or support the action of its child in
@@ -28,49 +26,28 @@ class DecoratorNode(TreeNode):
     def __init__(self, child : TreeNode = None, name : str = "decorator") -> None:
         super().__init__()
         
-        self._name = None
         self.name = name
 
         self.child_node : TreeNode = child
 
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @name.setter
-    def name(self, value: str) -> None:
-        if self._name is not None:
-            DecoratorNode._used_names.remove(self._name)
-
-        if value in DecoratorNode._used_names:
-            suffix = 0
-            new_name = f"{value}_{suffix}"
-            while new_name in DecoratorNode._used_names:
-                suffix += 1
-                new_name = f"{value}_{suffix}"
-            value = new_name
-        
-        DecoratorNode._used_names.add(value)
-        self._name = value
-
     def children(self) -> List[TreeNode]:
         return [self.child_node]
 
+    @forwarding
     def set_logger(self, new_logger) -> None:
         """
         Set the logger for this node, and then forward the logger to the 
         child node.
         """
-        self.logger = new_logger
-        self.child_node.set_logger(new_logger)
+        forward_to_subtree(self, "set_logger", "logger", new_logger)
 
+    @forwarding
     def set_log_level(self, new_level) -> None:
         """
         Set the log level for this node, and then forward that level to 
         the child node.
         """
-        self.log_level = new_level
-        self.child_node.set_log_level(new_level)
+        forward_to_subtree(self, "set_log_level", "log_level", new_level)
 
     def node_type(self) -> NodeType:
         """
@@ -80,14 +57,22 @@ class DecoratorNode(TreeNode):
 
     def set_child(self, child : TreeNode) -> None:
         """
-        Set the child of this node to a new `TreeNode`.
+        Set the child of this node to a new `TreeNode`. If this node is
+        already part of a tree, the old child is removed from the tree and
+        the new child is added to it.
 
         Args:
             child (`dendron.tree_node.TreeNode`):
                 The new child of this decorator.
         """
+        if self.tree is not None and self.child_node is not None:
+            self.tree.unindex_subtree(self.child_node)
+
         self.child_node = child
 
+        if self.tree is not None:
+            self.tree.attach_subtree(child, self)
+
     def get_child(self) -> TreeNode:
         """
         Get the child of this decorator.
@@ -114,12 +99,39 @@ class DecoratorNode(TreeNode):
         else:
             return self.child_node.get_node_by_name(name)
 
+    def reset_child(self) -> None:
+        """
+        Instruct the child node to reset, if it is dirty.
+        """
+        if self.child_node.dirty:
+            self.child_node.reset()
+
     def halt_child(self) -> None:
         """
         Instruct the child node to halt.
         """
         self.child_node.halt_node()
 
+    def halt_node(self) -> None:
+        """
+        Halt the child node, and then reset this node.
+        """
+        self.halt_child()
+        self.reset()
+
+    @forwarding
+    def set_blackboard(self, bb : Blackboard) -> None:
+        """
+        Set the blackboard for this node, and then forward it to the 
+        child.
+
+        Args:
+            bb (`dendron.blackboard.Blackboard`):
+                The new blackboard to use.
+        """
+        forward_to_subtree(self, "set_blackboard", "blackboard", bb)
+
+    @forwarding
     def set_tree(self, tree : BehaviorTree) -> None:
         """
         Set the tree of this node, and then forward the tree to the child
@@ -129,16 +141,16 @@ class DecoratorNode(TreeNode):
             tree (`dendron.behavior_tree.BehaviorTree`):
                 The tree that contains this node.
         """
-        self.tree = tree
-        self.child_node.set_tree(tree)
+        forward_to_subtree(self, "set_tree", "tree", tree)
 
     def reset(self) -> None:
         """
         Set the status of this node to IDLE and instruct the child node to
-        reset.
+        reset if it is dirty.
         """
-        self.node_status = NodeStatus.IDLE
-        self.child_node.reset()
+        self.status = NodeStatus.IDLE
+        self.reset_child()
+        self.dirty = False
 
     def pretty_repr(self, depth = 0) -> str:
         """
@@ -5,4 +5,10 @@ from .repeat import Repeat
 from .retry import Retry
 from .run_once import RunOnce
 from .timeout import Timeout
-from .blackboard_history import BlackboardHistory
\ No newline at end of file
+from .blackboard_history import BlackboardHistory
+from .retry_with_backoff import RetryWithBackoff
+from .repeat_with_backoff import RepeatWithBackoff
+from .delay import Delay
+from .throttle import Throttle
+from .cooldown import Cooldown
+from .subtree import SubTree
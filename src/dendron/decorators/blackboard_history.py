@@ -1,17 +1,27 @@
 from ..blackboard import Blackboard
 from ..basic_types import NodeType, NodeStatus
+from ..dataflow import BlackboardAccess
+from ..history_buffer import HistoryBuffer
 from ..tree_node import TreeNode
 from ..decorator_node import DecoratorNode
 
+from typing import Any, Optional
+
+import time
+
 class BlackboardHistory(DecoratorNode):
     """
-    The Blackboard history node keeps track of a blackboard entry 
-    related to a child node. Every time this node is ticked, it 
+    The Blackboard history node keeps track of a blackboard entry
+    related to a child node. Every time this node is ticked, it
     examines the blackboard and records the value stored at the
     `child_key` before `tick()`ing the child.
 
     The history is itself stored in the blackboard, by default at
-    the key "{child_node.name}/{child_key}/history".
+    the key "{child_node.name}/{child_key}/history", as a
+    `dendron.history_buffer.HistoryBuffer` that holds the latest
+    `capacity` values along with the time each was recorded (on the
+    tree's clock). Numeric values are kept in a NumPy array, and the
+    buffer answers window queries such as `last(k)` and `between(t0, t1)`.
 
     Args:
         name (`str`):
@@ -20,14 +30,38 @@ class BlackboardHistory(DecoratorNode):
             The child node whose blackboard history we want to track.
         child_key (`str`):
             The blackboard key we want to record values for.
+        capacity (`int`):
+            The number of values kept. Defaults to 1024.
+        every (`int`):
+            Record the value only on every `every`-th tick, to cover a
+            longer span of time with the same capacity. Defaults to 1.
+        dtype (`Optional[Any]`):
+            The NumPy dtype of the recorded values. Defaults to the dtype
+            of the first value.
     """
-    def __init__(self, name, child: TreeNode, child_key : str = "in") -> None:
-        super().__init__(name, child)
+    def __init__(self, name, child: TreeNode, child_key : str = "in", capacity : int = 1024, every : int = 1, dtype : Optional[Any] = None) -> None:
+        super().__init__(child, name)
+        if every <= 0:
+            raise ValueError("every must be positive")
 
         self.child_key = self.child_node.input_key
         self.history_key = f"{self.child_node.name}/{child_key}/history"
+        self.capacity = capacity
+        self.every = every
+        self.dtype = dtype
+        self.n_ticks = 0
+        self.child_slot = None
+        self.declared_access = BlackboardAccess.of([self.child_key, self.history_key], [self.history_key])
         if self.blackboard is not None:
-            self.blackboard[self.history_key] = []
+            self.blackboard[self.history_key] = self._new_history()
+
+    def _new_history(self) -> HistoryBuffer:
+        return HistoryBuffer(self.capacity, self.dtype)
+
+    def _now(self) -> float:
+        if self.tree is None:
+            return time.monotonic()
+        return self.tree.timer.now()
 
     def set_blackboard(self, bb : Blackboard) -> None:
         """
@@ -38,24 +72,30 @@ class BlackboardHistory(DecoratorNode):
                 The new blackboard to track.
         """
         self.blackboard = bb
-        self.blackboard[self.history_key] = []
-        
+        self.blackboard[self.history_key] = self._new_history()
+        self.child_slot = bb.slot(self.child_key)
+
         self.child_node.set_blackboard(bb)
 
     def reset(self) -> None:
         """
         Clear the history and instruct the child to reset.
         """
-        self.blackboard[self.history_key] = []
-        self.child_node.reset()
+        self.blackboard[self.history_key] = self._new_history()
+        self.n_ticks = 0
+        self.reset_child()
+        self.dirty = False
 
     def tick(self) -> NodeStatus:
         """
-        Record the value stored in the blackboard at `child_key` and
-        then instruct the child node to execute its `tick()` function.
+        Record the value stored in the blackboard at `child_key` (on
+        every `every`-th tick) and then instruct the child node to
+        execute its `tick()` function.
         """
-        latest = self.blackboard[self.child_key]
-        self.blackboard[self.history_key].append(latest)
+        if self.n_ticks % self.every == 0:
+            latest = self.blackboard.get_slot(self.child_slot)
+            self.blackboard.append(self.history_key, latest, self._now())
+        self.n_ticks += 1
 
         status = self.child_node.execute_tick()
 
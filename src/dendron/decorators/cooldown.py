@@ -0,0 +1,44 @@
+from ..basic_types import NodeStatus
+from ..tree_node import TreeNode
+from ..decorator_node import DecoratorNode
+
+class Cooldown(DecoratorNode):
+    """
+    The cooldown decorator makes its child unavailable for `cooldown`
+    milliseconds after the child finishes. During the cooldown this node
+    returns `FAILURE` without ticking the child, so that an enclosing
+    `Fallback` moves on to its other options.
+
+    The cooldown holds across resets of this node. It is scheduled on 
+    the tree's timer, so this node must be part of a `BehaviorTree`.
+
+    Args:
+        name (`str`):
+            The given name of this node.
+        child (`dendron.tree_node.TreeNode`):
+            The child of this node.
+        cooldown (`int`):
+            The integer number of *milliseconds* that the child is 
+            unavailable after it finishes.
+    """
+    def __init__(self, name : str, child : TreeNode, cooldown : int) -> None:
+        super().__init__(child, name)
+        self.cooldown = cooldown
+        self.wait_handle = None
+
+    def _wake(self) -> None:
+        self.wait_handle = None
+
+    def tick(self) -> NodeStatus:
+        """
+        If the child is cooling down, return `FAILURE`. Otherwise tick 
+        the child, start the cooldown if it finished, and return its 
+        status.
+        """
+        if self.wait_handle is not None:
+            return NodeStatus.FAILURE
+
+        child_status = self.child_node.execute_tick()
+        if child_status != NodeStatus.RUNNING and self.cooldown > 0:
+            self.wait_handle = self.tree.timer.call_later(self.cooldown / 1000, self._wake)
+        return child_status
@@ -0,0 +1,59 @@
+from ..basic_types import NodeStatus
+from ..tree_node import TreeNode
+from ..decorator_node import DecoratorNode
+
+class Delay(DecoratorNode):
+    """
+    The delay decorator waits for a fixed time before ticking its child,
+    returning `RUNNING` while it waits. Once the delay has passed, the 
+    child is ticked and its status returned; the next time the child is
+    started, the node waits again. The wait is scheduled on the tree's
+    timer, so this node must be part of a `BehaviorTree`.
+
+    Args:
+        name (`str`):
+            The given name of this node.
+        child (`dendron.tree_node.TreeNode`):
+            The child of this node.
+        delay (`int`):
+            The integer number of *milliseconds* to wait before ticking the
+            child.
+    """
+    def __init__(self, name : str, child : TreeNode, delay : int) -> None:
+        super().__init__(child, name)
+        self.delay = delay
+        self.delay_started = False
+        self.wait_handle = None
+
+    def reset(self) -> None:
+        """
+        Cancel any pending wait and instruct the child node to reset.
+        """
+        if self.wait_handle is not None:
+            self.tree.timer.cancel(self.wait_handle)
+            self.wait_handle = None
+        self.delay_started = False
+        self.status = NodeStatus.IDLE
+        self.reset_child()
+        self.dirty = False
+
+    def _wake(self) -> None:
+        self.wait_handle = None
+
+    def tick(self) -> NodeStatus:
+        """
+        Start the delay if it has not started, and return `RUNNING` until
+        it has passed. Then tick the child and return its status.
+        """
+        if not self.delay_started:
+            self.delay_started = True
+            if self.delay > 0:
+                self.wait_handle = self.tree.timer.call_later(self.delay / 1000, self._wake)
+
+        if self.wait_handle is not None:
+            return NodeStatus.RUNNING
+
+        child_status = self.child_node.execute_tick()
+        if child_status != NodeStatus.RUNNING:
+            self.delay_started = False
+        return child_status
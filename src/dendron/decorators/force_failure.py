@@ -18,9 +18,7 @@ class ForceFailure(DecoratorNode):
             called.
     """
     def __init__(self, name: str, child: TreeNode = None) -> None:
-        super().__init__(name)
-        self.name = name
-        self.child_node = child
+        super().__init__(child, name)
 
     def tick(self) -> NodeStatus:
         """
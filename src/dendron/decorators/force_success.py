@@ -18,7 +18,7 @@ class ForceSuccess(DecoratorNode):
             variable is set prior to the first `tick()` call.
     """
     def __init__(self, name: str, child: TreeNode = None) -> None:
-        super().__init__(name, child)
+        super().__init__(child, name)
 
     def tick(self) -> NodeStatus:
         """
@@ -16,9 +16,7 @@ class Inverter(DecoratorNode):
             is set before the first `tick()` call.
     """
     def __init__(self, name, child : TreeNode = None) -> None:
-        super().__init__(name)
-        self.name = name
-        self.child_node = child 
+        super().__init__(child, name)
 
     def tick(self) -> NodeStatus:
         """
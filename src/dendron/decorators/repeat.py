@@ -19,7 +19,7 @@ class Repeat(DecoratorNode):
             to return `SUCCESS`.
     """
     def __init__(self, name : str, child : TreeNode, n_times : int) -> None:
-        super().__init__(name, child)
+        super().__init__(child, name)
         self.n_times = n_times
         self.repeat_ct = 0
 
@@ -28,7 +28,8 @@ class Repeat(DecoratorNode):
         Set the repeat counter to 0 and instruct the child node to reset.
         """
         self.repeat_ct = 0
-        self.child_node.reset()
+        self.reset_child()
+        self.dirty = False
 
     def tick(self) -> NodeStatus:
         """
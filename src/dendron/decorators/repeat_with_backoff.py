@@ -0,0 +1,82 @@
+from ..basic_types import NodeStatus
+from ..tree_node import TreeNode
+from ..decorator_node import DecoratorNode
+from ..timers import Backoff
+
+from typing import Optional
+
+class RepeatWithBackoff(DecoratorNode):
+    """
+    A non-blocking Repeat. Each tick runs the child at most once. While
+    the child keeps succeeding and fewer than `n_times` runs have
+    finished, the node returns `RUNNING`, waiting between runs for a 
+    delay given by its `Backoff` schedule. The wait is scheduled on the
+    tree's timer, so this node must be part of a `BehaviorTree`.
+
+    The node returns `FAILURE` as soon as the child fails, and `SUCCESS`
+    once the child has succeeded `n_times` times.
+
+    Args:
+        name (`str`):
+            The given name of this node.
+        child (`dendron.tree_node.TreeNode`):
+            The child node.
+        n_times (`int`):
+            The number of successful runs to make.
+        backoff (`Optional[dendron.timers.Backoff]`):
+            The schedule of delays between runs. Defaults to no delay, in
+            which case the next run happens on the next tick.
+    """
+    def __init__(self, name : str, child : TreeNode, n_times : int, backoff : Optional[Backoff] = None) -> None:
+        super().__init__(child, name)
+        self.n_times = n_times
+        self.backoff = backoff if backoff is not None else Backoff(initial=0.0, jitter="none")
+        self.repeat_ct = 0
+        self.wait_handle = None
+
+    def reset(self) -> None:
+        """
+        Cancel any pending wait, set the repeat counter to 0 and instruct
+        the child node to reset.
+        """
+        if self.wait_handle is not None:
+            self.tree.timer.cancel(self.wait_handle)
+            self.wait_handle = None
+        self.repeat_ct = 0
+        self.status = NodeStatus.IDLE
+        self.reset_child()
+        self.dirty = False
+
+    def _wake(self) -> None:
+        self.wait_handle = None
+
+    def tick(self) -> NodeStatus:
+        """
+        If waiting for the next run, return `RUNNING`. Otherwise tick the
+        child once. On success, schedule the next run and return 
+        `RUNNING`, or return `SUCCESS` if this was the last run.
+        """
+        if self.wait_handle is not None:
+            return NodeStatus.RUNNING
+
+        child_status = self.child_node.execute_tick()
+
+        match child_status:
+            case NodeStatus.SUCCESS:
+                self.repeat_ct += 1
+                self.reset_child()
+                if self.repeat_ct >= self.n_times:
+                    self.repeat_ct = 0
+                    return NodeStatus.SUCCESS
+                delay = self.backoff.delay(self.repeat_ct - 1)
+                if delay > 0:
+                    self.wait_handle = self.tree.timer.call_later(delay, self._wake)
+                return NodeStatus.RUNNING
+            case NodeStatus.FAILURE:
+                self.repeat_ct = 0
+                self.reset_child()
+                return NodeStatus.FAILURE
+            case NodeStatus.IDLE:
+                raise RuntimeError("Child can't return IDLE")
+            case _:
+                return child_status
@@ -19,7 +19,7 @@ class Retry(DecoratorNode):
             to return `FAILURE`.
     """
     def __init__(self, name: str, child: TreeNode, n_times: int) -> None:
-        super().__init__(self, child)
+        super().__init__(child, name)
         self.n_times = n_times
         self.retry_ct = 0
 
@@ -28,7 +28,8 @@ class Retry(DecoratorNode):
         Set the retry counter to 0 and instruct the child node to reset.
         """
         self.retry_ct = 0
-        self.child_node.reset()
+        self.reset_child()
+        self.dirty = False
 
     def tick(self) -> NodeStatus:
         """
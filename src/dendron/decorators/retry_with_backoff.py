@@ -0,0 +1,83 @@
+from ..basic_types import NodeStatus
+from ..tree_node import TreeNode
+from ..decorator_node import DecoratorNode
+from ..timers import Backoff
+
+from typing import Optional
+
+class RetryWithBackoff(DecoratorNode):
+    """
+    A non-blocking Retry. Each tick makes at most one attempt of the
+    child. When the child fails, the node waits for a delay given by
+    its `Backoff` schedule and returns `RUNNING` in the meantime, so 
+    other branches and other trees keep running while a flaky child 
+    waits to be retried. The wait is scheduled on the tree's timer, so
+    this node must be part of a `BehaviorTree`.
+
+    The node returns `SUCCESS` as soon as the child succeeds, and 
+    `FAILURE` once the child has failed `n_times` times.
+
+    Args:
+        name (`str`):
+            The given name of this node.
+        child (`dendron.tree_node.TreeNode`):
+            The child node.
+        n_times (`int`):
+            The number of attempts to make before giving up.
+        backoff (`Optional[dendron.timers.Backoff]`):
+            The schedule of delays between attempts. Defaults to 
+            `Backoff()`: exponential from 0.1 seconds with full jitter.
+    """
+    def __init__(self, name : str, child : TreeNode, n_times : int, backoff : Optional[Backoff] = None) -> None:
+        super().__init__(child, name)
+        self.n_times = n_times
+        self.backoff = backoff if backoff is not None else Backoff()
+        self.retry_ct = 0
+        self.wait_handle = None
+
+    def reset(self) -> None:
+        """
+        Cancel any pending wait, set the retry counter to 0 and instruct
+        the child node to reset.
+        """
+        if self.wait_handle is not None:
+            self.tree.timer.cancel(self.wait_handle)
+            self.wait_handle = None
+        self.retry_ct = 0
+        self.status = NodeStatus.IDLE
+        self.reset_child()
+        self.dirty = False
+
+    def _wake(self) -> None:
+        self.wait_handle = None
+
+    def tick(self) -> NodeStatus:
+        """
+        If waiting for the next attempt, return `RUNNING`. Otherwise tick
+        the child once. On failure, schedule the next attempt and return
+        `RUNNING`, or return `FAILURE` if no attempts are left.
+        """
+        if self.wait_handle is not None:
+            return NodeStatus.RUNNING
+
+        child_status = self.child_node.execute_tick()
+
+        match child_status:
+            case NodeStatus.SUCCESS:
+                self.retry_ct = 0
+                self.reset_child()
+                return NodeStatus.SUCCESS
+            case NodeStatus.FAILURE:
+                self.retry_ct += 1
+                self.reset_child()
+                if self.retry_ct >= self.n_times:
+                    self.retry_ct = 0
+                    return NodeStatus.FAILURE
+                delay = self.backoff.delay(self.retry_ct - 1)
+                if delay > 0:
+                    self.wait_handle = self.tree.timer.call_later(delay, self._wake)
+                return NodeStatus.RUNNING
+            case NodeStatus.IDLE:
+                raise RuntimeError("Child can't return IDLE")
+            case _:
+                return child_status
@@ -16,7 +16,7 @@ class RunOnce(DecoratorNode):
             The child node.
     """
     def __init__(self, name: str, child: TreeNode) -> None:
-        super().__init__(name, child)
+        super().__init__(child, name)
         self.has_run = False
 
     def reset(self) -> None:
@@ -27,6 +27,7 @@ class RunOnce(DecoratorNode):
         self.has_run = False
         self.status = NodeStatus.IDLE
         self.child_node.reset_status()
+        self.dirty = False
 
     def tick(self) -> NodeStatus:
         """
@@ -0,0 +1,76 @@
+from ..basic_types import NodeType, NodeStatus
+from ..blackboard import Blackboard
+from ..blackboard_view import BlackboardView
+from ..tree_node import TreeNode
+from ..decorator_node import DecoratorNode
+
+from typing import Any, Dict, Optional
+
+class SubTree(DecoratorNode):
+    """
+    The SubTree decorator marks the root of a reused subtree and gives
+    the subtree its own view of the blackboard (see
+    `dendron.blackboard_view.BlackboardView`), so that the same subtree
+    can run with different bindings of its keys. The subtree reads and
+    writes its local key names; each local key in `remapping` is
+    translated to the parent key it maps to, and each key in `values` is
+    bound to a constant. No values are copied, and every SubTree shares
+    the parent blackboard.
+
+    The `BehaviorTreeFactory` creates SubTree nodes for Groot `SubTree`
+    elements with port attributes: `port="{parent_key}"` remaps `port`,
+    and `port="text"` binds it to a constant.
+
+    Args:
+        name (`str`):
+            The given name of this node.
+        child (`dendron.tree_node.TreeNode`):
+            The root of the subtree.
+        remapping (`Optional[Dict[Any, Any]]`):
+            A map from the subtree's keys to keys of the parent blackboard.
+        values (`Optional[Dict[Any, Any]]`):
+            Constant values for keys of the subtree.
+        isolated (`bool`):
+            Whether the subtree's other keys are kept out of the parent
+            blackboard. Defaults to `False`, in which case they pass
+            through unchanged.
+    """
+    def __init__(self, name : str, child : TreeNode, remapping : Optional[Dict[Any, Any]] = None, values : Optional[Dict[Any, Any]] = None, isolated : bool = False) -> None:
+        super().__init__(child, name)
+        self.remapping = dict(remapping or {})
+        self.values = dict(values or {})
+        self.isolated = isolated
+        # holds the constants and isolated keys, and survives changes of
+        # the parent blackboard.
+        self.local = Blackboard()
+        self.view = None
+
+    def node_type(self) -> NodeType:
+        """
+        Return this node's type.
+        """
+        return NodeType.SUBTREE
+
+    def set_blackboard(self, bb : Blackboard) -> None:
+        """
+        Set the parent blackboard, and give the subtree a view of it.
+
+        Args:
+            bb (`dendron.blackboard.Blackboard`):
+                The parent blackboard.
+        """
+        self.blackboard = bb
+        self.view = BlackboardView(bb, self.remapping, self.values, self.isolated, self.local)
+        if self.child_node is not None:
+            self.child_node.set_blackboard(self.view)
+
+    def set_child(self, child : TreeNode) -> None:
+        super().set_child(child)
+        if self.view is not None:
+            child.set_blackboard(self.view)
+
+    def tick(self) -> NodeStatus:
+        """
+        Tick the root of the subtree and return its status.
+        """
+        return self.child_node.execute_tick()
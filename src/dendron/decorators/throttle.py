@@ -0,0 +1,45 @@
+from ..basic_types import NodeStatus
+from ..tree_node import TreeNode
+from ..decorator_node import DecoratorNode
+
+class Throttle(DecoratorNode):
+    """
+    The throttle decorator ticks its child at most once every `period`
+    milliseconds. Ticks that arrive sooner return `RUNNING` without 
+    ticking the child. This bounds the rate at which an expensive child,
+    such as a language model condition that is polled, does work.
+
+    The rate limit holds across resets of this node, so a child that 
+    finishes quickly is still not started again before the period is up.
+    The period is scheduled on the tree's timer, so this node must be 
+    part of a `BehaviorTree`.
+
+    Args:
+        name (`str`):
+            The given name of this node.
+        child (`dendron.tree_node.TreeNode`):
+            The child of this node.
+        period (`int`):
+            The integer number of *milliseconds* between ticks of the 
+            child.
+    """
+    def __init__(self, name : str, child : TreeNode, period : int) -> None:
+        super().__init__(child, name)
+        self.period = period
+        self.wait_handle = None
+
+    def _wake(self) -> None:
+        self.wait_handle = None
+
+    def tick(self) -> NodeStatus:
+        """
+        If the child was ticked less than `period` milliseconds ago, 
+        return `RUNNING`. Otherwise tick the child and return its status.
+        """
+        if self.wait_handle is not None:
+            return NodeStatus.RUNNING
+
+        timer = self.tree.timer
+        if self.period > 0:
+            self.wait_handle = timer.call_at(timer.now() + self.period / 1000, self._wake)
+        return self.child_node.execute_tick()
@@ -2,15 +2,21 @@ from ..basic_types import NodeType, NodeStatus
 from ..tree_node import TreeNode
 from ..decorator_node import DecoratorNode
 
-import time
-
 class Timeout(DecoratorNode):
     """
-    The timeout decorator ticks its child and starts a timer. The next time
-    it receives a tick it will check its timer against the time limit. If 
-    the elapsed time exceeds the limit, this node returns `FAILURE`.
+    The timeout decorator ticks its child with a time limit. When the
+    child is first ticked, the node sets a deadline of `timelimit` 
+    milliseconds from then, on the clock of the tree's timer, and 
+    publishes it to the subtree while the child is ticking (see
+    `BehaviorTree.push_deadline`). Once the deadline has passed, the 
+    child is halted and this node returns `FAILURE`.
 
-    This is primarily useful for nodes that are executing asynchronously.
+    The deadline is honored inside the subtree, so the limit bounds how
+    long a tick can take rather than only being checked afterwards:
+    language model nodes stop generating when the deadline passes, and
+    asynchronous nodes cancel their pending futures. The deadline is also
+    scheduled on the tree's timer, so a tree waiting in 
+    `BehaviorTree.tick_while_running` wakes up when it passes.
 
     Args:
         name (`str`):
@@ -22,36 +28,61 @@ class Timeout(DecoratorNode):
             failure.
     """
     def __init__(self, name: str, child: TreeNode, timelimit: int) -> None:
-        super().__init__(name, child)
+        super().__init__(child, name)
         self.timelimit = timelimit
         self.timer_started = False
-        self.start_time = 0 # this is an int in millis.
+        self.deadline = None
+        self.expiry_handle = None
+        self.expired = False
+
+    def _stop_timer(self) -> None:
+        if self.expiry_handle is not None:
+            self.tree.timer.cancel(self.expiry_handle)
+            self.expiry_handle = None
+        self.timer_started = False
+        self.expired = False
+
+    def _expire(self) -> None:
+        self.expiry_handle = None
+        self.expired = True
 
     def reset(self) -> None:
         """
         Reset the timer and instruct the child node to reset.
         """
-        self.timer_started = False
-        self.start_time = 0
+        self._stop_timer()
+        self.deadline = None
         self.reset_child()
+        self.dirty = False
 
     def tick(self) -> NodeStatus:
         """
         Tick the child node, but with a time limit. If the time limit
-        is exceeded, return `FAILURE`.
+        is exceeded, halt the child and return `FAILURE`.
         """
+        timer = self.tree.timer
         if not self.timer_started:
             self.timer_started = True
             self.set_status(NodeStatus.RUNNING)
-            self.start_time = time.time_ns()
-
-        child_status = self.child_node.execute_tick()
+            self.deadline = timer.now() + self.timelimit / 1000
+            self.expiry_handle = timer.call_at(self.deadline, self._expire)
 
-        elapsed_ms = (time.time_ns() - self.start_time)/1e6
-        if elapsed_ms > self.timelimit:
+        if self.expired:
+            self.halt_child()
+            self._stop_timer()
             return NodeStatus.FAILURE
-        else:
-            return child_status
 
+        self.tree.push_deadline(self.deadline)
+        try:
+            child_status = self.child_node.execute_tick()
+        finally:
+            self.tree.pop_deadline()
 
+        if timer.now() > self.deadline:
+            if child_status == NodeStatus.RUNNING:
+                self.halt_child()
+            child_status = NodeStatus.FAILURE
 
+        if child_status != NodeStatus.RUNNING:
+            self._stop_timer()
+        return child_status
@@ -0,0 +1,223 @@
+from typing import Any, Iterator, Optional, Tuple
+
+import numbers
+
+import numpy as np
+
+class HistoryBuffer:
+    """
+    A fixed-capacity ring buffer of timestamped values, as kept by
+    `BlackboardHistory`. Once the buffer is full, each new value
+    overwrites the oldest one, so memory stays constant no matter how
+    long the tree runs.
+
+    Values are stored in a NumPy array whose layout is set by the first
+    value: numbers and NumPy scalars go in an array of their dtype, NumPy
+    arrays in an array of their shape and dtype with one row per value,
+    and anything else in an array of objects. Unless `dtype` is given, a
+    later value that the array cannot hold as it is widens the dtype (as
+    `np.result_type` does, so an int history that sees a float becomes a
+    float history), or turns a history of numbers into one of objects. An
+    array of a different shape raises `ValueError`. Appending is O(1), and
+    window queries (`last`, `between`) return arrays in time order built
+    from at most two slices of the buffer.
+
+    Args:
+        capacity (`int`):
+            The largest number of values kept.
+        dtype (`Optional[Any]`):
+            The NumPy dtype of the values, which they are converted to.
+            Defaults to the dtype of the first value, widened as needed.
+    """
+
+    def __init__(self, capacity : int, dtype : Optional[Any] = None) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        self.values_array : Optional[np.ndarray] = None
+        self.times_array = np.zeros(capacity, dtype=np.float64)
+        # the index the next value goes to, and the number of values held.
+        self.head = 0
+        self.size = 0
+        # the number of values ever appended, including overwritten ones.
+        self.n_appended = 0
+        # Python types whose values the array is known to hold as they are.
+        self.fitting_types = set()
+
+    def _allocate(self, value : Any) -> None:
+        if isinstance(value, np.ndarray):
+            shape = value.shape
+            dtype = self.dtype or value.dtype
+        elif isinstance(value, (numbers.Number, np.generic)) and not isinstance(value, complex):
+            shape = ()
+            dtype = self.dtype or np.asarray(value).dtype
+        else:
+            shape = ()
+            dtype = self.dtype or np.dtype(object)
+        self.values_array = np.zeros((self.capacity,) + shape, dtype=dtype)
+
+    def _fit(self, value : Any) -> None:
+        # Widen the array, if needed, so that it holds `value` exactly.
+        array = self.values_array
+        if isinstance(value, np.ndarray):
+            if value.shape != array.shape[1:]:
+                raise ValueError(f"history holds values of shape {array.shape[1:]}, not {value.shape}")
+            if value.dtype == array.dtype:
+                return
+            dtype = value.dtype
+        elif array.ndim > 1:
+            raise ValueError(f"history holds arrays of shape {array.shape[1:]}, not {type(value).__name__}")
+        elif array.dtype == object:
+            return
+        elif type(value) in self.fitting_types:
+            return
+        elif isinstance(value, (numbers.Number, np.generic)) and not isinstance(value, complex):
+            dtype = np.asarray(value).dtype
+        else:
+            dtype = np.dtype(object)
+
+        new_dtype = np.result_type(array.dtype, dtype)
+        if new_dtype != array.dtype:
+            self.values_array = array.astype(new_dtype)
+            self.fitting_types.clear()
+        # any int may be too large for the dtype, so ints are always checked.
+        if not isinstance(value, (np.ndarray, int)):
+            self.fitting_types.add(type(value))
+
+    def append(self, value : Any, t : float = 0.0) -> None:
+        """
+        Add a value, overwriting the oldest one if the buffer is full.
+
+        Args:
+            value (`Any`):
+                The value.
+            t (`float`):
+                The time the value was observed. Times must not decrease
+                from one value to the next.
+        """
+        if self.values_array is None:
+            self._allocate(value)
+        elif self.dtype is None:
+            self._fit(value)
+        head = self.head
+        self.values_array[head] = value
+        self.times_array[head] = t
+        head += 1
+        self.head = 0 if head == self.capacity else head
+        if self.size < self.capacity:
+            self.size += 1
+        self.n_appended += 1
+
+    def clear(self) -> None:
+        """
+        Drop every value. The layout of the buffer is kept.
+        """
+        self.head = 0
+        self.size = 0
+        self.n_appended = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _window(self, array : np.ndarray, start : int, stop : int) -> np.ndarray:
+        # Entries start to stop (in time order, oldest first) of array.
+        first = self.head - self.size
+        start += first
+        stop += first
+        if start >= 0 or stop <= 0:
+            # one slice, possibly wrapped around as a whole.
+            if start < 0:
+                start += self.capacity
+                stop += self.capacity
+            return array[start:stop].copy()
+        return np.concatenate((array[start + self.capacity:], array[:stop]))
+
+    def _range(self, start : int, stop : int) -> Tuple[np.ndarray, np.ndarray]:
+        if self.values_array is None:
+            return np.zeros(0), np.zeros(0)
+        return self._window(self.values_array, start, stop), self._window(self.times_array, start, stop)
+
+    def values(self) -> np.ndarray:
+        """
+        Get every value held, oldest first.
+
+        Returns:
+            `np.ndarray`: The values.
+        """
+        return self._range(0, self.size)[0]
+
+    def times(self) -> np.ndarray:
+        """
+        Get the time of every value held, oldest first.
+
+        Returns:
+            `np.ndarray`: The times.
+        """
+        return self._range(0, self.size)[1]
+
+    def last(self, k : int) -> np.ndarray:
+        """
+        Get the latest `k` values, oldest first.
+
+        Args:
+            k (`int`):
+                The number of values. If fewer are held, all are returned.
+
+        Returns:
+            `np.ndarray`: The values.
+        """
+        k = max(0, min(k, self.size))
+        return self._range(self.size - k, self.size)[0]
+
+    def between(self, t0 : float, t1 : float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the values observed at times `t` with `t0 <= t < t1`, oldest
+        first. The bounds are found by binary search.
+
+        Args:
+            t0 (`float`):
+                The start of the time range.
+            t1 (`float`):
+                The end of the time range.
+
+        Returns:
+            `Tuple[np.ndarray, np.ndarray]`: The values and their times.
+        """
+        start = self._search(t0)
+        stop = max(start, self._search(t1))
+        return self._range(start, stop)
+
+    def _search(self, t : float) -> int:
+        # The number of values held that are older than t. The buffer
+        # holds two sorted runs: the older one ends at the end of the
+        # array (if the buffer has wrapped), the newer one starts at 0.
+        first = self.head - self.size
+        if first >= 0:
+            return int(np.searchsorted(self.times_array[first:self.head], t))
+        older = self.times_array[first + self.capacity:]
+        n_older = int(np.searchsorted(older, t))
+        if n_older < len(older):
+            return n_older
+        return len(older) + int(np.searchsorted(self.times_array[:self.head], t))
+
+    def __getitem__(self, i : int) -> Any:
+        """
+        Get a value by its position in time order. Negative positions
+        count back from the latest value.
+
+        Args:
+            i (`int`):
+                The position.
+
+        Returns:
+            `Any`: The value.
+        """
+        if i < 0:
+            i += self.size
+        if not 0 <= i < self.size:
+            raise IndexError("history index out of range")
+        return self.values_array[(self.head - self.size + i) % self.capacity]
+
+    def __iter__(self) -> Iterator:
+        return iter(self.values())
@@ -0,0 +1,5 @@
+from .tracer import Tracer, TracerGroup
+from .tick_tracer import TraceEvent, TickTracer, TraceDecoder
+from .chrome_trace import ChromeTracer
+from .node_stats import LatencyHistogram, NodeStats, NodeStatsCollector
+from .metrics import MetricsExporter
@@ -0,0 +1,132 @@
+from ..basic_types import NodeStatus
+from .tracer import Tracer
+
+from typing import Callable, Dict, List
+
+import itertools
+import json
+import os
+import threading
+import time
+
+import typing
+TreeNode = typing.NewType("TreeNode", None)
+
+class ChromeTracer(Tracer):
+    """
+    A tracer that records the execution of a tree as Chrome Trace Event
+    JSON, which can be opened in Perfetto (https://ui.perfetto.dev) or 
+    `chrome://tracing`.
+
+    Every tick of the tree and every `execute_tick` of a node becomes a
+    nested span on the lane of the thread that ran it. Every job that a
+    node submits to the tree's executor becomes a span on the lane of the
+    pool worker that ran it, an async "queued" span covering the time the 
+    job waited for a worker, and a flow arrow from the submitting node to
+    the job. Lanes are labelled with thread names.
+
+    Events are kept in memory until `save` is called.
+    """
+
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+        self.paths : Dict[int, str] = {}
+        self.thread_names : Dict[int, str] = {}
+        # (phase, name, category, timestamp ns, thread id, extra)
+        self.events : List[tuple] = []
+        self._job_ids = itertools.count()
+        self._clock = time.perf_counter_ns
+        self._origin = self._clock()
+
+    def register_node(self, node : TreeNode, path : str) -> None:
+        self.paths[node.node_id] = path
+
+    def _thread_id(self) -> int:
+        tid = threading.get_ident()
+        if tid not in self.thread_names:
+            self.thread_names[tid] = threading.current_thread().name
+        return tid
+
+    def begin_tick(self) -> None:
+        self.events.append(("B", "tick", "tree", self._clock(), self._thread_id(), None))
+
+    def end_tick(self, status : NodeStatus) -> None:
+        self.events.append(("E", "tick", "tree", self._clock(), self._thread_id(), {"status" : status.name}))
+
+    def pre_tick(self, node : TreeNode) -> None:
+        self.events.append(("B", self.paths.get(node.node_id, node.name), "node", self._clock(), self._thread_id(), None))
+
+    def post_tick(self, node : TreeNode, status : NodeStatus) -> None:
+        self.events.append(("E", self.paths.get(node.node_id, node.name), "node", self._clock(), self._thread_id(), {"status" : status.name}))
+
+    def wrap_job(self, node : TreeNode, fn : Callable) -> Callable:
+        job_id = next(self._job_ids)
+        name = f"{self.paths.get(node.node_id, node.name)} job"
+        events = self.events
+        clock = self._clock
+
+        submitted = clock()
+        submit_tid = self._thread_id()
+        events.append(("b", "queued", "executor", submitted, submit_tid, {"id" : job_id}))
+        events.append(("s", name, "executor", submitted, submit_tid, {"id" : job_id}))
+
+        def traced_job(*args, **kwargs):
+            started = clock()
+            tid = self._thread_id()
+            events.append(("e", "queued", "executor", started, submit_tid, {"id" : job_id}))
+            events.append(("B", name, "executor", started, tid, None))
+            events.append(("f", name, "executor", started, tid, {"id" : job_id}))
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                events.append(("E", name, "executor", clock(), tid, None))
+
+        return traced_job
+
+    def clear(self) -> None:
+        """
+        Discard all recorded events.
+        """
+        self.events = []
+
+    def trace_events(self) -> List[dict]:
+        """
+        Convert the recorded events into Chrome Trace Event dictionaries.
+
+        Returns:
+            `List[dict]`: The events, including thread-name metadata.
+        """
+        out = [
+            {"ph" : "M", "name" : "process_name", "pid" : self.pid, "tid" : 0, "args" : {"name" : "dendron"}}
+        ]
+        for tid, thread_name in self.thread_names.items():
+            out.append({"ph" : "M", "name" : "thread_name", "pid" : self.pid, "tid" : tid, "args" : {"name" : thread_name}})
+
+        for phase, name, category, timestamp, tid, extra in list(self.events):
+            event = {
+                "ph" : phase,
+                "name" : name,
+                "cat" : category,
+                "ts" : (timestamp - self._origin) / 1000.0,
+                "pid" : self.pid,
+                "tid" : tid,
+            }
+            if phase in ("b", "e", "s", "f"):
+                event["id"] = extra["id"]
+                if phase == "f":
+                    event["bp"] = "e"
+            elif extra is not None:
+                event["args"] = extra
+            out.append(event)
+        return out
+
+    def save(self, filename : str) -> None:
+        """
+        Write the trace to a JSON file.
+
+        Args:
+            filename (`str`):
+                The file to write.
+        """
+        with open(filename, "w") as f:
+            json.dump({"traceEvents" : self.trace_events(), "displayTimeUnit" : "ns"}, f)
@@ -0,0 +1,234 @@
+from ..basic_types import NodeStatus
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+import os
+import tempfile
+import threading
+
+import typing
+BehaviorTree = typing.NewType("BehaviorTree", None)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+def _escape(value : str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+def _model_memory_bytes(lm) -> Optional[int]:
+    model = getattr(lm, "model", None)
+    if model is None:
+        return None
+    if hasattr(model, "get_memory_footprint"):
+        return int(model.get_memory_footprint())
+    if hasattr(model, "parameters"):
+        tensors = list(model.parameters()) + list(model.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
+    return None
+
+class MetricsExporter:
+    """
+    Exposes the load of a `BehaviorTree` as metrics in the OpenMetrics
+    text format (or the older Prometheus text format), either over HTTP
+    with `serve` or by writing a file for a textfile collector with
+    `write_textfile`.
+
+    The exporter turns on the tree's statistics (see
+    `BehaviorTree.enable_stats`) and reports:
+
+    - `dendron_ticks_total`: ticks of the tree, by status. Use `rate()`
+      to get the tick rate.
+    - `dendron_tick_latency_seconds`: a summary of tick latency.
+    - `dendron_node_latency_seconds`: a summary of tick latency per node
+      path.
+    - `dendron_node_ticks_total`: ticks per node path and status.
+    - `dendron_running_nodes`: nodes whose last status is `RUNNING`.
+    - `dendron_executor_queue_depth`: jobs waiting for a worker of the
+      tree's executor.
+    - `dendron_executor_workers`: the size of the executor.
+    - `dendron_model_memory_bytes`: memory used by each model in the
+      tree's model registry.
+    - `dendron_lm_tokens_total`: tokens sent to (`direction="in"`) and
+      generated by (`direction="out"`) language model nodes. Use
+      `rate()` to get tokens per second.
+
+    Metrics are computed when they are scraped, so an idle exporter
+    costs nothing beyond the statistics themselves.
+
+    Args:
+        tree (`dendron.behavior_tree.BehaviorTree`):
+            The tree to export metrics for.
+        namespace (`str`):
+            The prefix of every metric name. Defaults to "dendron".
+    """
+
+    def __init__(self, tree : BehaviorTree, namespace : str = "dendron") -> None:
+        self.tree = tree
+        self.namespace = namespace
+        self.server = None
+        self.server_thread = None
+        tree.enable_stats()
+
+    def render(self, openmetrics : bool = True) -> str:
+        """
+        Render the current metrics.
+
+        Args:
+            openmetrics (`bool`):
+                If `True`, use the OpenMetrics text format. Otherwise use
+                the Prometheus text format, version 0.0.4, which is what
+                the node exporter's textfile collector reads. Defaults to
+                `True`.
+
+        Returns:
+            `str`: The metrics exposition.
+        """
+        tree = self.tree
+        ns = self.namespace
+        lines : List[str] = []
+
+        def family(name, kind, help_text):
+            # OpenMetrics names counter families without the _total suffix.
+            family_name = name[:-len("_total")] if openmetrics and kind == "counter" else name
+            lines.append(f"# HELP {family_name} {help_text}")
+            lines.append(f"# TYPE {family_name} {kind}")
+
+        def sample(name, value, **labels):
+            lines.append(f"{name}{_labels(**labels)} {value}")
+
+        def summary(name, latency, **labels):
+            for q in QUANTILES:
+                v = latency.percentile(q)
+                if v is not None:
+                    sample(name, v / 1e9, quantile=q, **labels)
+            sample(f"{name}_sum", latency.total / 1e9, **labels)
+            sample(f"{name}_count", latency.count, **labels)
+
+        collector = tree.node_stats
+        if collector is not None:
+            ticks = collector.ticks
+            family(f"{ns}_ticks_total", "counter", "Ticks of the tree, by root status.")
+            for status, n in list(ticks.status_counts.items()):
+                sample(f"{ns}_ticks_total", n, tree=tree.tree_name, status=status.name)
+
+            family(f"{ns}_tick_latency_seconds", "summary", "Latency of a tick of the tree.")
+            summary(f"{ns}_tick_latency_seconds", ticks.latency, tree=tree.tree_name)
+
+            node_stats = list(collector.stats.items())
+
+            family(f"{ns}_node_latency_seconds", "summary", "Latency of a tick of a node.")
+            for path, stats in node_stats:
+                if stats.tick_count:
+                    summary(f"{ns}_node_latency_seconds", stats.latency, tree=tree.tree_name, path=path)
+
+            family(f"{ns}_node_ticks_total", "counter", "Ticks of a node, by status.")
+            for path, stats in node_stats:
+                for status, n in list(stats.status_counts.items()):
+                    sample(f"{ns}_node_ticks_total", n, tree=tree.tree_name, path=path, status=status.name)
+
+            family(f"{ns}_lm_tokens_total", "counter", "Tokens sent to and generated by language model nodes.")
+            for path, stats in node_stats:
+                if stats.tokens_in or stats.tokens_out:
+                    sample(f"{ns}_lm_tokens_total", stats.tokens_in, tree=tree.tree_name, path=path, direction="in")
+                    sample(f"{ns}_lm_tokens_total", stats.tokens_out, tree=tree.tree_name, path=path, direction="out")
+
+        family(f"{ns}_running_nodes", "gauge", "Nodes whose last status is RUNNING.")
+        running = sum(1 for node in list(tree.node_paths) if node.status == NodeStatus.RUNNING)
+        sample(f"{ns}_running_nodes", running, tree=tree.tree_name)
+
+        family(f"{ns}_executor_queue_depth", "gauge", "Jobs waiting for a worker of the tree's executor.")
+        sample(f"{ns}_executor_queue_depth", tree.n_queued_jobs, tree=tree.tree_name)
+
+        family(f"{ns}_executor_workers", "gauge", "Worker threads of the tree's executor.")
+        sample(f"{ns}_executor_workers", tree.num_workers, tree=tree.tree_name)
+
+        family(f"{ns}_model_memory_bytes", "gauge", "Memory used by a model in the tree's model registry.")
+        for name, lm in list(tree.models.items()):
+            n_bytes = _model_memory_bytes(lm)
+            if n_bytes is not None:
+                sample(f"{ns}_model_memory_bytes", n_bytes, tree=tree.tree_name, model=name)
+
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, filename : str) -> None:
+        """
+        Write the current metrics in the Prometheus text format to
+        `filename`, for the node exporter's textfile collector. The file
+        is replaced atomically, so the collector never reads a partial
+        file.
+
+        Args:
+            filename (`str`):
+                The file to write. Should end in `.prom`.
+        """
+        text = self.render(openmetrics=False)
+        directory = os.path.dirname(os.path.abspath(filename))
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".dendron-metrics-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(text)
+            os.replace(tmp_name, filename)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def serve(self, port : int = 9464, host : str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Serve the metrics over HTTP from a daemon thread. Every path
+        returns the metrics; the OpenMetrics format is used if the
+        scraper asks for it in its `Accept` header.
+
+        Args:
+            port (`int`):
+                The port to listen on. Use 0 to pick a free port. Defaults
+                to 9464.
+            host (`str`):
+                The address to listen on. Defaults to "127.0.0.1".
+
+        Returns:
+            `http.server.ThreadingHTTPServer`: The server. Its
+            `server_address` holds the address actually bound.
+        """
+        if self.server is not None:
+            raise RuntimeError("the metrics server is already running")
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+                body = exporter.render(openmetrics=openmetrics).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.server_thread = threading.Thread(target=self.server.serve_forever, name="dendron-metrics", daemon=True)
+        self.server_thread.start()
+        return self.server
+
+    def stop(self) -> None:
+        """
+        Stop the HTTP server started by `serve`, if any.
+        """
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server_thread.join()
+            self.server = None
+            self.server_thread = None
@@ -0,0 +1,288 @@
+from ..basic_types import NodeStatus
+from .tracer import Tracer
+
+from typing import Dict, Iterator, Optional, Tuple
+
+import time
+
+import typing
+TreeNode = typing.NewType("TreeNode", None)
+
+class LatencyHistogram:
+    """
+    A histogram of non-negative integer values (typically durations in
+    nanoseconds) with log-linear buckets, in the style of HdrHistogram.
+
+    Values below `2 ** sub_bucket_bits` are counted exactly. Above that,
+    every power-of-two range is split into `2 ** (sub_bucket_bits - 1)`
+    equal buckets, so the relative error of any reported value is at most
+    `2 ** -(sub_bucket_bits - 1)` (about 1.6% with the default of 7 bits)
+    while the number of buckets only grows with the logarithm of the
+    largest value. Buckets are stored sparsely, so an idle node costs
+    almost nothing.
+
+    Args:
+        sub_bucket_bits (`int`):
+            Controls the precision of the histogram. Defaults to 7.
+    """
+
+    def __init__(self, sub_bucket_bits : int = 7) -> None:
+        if sub_bucket_bits < 2:
+            raise ValueError("sub_bucket_bits must be at least 2")
+        self.sub_bucket_bits = sub_bucket_bits
+        self.half_bits = sub_bucket_bits - 1
+        self.counts : Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _index(self, value : int) -> int:
+        shift = value.bit_length() - self.sub_bucket_bits
+        if shift <= 0:
+            return value
+        return (shift << self.half_bits) + (value >> shift)
+
+    def bucket_bounds(self, index : int) -> Tuple[int, int]:
+        """
+        Get the smallest and largest value counted in a bucket.
+
+        Args:
+            index (`int`):
+                The bucket index.
+
+        Returns:
+            `Tuple[int, int]`: The inclusive bounds of the bucket.
+        """
+        if index < (1 << self.sub_bucket_bits):
+            return index, index
+        shift = (index >> self.half_bits) - 1
+        top = index - (shift << self.half_bits)
+        return top << shift, ((top + 1) << shift) - 1
+
+    def record(self, value : int) -> None:
+        """
+        Count one occurrence of `value`.
+
+        Args:
+            value (`int`):
+                The value to record. Must be non-negative.
+        """
+        idx = self._index(value)
+        counts = self.counts
+        counts[idx] = counts.get(idx, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other : "LatencyHistogram") -> None:
+        """
+        Add the counts of another histogram with the same precision to
+        this one.
+
+        Args:
+            other (`LatencyHistogram`):
+                The histogram to merge in.
+        """
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("cannot merge histograms with different precision")
+        for idx, n in other.counts.items():
+            self.counts[idx] = self.counts.get(idx, 0) + n
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def buckets(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Iterate over the non-empty buckets in increasing order.
+
+        Returns:
+            `Iterator[Tuple[int, int, int]]`: The lower bound, upper bound
+            and count of each bucket.
+        """
+        for idx in sorted(self.counts):
+            low, high = self.bucket_bounds(idx)
+            yield low, high, self.counts[idx]
+
+    def percentile(self, q : float) -> Optional[int]:
+        """
+        Get the value below which a fraction `q` of the recorded values
+        fall. The result is the upper bound of the bucket that holds that
+        value, clamped to the recorded range.
+
+        Args:
+            q (`float`):
+                The quantile, between 0 and 1.
+
+        Returns:
+            `Optional[int]`: The value, or `None` if nothing was recorded.
+        """
+        if self.count == 0:
+            return None
+        target = max(1, min(self.count, int(q * self.count + 0.5)))
+        seen = 0
+        for low, high, n in self.buckets():
+            seen += n
+            if seen >= target:
+                return max(self.min, min(high, self.max))
+        return self.max
+
+    def mean(self) -> Optional[float]:
+        """
+        Get the exact mean of the recorded values.
+
+        Returns:
+            `Optional[float]`: The mean, or `None` if nothing was recorded.
+        """
+        return self.total / self.count if self.count else None
+
+    def reset(self) -> None:
+        """
+        Discard all recorded values.
+        """
+        self.counts.clear()
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+class NodeStats:
+    """
+    The statistics kept for one node path: a latency histogram of its
+    `execute_tick` calls in nanoseconds, how often it returned each
+    status, and how many tokens it sent to and received from a language
+    model.
+    """
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.status_counts : Dict[NodeStatus, int] = {}
+        self.tokens_in = 0
+        self.tokens_out = 0
+        # monotonic time of the current tick's start, in ns.
+        self.start = 0
+
+    @property
+    def tick_count(self) -> int:
+        return self.latency.count
+
+    def summary(self) -> dict:
+        """
+        Summarize these statistics as a plain dictionary. Latencies are
+        given in seconds.
+
+        Returns:
+            `dict`: A dictionary with keys `count`, `p50`, `p95`, `p99`,
+            `max`, `mean`, `status_counts` (keyed by status name),
+            `tokens_in` and `tokens_out`.
+        """
+        h = self.latency
+
+        def seconds(ns):
+            return None if ns is None else ns / 1e9
+
+        return {
+            "count" : h.count,
+            "p50" : seconds(h.percentile(0.50)),
+            "p95" : seconds(h.percentile(0.95)),
+            "p99" : seconds(h.percentile(0.99)),
+            "max" : seconds(h.max),
+            "mean" : seconds(h.mean()),
+            "status_counts" : {s.name : n for s, n in self.status_counts.items()},
+            "tokens_in" : self.tokens_in,
+            "tokens_out" : self.tokens_out,
+        }
+
+class NodeStatsCollector(Tracer):
+    """
+    A tracer that times every `execute_tick` with a monotonic clock and
+    keeps a `NodeStats` for every node path. Ticks of the whole tree are
+    counted and timed in `ticks`. `BehaviorTree.enable_stats` attaches 
+    one of these, and `BehaviorTree.stats` reports from it.
+
+    Statistics are keyed by path, so a node that is moved or renamed
+    starts a new entry, and a node that is removed keeps its entry until
+    `reset` is called.
+    """
+
+    wants_tokens = True
+
+    def __init__(self) -> None:
+        self.stats : Dict[str, NodeStats] = {}
+        self._by_id : Dict[int, NodeStats] = {}
+        self.ticks = NodeStats()
+        self._clock = time.monotonic_ns
+
+    def register_node(self, node : TreeNode, path : str) -> None:
+        stats = self.stats.get(path)
+        if stats is None:
+            stats = self.stats[path] = NodeStats()
+        self._by_id[node.node_id] = stats
+
+    def begin_tick(self) -> None:
+        self.ticks.start = self._clock()
+
+    def end_tick(self, status : NodeStatus) -> None:
+        ticks = self.ticks
+        ticks.latency.record(self._clock() - ticks.start)
+        ticks.status_counts[status] = ticks.status_counts.get(status, 0) + 1
+
+    # The per-node hooks run for every node tick, so the start time is
+    # kept on the NodeStats and post_tick inlines LatencyHistogram.record.
+    def pre_tick(self, node : TreeNode) -> None:
+        self._by_id[node.node_id].start = self._clock()
+
+    def post_tick(self, node : TreeNode, status : NodeStatus) -> None:
+        end = self._clock()
+        stats = self._by_id[node.node_id]
+        h = stats.latency
+        value = end - stats.start
+        shift = value.bit_length() - h.sub_bucket_bits
+        idx = value if shift <= 0 else (shift << h.half_bits) + (value >> shift)
+        counts = h.counts
+        counts[idx] = counts.get(idx, 0) + 1
+        h.count += 1
+        h.total += value
+        if h.max is None or value > h.max:
+            h.max = value
+        if h.min is None or value < h.min:
+            h.min = value
+        counts = stats.status_counts
+        counts[status] = counts.get(status, 0) + 1
+
+    def record_tokens(self, node : TreeNode, tokens_in : int, tokens_out : int) -> None:
+        stats = self._by_id.get(node.node_id)
+        if stats is not None:
+            stats.tokens_in += tokens_in
+            stats.tokens_out += tokens_out
+
+    def summary(self) -> Dict[str, dict]:
+        """
+        Summarize the statistics of every node path that has been ticked
+        or has used a language model.
+
+        Returns:
+            `Dict[str, dict]`: A map from node path to `NodeStats.summary`.
+        """
+        return {
+            path : s.summary() for path, s in self.stats.items()
+            if s.tick_count or s.tokens_in or s.tokens_out
+        }
+
+    def reset(self) -> None:
+        """
+        Discard all statistics. Nodes currently in the tree keep their
+        entries, emptied.
+        """
+        for stats in [self.ticks, *self._by_id.values()]:
+            stats.latency.reset()
+            stats.status_counts.clear()
+            stats.tokens_in = 0
+            stats.tokens_out = 0
+        live = set(map(id, self._by_id.values()))
+        self.stats = {p : s for p, s in self.stats.items() if id(s) in live}
@@ -0,0 +1,298 @@
+from ..basic_types import NodeStatus
+from .tracer import Tracer
+
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Dict, Iterator, List, Optional
+
+import itertools
+import json
+import mmap
+import struct
+import threading
+import time
+
+import typing
+TreeNode = typing.NewType("TreeNode", None)
+
+get_ident = threading.get_ident
+
+class TraceEvent(IntEnum):
+    """
+    The kinds of events recorded by a `TickTracer`.
+    """
+    TICK_BEGIN = 0
+    TICK_END = 1
+    PRE_TICK = 2
+    POST_TICK = 3
+
+# node id, event, status, thread number, monotonic timestamp in ns.
+EVENT_FORMAT = struct.Struct("<IBBHQ")
+EVENT_SIZE = EVENT_FORMAT.size
+
+_TICK_BEGIN = int(TraceEvent.TICK_BEGIN)
+_TICK_END = int(TraceEvent.TICK_END)
+_PRE_TICK = int(TraceEvent.PRE_TICK)
+_POST_TICK = int(TraceEvent.POST_TICK)
+
+# magic, version, event size, number of events, dropped events, length 
+# of the node table.
+HEADER_FORMAT = struct.Struct("<8sIIQQQ")
+TRACE_MAGIC = b"DNDTRACE"
+TRACE_VERSION = 2
+# version 1 files have no thread numbers; their padding reads as thread 0.
+_READABLE_VERSIONS = (1, 2)
+
+# node id used for the tree-level TICK_BEGIN and TICK_END events.
+TREE_ID = 0xFFFFFFFF
+
+class TickTracer(Tracer):
+    """
+    A tracer that records fixed-size binary events into a preallocated
+    ring buffer. Each event holds a node id, an event type, a status, 
+    the number of the thread that recorded it (0 for the first thread
+    seen, and so on), and a monotonic timestamp in nanoseconds, packed
+    into 16 bytes. Thread numbers let `TraceDecoder` pair the events of
+    nodes ticked at the same time on several threads, as in `Sequence`'s
+    parallel mode.
+
+    Once the buffer is full the oldest events are overwritten, so memory
+    use is bounded by `capacity` no matter how long the tree runs. The
+    buffer can be written to a file with `dump`, and read back with a
+    `TraceDecoder`. `n_recorded` counts every event recorded since the 
+    last `clear`, including the ones that have been overwritten.
+
+    Args:
+        capacity (`int`):
+            The number of events the ring buffer holds.
+    """
+
+    def __init__(self, capacity : int = 65536) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.buffer = bytearray(capacity * EVENT_FORMAT.size)
+        self.node_paths : Dict[int, str] = {}
+
+        # next() on a count is atomic, so nodes ticked on other threads
+        # still get distinct slots.
+        self._counter = itertools.count()
+        self.n_recorded = 0
+        self._pack = EVENT_FORMAT.pack_into
+        self._clock = time.monotonic_ns
+
+        # thread idents to thread numbers.
+        self.threads : Dict[int, int] = {}
+        self._threads_lock = threading.Lock()
+
+    def _thread_number(self) -> int:
+        ident = threading.get_ident()
+        with self._threads_lock:
+            return self.threads.setdefault(ident, len(self.threads) & 0xFFFF)
+
+    def register_node(self, node : TreeNode, path : str) -> None:
+        self.node_paths[node.node_id] = path
+
+    def _record(self, node_id : int, event : int, status : int) -> None:
+        thread = self.threads.get(threading.get_ident())
+        if thread is None:
+            thread = self._thread_number()
+        n = next(self._counter)
+        self._pack(self.buffer, (n % self.capacity) * EVENT_SIZE, node_id, event, status, thread, self._clock())
+        self.n_recorded = n + 1
+
+    def begin_tick(self) -> None:
+        self._record(TREE_ID, _TICK_BEGIN, 0)
+
+    def end_tick(self, status : NodeStatus) -> None:
+        self._record(TREE_ID, _TICK_END, status.value)
+
+    # The per-node hooks run twice for every node tick, so they inline
+    # _record and use plain ints rather than enum members.
+    def pre_tick(self, node : TreeNode) -> None:
+        thread = self.threads.get(get_ident())
+        if thread is None:
+            thread = self._thread_number()
+        n = next(self._counter)
+        self._pack(self.buffer, (n % self.capacity) * EVENT_SIZE, node.node_id, _PRE_TICK, 0, thread, self._clock())
+        self.n_recorded = n + 1
+
+    def post_tick(self, node : TreeNode, status : NodeStatus) -> None:
+        thread = self.threads.get(get_ident())
+        if thread is None:
+            thread = self._thread_number()
+        n = next(self._counter)
+        self._pack(self.buffer, (n % self.capacity) * EVENT_SIZE, node.node_id, _POST_TICK, status.value, thread, self._clock())
+        self.n_recorded = n + 1
+
+    def clear(self) -> None:
+        """
+        Discard all recorded events. The node table is kept.
+        """
+        self._counter = itertools.count()
+        self.n_recorded = 0
+
+    def dump(self, filename : str) -> None:
+        """
+        Write the recorded events, oldest first, to a memory-mapped file 
+        that can be read with a `TraceDecoder`.
+
+        Args:
+            filename (`str`):
+                The file to write.
+        """
+        total = self.n_recorded
+        n_events = min(total, self.capacity)
+        start = total % self.capacity if total > self.capacity else 0
+        event_size = EVENT_FORMAT.size
+
+        node_table = json.dumps({str(k) : v for k, v in self.node_paths.items()}).encode("utf-8")
+        events_offset = HEADER_FORMAT.size
+        table_offset = events_offset + n_events * event_size
+        file_size = table_offset + len(node_table)
+
+        with open(filename, "wb+") as f:
+            f.truncate(file_size)
+            with mmap.mmap(f.fileno(), file_size) as mm:
+                HEADER_FORMAT.pack_into(mm, 0, TRACE_MAGIC, TRACE_VERSION, event_size, n_events, total - n_events, len(node_table))
+                # the oldest events start at `start` and may wrap around.
+                head = (n_events - start) if total > self.capacity else n_events
+                tail = n_events - head
+                mm[events_offset:events_offset + head * event_size] = self.buffer[start * event_size:(start + head) * event_size]
+                mm[events_offset + head * event_size:table_offset] = self.buffer[:tail * event_size]
+                mm[table_offset:file_size] = node_table
+                mm.flush()
+
+@dataclass
+class TraceRecord:
+    """
+    One decoded trace event.
+    """
+    node_id : int
+    path : Optional[str]
+    event : TraceEvent
+    status : NodeStatus
+    timestamp_ns : int
+    thread : int = 0
+
+@dataclass
+class TraceStep:
+    """
+    One node execution inside a tick: the node path, the status it 
+    returned, when it started, and how long it took, including its
+    children, and the number of the thread that ticked it.
+    """
+    path : Optional[str]
+    status : NodeStatus
+    start_ns : int
+    duration_ns : int
+    depth : int
+    thread : int = 0
+
+@dataclass
+class TickRecord:
+    """
+    A decoded tick. `steps` lists the node executions in the order the
+    nodes were entered. `status` is `None` for ticks that were only 
+    partially captured.
+    """
+    start_ns : Optional[int]
+    end_ns : Optional[int]
+    status : Optional[NodeStatus]
+    steps : List[TraceStep] = field(default_factory=list)
+
+class TraceDecoder:
+    """
+    Reads a trace file written by `TickTracer.dump` and reconstructs the
+    execution path of every tick.
+
+    Args:
+        filename (`str`):
+            The trace file to read.
+    """
+
+    def __init__(self, filename : str) -> None:
+        with open(filename, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, version, event_size, n_events, dropped, table_len = HEADER_FORMAT.unpack_from(mm, 0)
+                if magic != TRACE_MAGIC:
+                    raise ValueError(f"{filename} is not a dendron trace file")
+                if version not in _READABLE_VERSIONS or event_size != EVENT_FORMAT.size:
+                    raise ValueError(f"Unsupported trace version {version}")
+
+                events_offset = HEADER_FORMAT.size
+                table_offset = events_offset + n_events * event_size
+                self.raw_events = list(EVENT_FORMAT.iter_unpack(mm[events_offset:table_offset]))
+                table = json.loads(mm[table_offset:table_offset + table_len].decode("utf-8"))
+
+        self.dropped = dropped
+        self.node_paths = {int(k) : v for k, v in table.items()}
+
+    def __len__(self) -> int:
+        return len(self.raw_events)
+
+    def events(self) -> Iterator[TraceRecord]:
+        """
+        Iterate over the recorded events, oldest first.
+
+        Returns:
+            `Iterator[TraceRecord]`: The decoded events.
+        """
+        for node_id, event, status, thread, timestamp in self.raw_events:
+            yield TraceRecord(node_id, self.node_paths.get(node_id), TraceEvent(event), NodeStatus(status), timestamp, thread)
+
+    def ticks(self) -> List[TickRecord]:
+        """
+        Group the events into ticks and reconstruct the nodes executed in
+        each one. Events recorded before the first complete tick (for 
+        example because the ring buffer wrapped) form a partial tick.
+
+        Events are paired per thread. A node ticked on another thread
+        than the tick itself is placed below the node that the tick's
+        thread was running when the other thread started.
+
+        Returns:
+            `List[TickRecord]`: The decoded ticks, oldest first.
+        """
+        ticks = []
+        current = TickRecord(None, None, None)
+        # per thread, stack entries are (node_id, index of the step in
+        # current.steps), and the depth of the thread's outermost node.
+        stacks : Dict[int, list] = {}
+        base_depths : Dict[int, int] = {}
+        tick_thread = 0
+
+        for node_id, event, status, thread, timestamp in self.raw_events:
+            match event:
+                case TraceEvent.TICK_BEGIN:
+                    if current.steps:
+                        ticks.append(current)
+                    current = TickRecord(timestamp, None, None)
+                    stacks = {}
+                    tick_thread = thread
+                case TraceEvent.TICK_END:
+                    current.end_ns = timestamp
+                    current.status = NodeStatus(status)
+                    ticks.append(current)
+                    current = TickRecord(None, None, None)
+                    stacks = {}
+                case TraceEvent.PRE_TICK:
+                    stack = stacks.setdefault(thread, [])
+                    if not stack:
+                        base_depths[thread] = 0 if thread == tick_thread else len(stacks.get(tick_thread, ()))
+                    step = TraceStep(self.node_paths.get(node_id), NodeStatus.IDLE, timestamp, 0, base_depths[thread] + len(stack), thread)
+                    stack.append((node_id, len(current.steps)))
+                    current.steps.append(step)
+                case TraceEvent.POST_TICK:
+                    # a post event without its pre event was cut off by
+                    # the ring buffer.
+                    stack = stacks.get(thread)
+                    if stack and stack[-1][0] == node_id:
+                        _, idx = stack.pop()
+                        step = current.steps[idx]
+                        step.status = NodeStatus(status)
+                        step.duration_ns = timestamp - step.start_ns
+
+        if current.steps:
+            ticks.append(current)
+        return ticks
@@ -0,0 +1,142 @@
+from ..basic_types import NodeStatus
+
+import typing
+from typing import Callable, List
+
+TreeNode = typing.NewType("TreeNode", None)
+
+class Tracer:
+    """
+    Base class for objects that observe the execution of a 
+    `BehaviorTree`. A tracer is attached with `BehaviorTree.add_tracer`,
+    after which the tree calls the hooks below. The default hooks do 
+    nothing, so subclasses only override the ones they need.
+
+    Hooks are called on the thread that ticks the node, so they should
+    be cheap.
+
+    Nodes that would have to re-tokenize their text to count tokens only
+    call `record_tokens` if `wants_tokens` is `True`.
+    """
+
+    wants_tokens = False
+
+    def register_node(self, node : TreeNode, path : str) -> None:
+        """
+        Called once for every node of the tree when the tracer is added,
+        and for every node that joins the tree afterwards.
+
+        Args:
+            node (`dendron.tree_node.TreeNode`):
+                The node. Its `node_id` is unique within the tree.
+            path (`str`):
+                The path of the node in the tree.
+        """
+        pass
+
+    def begin_tick(self) -> None:
+        """
+        Called by the tree before it ticks its root.
+        """
+        pass
+
+    def end_tick(self, status : NodeStatus) -> None:
+        """
+        Called by the tree after its root returns.
+
+        Args:
+            status (`dendron.basic_types.NodeStatus`):
+                The status returned by the root.
+        """
+        pass
+
+    def pre_tick(self, node : TreeNode) -> None:
+        """
+        Called by `TreeNode.execute_tick` before the pre-tick functions
+        and `tick()` run.
+        """
+        pass
+
+    def post_tick(self, node : TreeNode, status : NodeStatus) -> None:
+        """
+        Called by `TreeNode.execute_tick` after `tick()` and the post-tick
+        functions have run.
+        """
+        pass
+
+    def wrap_job(self, node : TreeNode, fn : Callable) -> Callable:
+        """
+        Called by `BehaviorTree.submit` when a node hands work to the 
+        tree's executor. The returned callable is what gets submitted, so
+        a tracer can wrap `fn` to observe when the job starts and ends.
+
+        Args:
+            node (`dendron.tree_node.TreeNode`):
+                The node submitting the job.
+            fn (`Callable`):
+                The job.
+
+        Returns:
+            `Callable`: The callable to submit instead of `fn`.
+        """
+        return fn
+
+    def record_tokens(self, node : TreeNode, tokens_in : int, tokens_out : int) -> None:
+        """
+        Called by nodes that use a language model, after each model call.
+
+        Args:
+            node (`dendron.tree_node.TreeNode`):
+                The node that called the model.
+            tokens_in (`int`):
+                The number of tokens sent to the model.
+            tokens_out (`int`):
+                The number of tokens the model generated.
+        """
+        pass
+
+class TracerGroup(Tracer):
+    """
+    Forwards every hook to a list of tracers, in order. A tree uses a
+    group when more than one tracer is attached.
+
+    Args:
+        tracers (`List[Tracer]`):
+            The tracers to forward to.
+    """
+
+    def __init__(self, tracers : List[Tracer]) -> None:
+        self.tracers = list(tracers)
+
+    @property
+    def wants_tokens(self) -> bool:
+        return any(t.wants_tokens for t in self.tracers)
+
+    def register_node(self, node : TreeNode, path : str) -> None:
+        for t in self.tracers:
+            t.register_node(node, path)
+
+    def begin_tick(self) -> None:
+        for t in self.tracers:
+            t.begin_tick()
+
+    def end_tick(self, status : NodeStatus) -> None:
+        for t in self.tracers:
+            t.end_tick(status)
+
+    def pre_tick(self, node : TreeNode) -> None:
+        for t in self.tracers:
+            t.pre_tick(node)
+
+    def post_tick(self, node : TreeNode, status : NodeStatus) -> None:
+        for t in self.tracers:
+            t.post_tick(node, status)
+
+    def wrap_job(self, node : TreeNode, fn : Callable) -> Callable:
+        for t in self.tracers:
+            fn = t.wrap_job(node, fn)
+        return fn
+
+    def record_tokens(self, node : TreeNode, tokens_in : int, tokens_out : int) -> None:
+        for t in self.tracers:
+            t.record_tokens(node, tokens_in, tokens_out)
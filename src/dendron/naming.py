@@ -0,0 +1,60 @@
+from typing import Dict, Set
+
+class NameScope:
+    """
+    A set of node names that are unique within one `BehaviorTree`.
+
+    When a requested name is already taken, the scope appends a numeric
+    suffix (`name_0`, `name_1`, ...). The next suffix to try is remembered
+    for each base name, so allocating the k-th copy of a name does not
+    have to probe the k-1 suffixes before it.
+
+    Each tree owns its own scope, so names are released when nodes leave
+    the tree, and the whole scope goes away with the tree.
+    """
+
+    def __init__(self) -> None:
+        self.used : Set[str] = set()
+        self.next_suffix : Dict[str, int] = {}
+
+    def claim(self, name : str) -> str:
+        """
+        Reserve a unique name based on `name`.
+
+        Args:
+            name (`str`):
+                The requested name.
+
+        Returns:
+            `str`: `name` if it was free, otherwise `name` with the first
+            free numeric suffix appended.
+        """
+        if name not in self.used:
+            self.used.add(name)
+            return name
+
+        suffix = self.next_suffix.get(name, 0)
+        new_name = f"{name}_{suffix}"
+        while new_name in self.used:
+            suffix += 1
+            new_name = f"{name}_{suffix}"
+        self.next_suffix[name] = suffix + 1
+
+        self.used.add(new_name)
+        return new_name
+
+    def release(self, name : str) -> None:
+        """
+        Return a name to the scope so that it can be claimed again.
+
+        Args:
+            name (`str`):
+                A name that was previously returned by `claim`.
+        """
+        self.used.discard(name)
+
+    def __contains__(self, name : str) -> bool:
+        return name in self.used
+
+    def __len__(self) -> int:
+        return len(self.used)
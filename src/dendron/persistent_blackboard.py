@@ -0,0 +1,321 @@
+from .blackboard import Blackboard, BlackboardEntryMetadata
+
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import fcntl
+import os
+import pickle
+import re
+import struct
+import threading
+import zlib
+
+# Every log record is framed by its length and CRC-32, so that a record
+# torn by a crash is detected on recovery.
+_FRAME = struct.Struct("<II")
+
+class _Op:
+    SET = 0
+    DELETE = 1
+    ENTRY = 2
+    APPEND = 3
+
+_LOG_NAME = re.compile(r"wal\.(\d+)\.log$")
+
+def _fsync_directory(path : str) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _read_records(path : str) -> Tuple[List[tuple], int]:
+    # Returns the records of a log file, and the length of its intact
+    # prefix.
+    with open(path, "rb") as f:
+        data = f.read()
+    records = []
+    offset = 0
+    while offset + _FRAME.size <= len(data):
+        length, crc = _FRAME.unpack_from(data, offset)
+        start = offset + _FRAME.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        records.append(pickle.loads(payload))
+        offset = start + length
+    return records, offset
+
+class PersistentBlackboard(Blackboard):
+    """
+    A `Blackboard` that survives restarts. Every change is appended to a
+    write-ahead log in the directory `path`, and the log is compacted
+    into a snapshot from time to time. A new `PersistentBlackboard` on
+    the same directory recovers the state of the last one by loading the
+    snapshot and replaying the log written since, so recovery takes time
+    in proportion to the snapshot plus the log tail.
+
+    Writes, deletions, `append`s and changes to entry metadata are
+    logged. Values are pickled when they are written, so mutating a value
+    in place afterwards is not persisted; write it again, or grow lists
+    with `append`, which logs only the appended item.
+
+    Logging uses group commit: the write path only pickles the record
+    into an in-memory buffer, and a background thread writes the buffer
+    to the log and `fsync`s it every `commit_interval` seconds. A crash
+    loses at most the writes of the last interval, and never leaves a
+    partial write behind: a torn record at the end of the log is
+    detected and dropped on recovery. Call `flush` to make the writes so
+    far durable, and `close` when done.
+
+    Compaction runs on the background thread once the log grows past
+    `compact_bytes`, or, with durability "always", on the writer whose
+    change took the log past it. It starts a new log file and writes the snapshot
+    next to it, and writers wait while the state is pickled.
+
+    A directory can be open in only one `PersistentBlackboard` at a time,
+    and the blackboard cannot be pickled.
+
+    Args:
+        path (`str`):
+            The directory that holds the log and snapshot. Created if it
+            does not exist.
+        durability (`str`):
+            One of "group" (the default), which `fsync`s the log every
+            `commit_interval`; "always", which writes and `fsync`s every
+            change before returning, at the cost of milliseconds per
+            write; or "none", which writes the log every
+            `commit_interval` but leaves flushing it to disk to the OS.
+        commit_interval (`float`):
+            The time, in seconds, between group commits. Defaults to 5ms.
+        compact_bytes (`int`):
+            The size of the log, in bytes, past which it is compacted.
+            Defaults to 64 MiB.
+    """
+
+    def __init__(self, path : str, durability : str = "group", commit_interval : float = 0.005, compact_bytes : int = 64 << 20) -> None:
+        if durability not in ("group", "always", "none"):
+            raise ValueError("durability must be one of 'group', 'always' or 'none'")
+        if commit_interval <= 0:
+            raise ValueError("commit_interval must be positive")
+        super().__init__()
+        self.path = path
+        self.durability = durability
+        self.commit_interval = commit_interval
+        self.compact_bytes = compact_bytes
+        self.closed = False
+
+        os.makedirs(path, exist_ok=True)
+        self.lock_fd = os.open(os.path.join(path, "LOCK"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(self.lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(self.lock_fd)
+            raise RuntimeError(f"{path} is open in another PersistentBlackboard")
+
+        # _lock guards the state and the buffer, so that a snapshot always
+        # matches the log. _io_lock orders writes to the log file.
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._buffer = bytearray()
+        self.generation = self._recover()
+        self.log_file = open(self._log_path(self.generation), "ab")
+        self.log_bytes = self.log_file.tell()
+
+        self._stop = threading.Event()
+        self.commit_thread = None
+        if durability != "always":
+            self.commit_thread = threading.Thread(target=self._commit_loop, name="dendron-wal", daemon=True)
+            self.commit_thread.start()
+
+    def __getstate__(self):
+        raise TypeError("PersistentBlackboard cannot be pickled; open the directory in one process only")
+
+    def __enter__(self) -> "PersistentBlackboard":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _log_path(self, generation : int) -> str:
+        return os.path.join(self.path, f"wal.{generation}.log")
+
+    def _snapshot_path(self) -> str:
+        return os.path.join(self.path, "snapshot.pkl")
+
+    def _log_generations(self) -> List[int]:
+        generations = []
+        for name in os.listdir(self.path):
+            match = _LOG_NAME.match(name)
+            if match:
+                generations.append(int(match.group(1)))
+        return sorted(generations)
+
+    def _recover(self) -> int:
+        # Load the snapshot, then replay every log from the snapshot's
+        # generation on. Logs older than the snapshot were compacted into
+        # it, but may survive a crash in the middle of compaction.
+        generation = 0
+        if os.path.exists(self._snapshot_path()):
+            with open(self._snapshot_path(), "rb") as f:
+                generation, entries, values = pickle.load(f)
+            for key, (description, type_constructor) in entries.items():
+                self.entry_mapping[key] = BlackboardEntryMetadata(key, description, type_constructor)
+            self.value_mapping.update(values)
+
+        generations = [g for g in self._log_generations() if g >= generation]
+        for g in generations:
+            path = self._log_path(g)
+            records, intact = _read_records(path)
+            for record in records:
+                self._replay(record)
+            if intact < os.path.getsize(path):
+                # drop the torn tail, so that new records follow intact ones.
+                os.truncate(path, intact)
+        for g in self._log_generations():
+            if g < generation:
+                os.remove(self._log_path(g))
+        return max([generation] + generations)
+
+    def _replay(self, record : tuple) -> None:
+        match record:
+            case (_Op.SET, key, value):
+                if key not in self.entry_mapping:
+                    self.entry_mapping[key] = BlackboardEntryMetadata(key, "Autogenerated entry", type(value))
+                self.value_mapping[key] = value
+            case (_Op.DELETE, key):
+                self.value_mapping.pop(key, None)
+                self.entry_mapping.pop(key, None)
+            case (_Op.ENTRY, key, description, type_constructor):
+                self.entry_mapping[key] = BlackboardEntryMetadata(key, description, type_constructor)
+            case (_Op.APPEND, key, args):
+                self.value_mapping[key].append(*args)
+
+    def _record(self, record : tuple) -> None:
+        # Called with _lock held.
+        if self.closed:
+            raise RuntimeError("the blackboard is closed")
+        payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        self._buffer += _FRAME.pack(len(payload), zlib.crc32(payload))
+        self._buffer += payload
+
+    def _register_entry_locked(self, entry : BlackboardEntryMetadata) -> None:
+        # Called with _lock held.
+        super().register_entry(entry)
+        self._record((_Op.ENTRY, entry.key, entry.description, entry.type_constructor))
+
+    def register_entry(self, entry : BlackboardEntryMetadata) -> None:
+        with self._lock:
+            self._register_entry_locked(entry)
+        if self.durability == "always":
+            self._commit()
+
+    def set_entry(self, key : Any, description : Optional[str] = None, type_constructor : Optional[Type] = None) -> None:
+        with self._lock:
+            super().set_entry(key, description, type_constructor)
+            entry = self.entry_mapping[key]
+            self._record((_Op.ENTRY, key, entry.description, entry.type_constructor))
+        if self.durability == "always":
+            self._commit()
+
+    def __setitem__(self, key : Any, value : Any) -> None:
+        with self._lock:
+            if key not in self.entry_mapping:
+                # registered (and logged) here rather than by the base
+                # class, which would take _lock a second time.
+                self._register_entry_locked(BlackboardEntryMetadata(key, "Autogenerated entry", type(value)))
+            super().__setitem__(key, value)
+            self._record((_Op.SET, key, value))
+        if self.durability == "always":
+            self._commit()
+
+    def __delitem__(self, key : Any) -> None:
+        with self._lock:
+            super().__delitem__(key)
+            self._record((_Op.DELETE, key))
+        if self.durability == "always":
+            self._commit()
+
+    def append(self, key : Any, value : Any, *args) -> None:
+        with self._lock:
+            super().append(key, value, *args)
+            self._record((_Op.APPEND, key, (value,) + args))
+        if self.durability == "always":
+            self._commit()
+
+    def flush(self) -> None:
+        """
+        Write the buffered changes to the log, and `fsync` it unless the
+        durability is "none".
+        """
+        with self._io_lock:
+            with self._lock:
+                data, self._buffer = self._buffer, bytearray()
+            if self.log_file.closed:
+                return
+            if data:
+                self.log_file.write(data)
+                self.log_file.flush()
+                self.log_bytes += len(data)
+                if self.durability != "none":
+                    os.fsync(self.log_file.fileno())
+
+    def compact(self) -> None:
+        """
+        Replace the log with a snapshot of the current state. Writers
+        wait while the state is pickled.
+        """
+        with self._io_lock:
+            with self._lock:
+                # everything up to here goes to the old log, everything
+                # after to the new one, and the snapshot is the state at
+                # the switch.
+                data, self._buffer = self._buffer, bytearray()
+                old_generation = self.generation
+                self.generation += 1
+                entries = {key : (entry.description, entry.type_constructor) for key, entry in self.entry_mapping.items()}
+                snapshot = pickle.dumps((self.generation, entries, self.value_mapping), protocol=pickle.HIGHEST_PROTOCOL)
+            # the old log must be on disk before the new one is used.
+            self.log_file.write(data)
+            self.log_file.flush()
+            os.fsync(self.log_file.fileno())
+            self.log_file.close()
+            self.log_file = open(self._log_path(self.generation), "ab")
+            self.log_bytes = 0
+
+            tmp_path = self._snapshot_path() + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(snapshot)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._snapshot_path())
+            _fsync_directory(self.path)
+            for g in self._log_generations():
+                if g <= old_generation:
+                    os.remove(self._log_path(g))
+
+    def _commit(self) -> None:
+        self.flush()
+        if self.log_bytes > self.compact_bytes:
+            self.compact()
+
+    def _commit_loop(self) -> None:
+        while not self._stop.wait(self.commit_interval):
+            self._commit()
+
+    def close(self) -> None:
+        """
+        Commit the buffered changes, stop the commit thread and release
+        the directory.
+        """
+        if self.closed:
+            return
+        self._stop.set()
+        if self.commit_thread is not None:
+            self.commit_thread.join()
+        self.flush()
+        with self._lock:
+            self.closed = True
+        self.log_file.close()
+        fcntl.flock(self.lock_fd, fcntl.LOCK_UN)
+        os.close(self.lock_fd)
@@ -0,0 +1,192 @@
+from .basic_types import NodeStatus
+from .instrumentation.node_stats import LatencyHistogram
+
+from typing import Optional
+
+import threading
+import time
+
+import typing
+BehaviorTree = typing.NewType("BehaviorTree", None)
+
+class RateStats:
+    """
+    Timing statistics of a `RateDriver`. Times are recorded in
+    nanoseconds.
+
+    - `jitter`: how late each tick started relative to its scheduled
+      time.
+    - `duration`: how long each tick took.
+    - `n_ticks`: the number of ticks run.
+    - `n_overruns`: the number of ticks that finished after the next tick
+      was due.
+    - `n_skipped`: the number of scheduled ticks dropped by the "skip"
+      policy.
+    """
+
+    def __init__(self) -> None:
+        self.jitter = LatencyHistogram()
+        self.duration = LatencyHistogram()
+        self.n_ticks = 0
+        self.n_overruns = 0
+        self.n_skipped = 0
+
+    def summary(self) -> dict:
+        """
+        Summarize these statistics as a plain dictionary. Times are given
+        in seconds.
+
+        Returns:
+            `dict`: A dictionary with keys `n_ticks`, `n_overruns`,
+            `n_skipped`, `jitter` and `duration`. The last two hold the
+            keys `p50`, `p99`, `max` and `mean`.
+        """
+        def seconds(ns):
+            return None if ns is None else ns / 1e9
+
+        def times(h):
+            return {
+                "p50" : seconds(h.percentile(0.50)),
+                "p99" : seconds(h.percentile(0.99)),
+                "max" : seconds(h.max),
+                "mean" : seconds(h.mean()),
+            }
+
+        return {
+            "n_ticks" : self.n_ticks,
+            "n_overruns" : self.n_overruns,
+            "n_skipped" : self.n_skipped,
+            "jitter" : times(self.jitter),
+            "duration" : times(self.duration),
+        }
+
+class RateDriver:
+    """
+    Ticks a `BehaviorTree` at a fixed rate, as a control loop would. Tick
+    `k` is scheduled at `start + k / hz` on a monotonic clock, so errors
+    in sleeping do not accumulate into drift.
+
+    A tick that runs past the time the next tick is due is an overrun.
+    With the "skip" policy, the scheduled ticks that were missed are
+    dropped and the loop resumes at the next scheduled time in the
+    future. With the "catch_up" policy, the missed ticks are run back to
+    back until the loop is on schedule again.
+
+    Create drivers with `BehaviorTree.tick_at_rate`.
+
+    Args:
+        tree (`dendron.behavior_tree.BehaviorTree`):
+            The tree to tick.
+        hz (`float`):
+            The tick rate, in ticks per second.
+        policy (`str`):
+            One of "skip" or "catch_up". Defaults to "skip".
+        max_ticks (`Optional[int]`):
+            Stop after this many ticks. Defaults to no limit.
+        stop_when_done (`bool`):
+            Stop once the root returns a status other than `RUNNING`.
+            Defaults to `False`.
+        spin (`float`):
+            The time, in seconds, before each tick to busy-wait rather
+            than sleep, which trades CPU time for lower jitter. Defaults
+            to 0.
+    """
+
+    def __init__(self, tree : BehaviorTree, hz : float, policy : str = "skip", max_ticks : Optional[int] = None, stop_when_done : bool = False, spin : float = 0.0) -> None:
+        if hz <= 0:
+            raise ValueError("hz must be positive")
+        if policy not in ("skip", "catch_up"):
+            raise ValueError("policy must be one of 'skip' or 'catch_up'")
+        self.tree = tree
+        self.hz = hz
+        self.period = 1.0 / hz
+        self.policy = policy
+        self.max_ticks = max_ticks
+        self.stop_when_done = stop_when_done
+        self.spin = spin
+        self.stats = RateStats()
+        self.status = None
+        self.thread = None
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """
+        Ask the loop to stop. The tick in progress, if any, finishes
+        first.
+        """
+        self._stop.set()
+
+    def join(self, timeout : Optional[float] = None) -> None:
+        """
+        Wait for a loop started with `start` to stop.
+
+        Args:
+            timeout (`Optional[float]`):
+                The longest time to wait, in seconds.
+        """
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+    def start(self) -> "RateDriver":
+        """
+        Run the loop on a new daemon thread.
+
+        Returns:
+            `RateDriver`: This driver.
+        """
+        if self.thread is not None:
+            raise RuntimeError("the driver is already running")
+        self.thread = threading.Thread(target=self.run, name=f"dendron-rate-{self.tree.tree_name}", daemon=True)
+        self.thread.start()
+        return self
+
+    def _sleep_until(self, deadline : float) -> bool:
+        # Returns False if the loop was stopped while sleeping.
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return not self._stop.is_set()
+            if remaining > self.spin:
+                if self._stop.wait(remaining - self.spin):
+                    return False
+            elif self._stop.is_set():
+                return False
+
+    def run(self) -> Optional[NodeStatus]:
+        """
+        Run the loop on the calling thread until it is stopped.
+
+        Returns:
+            `Optional[NodeStatus]`: The status returned by the last tick.
+        """
+        stats = self.stats
+        period = self.period
+        start = time.monotonic()
+        k = 0
+        while not self._stop.is_set():
+            scheduled = start + k * period
+            if not self._sleep_until(scheduled):
+                break
+
+            tick_start = time.monotonic()
+            self.status = self.tree.tick_once()
+            tick_end = time.monotonic()
+
+            stats.n_ticks += 1
+            stats.jitter.record(int((tick_start - scheduled) * 1e9))
+            stats.duration.record(int((tick_end - tick_start) * 1e9))
+
+            k += 1
+            if tick_end > start + k * period:
+                stats.n_overruns += 1
+                if self.policy == "skip":
+                    # resume at the first scheduled time in the future.
+                    next_k = int((tick_end - start) // period) + 1
+                    stats.n_skipped += next_k - k
+                    k = next_k
+
+            if self.max_ticks is not None and stats.n_ticks >= self.max_ticks:
+                break
+            if self.stop_when_done and self.status != NodeStatus.RUNNING:
+                break
+        return self.status
@@ -0,0 +1,293 @@
+from hflm import LM
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+
+def _max_time(method : str, request : Any) -> Optional[float]:
+    if method == "generate_until" and isinstance(request[1], dict):
+        return request[1].get("max_time")
+    return None
+
+def _request_key(method : str, request : Any) -> str:
+    # the time limit of a generation request depends on when it was made,
+    # so it is not part of the request's identity.
+    if _max_time(method, request) is not None:
+        request = [request[0], {k : v for k, v in request[1].items() if k != "max_time"}]
+    payload = json.dumps([method, request], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+def _from_json(method : str, response : Any) -> Any:
+    # JSON turns the (logprob, is_greedy) tuples into lists.
+    if method in ("loglikelihood", "loglikelihood_rolling") and isinstance(response, list):
+        return tuple(response)
+    return response
+
+class LatencyModel:
+    """
+    A distribution of synthetic latencies for a `ReplayLM`, in seconds.
+    Use one of the constructors below.
+
+    Args:
+        sample (`Callable[[random.Random, float, int], float]`):
+            A function of a random generator, the recorded latency of the
+            request and the number of whitespace-separated words in the
+            response, returning a latency.
+    """
+
+    def __init__(self, sample : Callable[[random.Random, float, int], float]) -> None:
+        self.sample = sample
+
+    @classmethod
+    def none(cls) -> "LatencyModel":
+        """
+        Respond immediately.
+        """
+        return cls(lambda rng, recorded, n_words: 0.0)
+
+    @classmethod
+    def recorded(cls, scale : float = 1.0) -> "LatencyModel":
+        """
+        Reproduce the latency measured when the request was recorded.
+
+        Args:
+            scale (`float`):
+                A factor applied to every recorded latency. Defaults to 1.
+        """
+        return cls(lambda rng, recorded, n_words: scale * recorded)
+
+    @classmethod
+    def fixed(cls, seconds : float) -> "LatencyModel":
+        """
+        Always take `seconds`.
+        """
+        return cls(lambda rng, recorded, n_words: seconds)
+
+    @classmethod
+    def uniform(cls, low : float, high : float) -> "LatencyModel":
+        """
+        Take a latency drawn uniformly from `[low, high]`.
+        """
+        return cls(lambda rng, recorded, n_words: rng.uniform(low, high))
+
+    @classmethod
+    def lognormal(cls, median : float, sigma : float) -> "LatencyModel":
+        """
+        Take a log-normally distributed latency, which has the long right
+        tail typical of model serving.
+
+        Args:
+            median (`float`):
+                The median latency.
+            sigma (`float`):
+                The standard deviation of the log of the latency.
+        """
+        mu = math.log(median)
+        return cls(lambda rng, recorded, n_words: rng.lognormvariate(mu, sigma))
+
+    @classmethod
+    def per_token(cls, first_token : float, per_token : float) -> "LatencyModel":
+        """
+        Take a fixed time to the first token, plus a fixed time for every
+        further word of the response.
+
+        Args:
+            first_token (`float`):
+                The time to the first token.
+            per_token (`float`):
+                The time per further word.
+        """
+        return cls(lambda rng, recorded, n_words: first_token + per_token * max(0, n_words - 1))
+
+class RecordingLM(LM):
+    """
+    Wraps a real language model, passing every `generate_until`,
+    `loglikelihood` and `loglikelihood_rolling` call through to it while
+    recording each request, its response and its latency. The recording
+    can be saved and served later by a `ReplayLM`, without any weights.
+
+    Every other attribute is looked up on the wrapped model, so a
+    `RecordingLM` can be placed in `BehaviorTree.models` in place of the
+    model it wraps (see `BehaviorTree.set_model`).
+
+    Args:
+        lm (`hflm.LM`):
+            The model to record.
+    """
+
+    def __init__(self, lm : LM) -> None:
+        super().__init__()
+        self.lm = lm
+        self.records : List[dict] = []
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name : str) -> Any:
+        # only called for attributes not found on the recorder itself.
+        if name == "lm":
+            raise AttributeError(name)
+        return getattr(self.lm, name)
+
+    def _call(self, method : str, requests, disable_tqdm : bool) -> list:
+        requests = list(requests)
+        start = time.perf_counter()
+        responses = getattr(self.lm, method)(requests, disable_tqdm=disable_tqdm)
+        elapsed = time.perf_counter() - start
+
+        # the latency of a batch is split evenly among its requests.
+        share = elapsed / max(1, len(requests))
+        with self._lock:
+            for request, response in zip(requests, responses):
+                self.records.append({
+                    "method" : method,
+                    "request" : request,
+                    "response" : response,
+                    "latency" : share,
+                })
+        return responses
+
+    def generate_until(self, requests, disable_tqdm : bool = False) -> List[str]:
+        return self._call("generate_until", requests, disable_tqdm)
+
+    def loglikelihood(self, requests, disable_tqdm : bool = False) -> List[Tuple[float, bool]]:
+        return self._call("loglikelihood", requests, disable_tqdm)
+
+    def loglikelihood_rolling(self, requests, disable_tqdm : bool = False) -> List[Tuple[float]]:
+        return self._call("loglikelihood_rolling", requests, disable_tqdm)
+
+    def save(self, filename : str) -> None:
+        """
+        Write the recorded calls to a JSON lines file, one request per
+        line.
+
+        Args:
+            filename (`str`):
+                The file to write.
+        """
+        with self._lock:
+            records = list(self.records)
+        with open(filename, "w") as f:
+            for record in records:
+                f.write(json.dumps(record, default=str) + "\n")
+
+class ReplayLM(LM):
+    """
+    A stand-in for a language model that answers from a recording made by
+    a `RecordingLM`, with synthetic latency, so that trees using language
+    model nodes can be load tested without loading any weights.
+
+    A request that was recorded gets its recorded response. A request
+    that was not is either an error or, if `strict` is `False`, answered
+    with the recorded responses of the same method in turn, which lets a
+    small recording drive many sessions with varied prompts. Latency is
+    drawn from `latency` and spent in `time.sleep`, which releases the
+    GIL just as a real model call would. A generation request with a
+    `max_time`, as sent by nodes under a `Timeout`, takes at most that
+    long, as a real generation would be stopped. Draws come from a generator
+    seeded with `seed`, so a single-threaded run is reproducible.
+
+    Args:
+        filename (`Optional[str]`):
+            A recording saved by `RecordingLM.save`. If `None`, responses
+            can be added with `add`.
+        latency (`Optional[LatencyModel]`):
+            The latency model. Defaults to `LatencyModel.recorded()`.
+        strict (`bool`):
+            Whether requests that were not recorded are an error. Defaults
+            to `False`.
+        seed (`int`):
+            The seed for latency draws. Defaults to 0.
+    """
+
+    def __init__(self, filename : Optional[str] = None, latency : Optional[LatencyModel] = None, strict : bool = False, seed : int = 0) -> None:
+        super().__init__()
+        self.latency = latency if latency is not None else LatencyModel.recorded()
+        self.strict = strict
+        self.rng = random.Random(seed)
+        self.responses : Dict[str, Tuple[Any, float]] = {}
+        self.by_method : Dict[str, List[Tuple[Any, float]]] = {}
+        self.next_index : Dict[str, int] = {}
+        self.n_calls = 0
+        self.n_misses = 0
+        self._lock = threading.Lock()
+
+        if filename is not None:
+            with open(filename) as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self.add(record["method"], record["request"], record["response"], record.get("latency", 0.0))
+
+    def add(self, method : str, request : Any, response : Any, latency : float = 0.0) -> None:
+        """
+        Add a response to serve.
+
+        Args:
+            method (`str`):
+                One of "generate_until", "loglikelihood" or
+                "loglikelihood_rolling".
+            request (`Any`):
+                The request, as passed to the method in a list.
+            response (`Any`):
+                The response to that request.
+            latency (`float`):
+                The latency of the request when it was recorded.
+        """
+        entry = (_from_json(method, response), latency)
+        # requests are keyed by their JSON form, so tuples and lists match.
+        self.responses[_request_key(method, json.loads(json.dumps(request, default=str)))] = entry
+        self.by_method.setdefault(method, []).append(entry)
+
+    def _lookup(self, method : str, request : Any) -> Tuple[Any, float]:
+        key = _request_key(method, json.loads(json.dumps(request, default=str)))
+        entry = self.responses.get(key)
+        if entry is not None:
+            return entry
+
+        self.n_misses += 1
+        candidates = self.by_method.get(method)
+        if self.strict or not candidates:
+            raise KeyError(f"No recorded {method} response for {request!r}")
+        i = self.next_index.get(method, 0)
+        self.next_index[method] = i + 1
+        return candidates[i % len(candidates)]
+
+    def _call(self, method : str, requests) -> list:
+        responses = []
+        delay = 0.0
+        max_delay = None
+        with self._lock:
+            self.n_calls += 1
+            for request in requests:
+                response, recorded = self._lookup(method, request)
+                n_words = len(response.split()) if isinstance(response, str) else 1
+                delay += max(0.0, self.latency.sample(self.rng, recorded, n_words))
+                responses.append(response)
+                max_time = _max_time(method, request)
+                if max_time is not None:
+                    max_delay = max_time if max_delay is None else min(max_delay, max_time)
+        if max_delay is not None:
+            delay = min(delay, max_delay)
+        if delay > 0.0:
+            time.sleep(delay)
+        return responses
+
+    def generate_until(self, requests, disable_tqdm : bool = False) -> List[str]:
+        return self._call("generate_until", requests)
+
+    def loglikelihood(self, requests, disable_tqdm : bool = False) -> List[Tuple[float, bool]]:
+        return self._call("loglikelihood", requests)
+
+    def loglikelihood_rolling(self, requests, disable_tqdm : bool = False) -> List[Tuple[float]]:
+        return self._call("loglikelihood_rolling", requests)
+
+    def tok_encode(self, string : str, **kwargs) -> List[str]:
+        """
+        Approximate tokenization by splitting on whitespace, so that token
+        counts reported by language model nodes stay meaningful.
+        """
+        return string.split()
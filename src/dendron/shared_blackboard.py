@@ -0,0 +1,618 @@
+from .blackboard import Blackboard, BlackboardEntryMetadata
+
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import fcntl
+import os
+import pickle
+import secrets
+import struct
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+# Every segment starts with a sequence number, which is odd while a write
+# is in progress, and the length of the value.
+_HEADER = struct.Struct("QQ")
+_SEQ = struct.Struct("Q")
+
+_SCALAR_FORMATS = {bool : "?", int : "q", float : "d"}
+
+class _Segment:
+    # A shared memory segment that is not tracked by the resource
+    # tracker, which would unlink it when whichever process first touched
+    # it exits, and which is confused by segments created in one process
+    # and unlinked in another. Python 3.13 can open segments untracked;
+    # before that, they are unregistered right after opening.
+
+    def __init__(self, name : str, create : bool = False, size : int = 0) -> None:
+        self.name = name
+        if sys.version_info >= (3, 13):
+            self.shm = SharedMemory(name, create=create, size=size, track=False)
+        else:
+            self.shm = SharedMemory(name, create=create, size=size)
+            _untrack(self.shm)
+        self.buf = self.shm.buf
+
+    def close(self) -> None:
+        self.buf = None
+        try:
+            self.shm.close()
+        except BufferError:
+            # views of the segment are still alive; the mapping is freed
+            # along with them.
+            pass
+
+    @staticmethod
+    def unlink(name : str) -> None:
+        segment = _Segment(name)
+        try:
+            if sys.version_info < (3, 13) and os.name == "posix":
+                # SharedMemory.unlink unregisters the segment, so register
+                # it first, to keep the resource tracker consistent.
+                resource_tracker.register("/" + segment.shm.name, "shared_memory")
+            segment.shm.unlink()
+        finally:
+            segment.close()
+
+def _untrack(shm : SharedMemory) -> None:
+    # Only POSIX segments are registered with the resource tracker.
+    if os.name == "posix":
+        resource_tracker.unregister("/" + shm.name, "shared_memory")
+
+def _wait_for_writer(attempt : int, started : float, timeout : float, what : str) -> None:
+    # Called by a reader that saw a write in progress, before it tries
+    # again: yield to the writer, then sleep, and give up after `timeout`
+    # seconds, since a writer that died mid-write never finishes.
+    if time.monotonic() - started > timeout:
+        raise TimeoutError(f"{what} has been changing for over {timeout} seconds; a writer may have died mid-write")
+    time.sleep(0 if attempt < 16 else 1e-4)
+
+def _is_tensor(value : Any) -> bool:
+    return type(value).__module__.startswith("torch") and hasattr(value, "numpy")
+
+class SharedMemoryBlackboard(Blackboard):
+    """
+    A `Blackboard` whose values live in shared memory
+    (POSIX shared memory), so that trees and model workers in
+    different processes see the same blackboard.
+
+    Each key gets its own segment, laid out according to the kind of its
+    value:
+
+    - `int`, `float` and `bool` values are stored in fixed 8-byte slots.
+    - `bytes` are stored in a buffer that grows as needed.
+    - NumPy arrays and (CPU) torch tensors are stored in a buffer of
+      fixed shape and dtype. `view` maps the buffer as an array, so large
+      images and tensors can be read and written in place by any process
+      without copying or pickling.
+    - Anything else is pickled into a growable buffer, which is the right
+      transport for small values such as strings and dicts.
+
+    The kind of a key is fixed by the `type_constructor` of its
+    `BlackboardEntryMetadata` if that is a scalar type or `bytes`, and
+    otherwise by the first value written. Arrays can also be allocated up
+    front with `declare_array`.
+
+    Reads made with `[]` return a copy and never see a partial write:
+    every segment carries a sequence number that writers bump before and
+    after writing, and readers retry if it changed. Writers to the same
+    key from different processes are serialized with a byte-range lock on
+    a lock file. Reads and writes made through `view` are not protected.
+
+    A reader that keeps finding a write in progress for `read_timeout`
+    seconds raises `TimeoutError`, rather than waiting forever on a
+    writer that died in the middle of a write.
+
+    The creating process owns the segments, and should call `unlink`
+    when done. Other processes attach with `attach`, or simply by
+    unpickling the blackboard (for instance as part of a `BehaviorTree`
+    sent to a process pool), and call `close` when done.
+
+    Args:
+        name (`Optional[str]`):
+            The name of the blackboard's directory segment. Defaults to a
+            random name.
+        directory_size (`int`):
+            The capacity, in bytes, of the directory that maps keys to
+            segments. Defaults to 1 MiB.
+    """
+
+    # How long, in seconds, a read waits for a write in progress.
+    read_timeout = 5.0
+
+    def __init__(self, name : Optional[str] = None, directory_size : int = 1 << 20) -> None:
+        if name is None:
+            name = "dendron-bb-" + secrets.token_hex(6)
+        self.print_len = 16
+        self.entry_mapping = {}
+        self.name = name
+        self.owner = True
+        self.directory_shm = _Segment(name, create=True, size=_HEADER.size + directory_size)
+        self.lock_fd = os.open(self._lock_path(name), os.O_RDWR | os.O_CREAT, 0o600)
+        self._init_local()
+        self._write_directory({})
+
+    @classmethod
+    def attach(cls, name : str) -> "SharedMemoryBlackboard":
+        """
+        Attach to a blackboard created by another process.
+
+        Args:
+            name (`str`):
+                The `name` of the blackboard.
+
+        Returns:
+            `SharedMemoryBlackboard`: The blackboard.
+        """
+        bb = cls.__new__(cls)
+        bb.print_len = 16
+        bb.entry_mapping = {}
+        bb.name = name
+        bb.owner = False
+        bb.directory_shm = _Segment(name)
+        bb.lock_fd = os.open(cls._lock_path(name), os.O_RDWR | os.O_CREAT, 0o600)
+        bb._init_local()
+        return bb
+
+    def _init_local(self) -> None:
+        self._init_slots()
+        # Record locks only exclude other processes, so threads of this
+        # process also take a lock of their own.
+        self._thread_lock = threading.RLock()
+        # the write log covers the writes made by this process.
+        self._init_log()
+        self.directory : Dict[Any, dict] = {}
+        self.directory_version = None
+        self.segments : Dict[str, _Segment] = {}
+
+    @staticmethod
+    def _lock_path(name : str) -> str:
+        return os.path.join(tempfile.gettempdir(), name + ".lock")
+
+    def __getstate__(self):
+        return {"name" : self.name, "print_len" : self.print_len}
+
+    def __setstate__(self, state):
+        other = SharedMemoryBlackboard.attach(state["name"])
+        self.__dict__.update(other.__dict__)
+        self.print_len = state["print_len"]
+
+    def __enter__(self) -> "SharedMemoryBlackboard":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self.owner:
+            self.unlink()
+        else:
+            self.close()
+
+    # Locking. Byte 0 of the lock file guards the directory, and byte
+    # i + 1 guards the segment of the entry with index i.
+
+    def _lock(self, i : int) -> None:
+        self._thread_lock.acquire()
+        fcntl.lockf(self.lock_fd, fcntl.LOCK_EX, 1, i)
+
+    def _unlock(self, i : int) -> None:
+        fcntl.lockf(self.lock_fd, fcntl.LOCK_UN, 1, i)
+        self._thread_lock.release()
+
+    # The directory.
+
+    def _read_directory(self) -> None:
+        buf = self.directory_shm.buf
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            seq, length = _HEADER.unpack_from(buf, 0)
+            if not seq & 1:
+                payload = bytes(buf[_HEADER.size:_HEADER.size + length])
+                if _SEQ.unpack_from(buf, 0)[0] == seq:
+                    break
+            _wait_for_writer(attempt, started, self.read_timeout, "the blackboard directory")
+            attempt += 1
+        self.directory = pickle.loads(payload)
+        self.directory_version = seq
+        self.entry_mapping = {
+            key : BlackboardEntryMetadata(key, entry["description"], entry["type_constructor"], self.print_len)
+            for key, entry in self.directory.items()
+        }
+        # drop segments that are no longer in the directory.
+        live = {entry["segment"] for entry in self.directory.values()}
+        for segment_name in list(self.segments):
+            if segment_name not in live:
+                self.segments.pop(segment_name).close()
+
+    def _refresh(self) -> None:
+        if _SEQ.unpack_from(self.directory_shm.buf, 0)[0] != self.directory_version:
+            self._read_directory()
+
+    def _write_directory(self, directory : Dict[Any, dict]) -> None:
+        # The caller holds the directory lock.
+        payload = pickle.dumps(directory)
+        buf = self.directory_shm.buf
+        if _HEADER.size + len(payload) > len(buf):
+            raise ValueError("the blackboard directory is full; create the blackboard with a larger directory_size")
+        seq = _SEQ.unpack_from(buf, 0)[0]
+        _SEQ.pack_into(buf, 0, seq + 1)
+        buf[_HEADER.size:_HEADER.size + len(payload)] = payload
+        _HEADER.pack_into(buf, 0, seq + 2, len(payload))
+        self._read_directory()
+
+    def _segment(self, entry : dict) -> _Segment:
+        shm = self.segments.get(entry["segment"])
+        if shm is None:
+            shm = _Segment(entry["segment"])
+            self.segments[entry["segment"]] = shm
+        return shm
+
+    def _allocate(self, key : Any, entry : dict, size : int) -> dict:
+        # Create a new segment for `entry` and publish it. The caller holds
+        # the directory lock.
+        entry = dict(entry)
+        entry["generation"] = entry.get("generation", -1) + 1
+        entry["segment"] = f"{self.name}-{entry['index']}-{entry['generation']}"
+        entry["capacity"] = size
+        shm = _Segment(entry["segment"], create=True, size=_HEADER.size + max(1, size))
+        self.segments[entry["segment"]] = shm
+        old_segment = self.directory.get(key, {}).get("segment")
+
+        directory = dict(self.directory)
+        directory[key] = entry
+        self._write_directory(directory)
+
+        if old_segment is not None:
+            self._unlink_segment(old_segment)
+        return entry
+
+    def _unlink_segment(self, segment_name : str) -> None:
+        shm = self.segments.pop(segment_name, None)
+        if shm is not None:
+            shm.close()
+        try:
+            _Segment.unlink(segment_name)
+        except FileNotFoundError:
+            pass
+
+    def _declare(self, key : Any, kind : Optional[str], type_constructor : type, description : str, **layout) -> dict:
+        self._lock(0)
+        try:
+            self._read_directory()
+            entry = self.directory.get(key)
+            if entry is not None and entry["kind"] is not None:
+                return entry
+            index = entry["index"] if entry is not None else 1 + max((e["index"] for e in self.directory.values()), default=-1)
+            entry = {
+                "index" : index,
+                "kind" : kind,
+                "type_constructor" : type_constructor,
+                "description" : description,
+                "segment" : None,
+            }
+            entry.update(layout)
+            if kind is None:
+                directory = dict(self.directory)
+                directory[key] = entry
+                self._write_directory(directory)
+                return entry
+            return self._allocate(key, entry, self._size_of(entry))
+        finally:
+            self._unlock(0)
+
+    @staticmethod
+    def _size_of(entry : dict) -> int:
+        match entry["kind"]:
+            case "scalar":
+                return 8
+            case "array" | "tensor":
+                return int(np.prod(entry["shape"])) * np.dtype(entry["dtype"]).itemsize
+            case _:
+                return entry.get("capacity", 1024)
+
+    @staticmethod
+    def _layout_for(value : Any) -> Tuple[str, dict]:
+        if type(value) in _SCALAR_FORMATS:
+            return "scalar", {"format" : _SCALAR_FORMATS[type(value)]}
+        if isinstance(value, (bytes, bytearray)):
+            return "bytes", {"capacity" : max(1024, 2 * len(value))}
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            return "array", {"shape" : value.shape, "dtype" : value.dtype.str}
+        if _is_tensor(value):
+            return "tensor", {"shape" : tuple(value.shape), "dtype" : value.detach().cpu().numpy().dtype.str}
+        return "pickle", {"capacity" : 1024}
+
+    def declare_array(self, key : Any, shape : Tuple[int, ...], dtype : Any, description : str = "Autogenerated entry") -> None:
+        """
+        Allocate a shared array for `key` before any value is written, so
+        that processes can fill it in place through `view`.
+
+        Args:
+            key (`Any`):
+                The key.
+            shape (`Tuple[int, ...]`):
+                The shape of the array.
+            dtype (`Any`):
+                The NumPy dtype of the array.
+            description (`str`):
+                A description of the entry.
+        """
+        self._declare(key, "array", np.ndarray, description, shape=tuple(shape), dtype=np.dtype(dtype).str)
+
+    def register_entry(self, entry : BlackboardEntryMetadata) -> None:
+        """
+        Register the metadata of a key. Scalar types and `bytes` fix the
+        layout of the key's segment; for other types the layout is fixed
+        by the first value written.
+
+        Args:
+            entry (`dendron.blackboard.BlackboardEntryMetadata`):
+                The entry to register.
+        """
+        tc = entry.type_constructor
+        if tc in _SCALAR_FORMATS:
+            self._declare(entry.key, "scalar", tc, entry.description, format=_SCALAR_FORMATS[tc])
+        elif tc in (bytes, bytearray):
+            self._declare(entry.key, "bytes", tc, entry.description, capacity=1024)
+        else:
+            self._declare(entry.key, None, tc, entry.description)
+
+    def set_entry(self, key : Any, description : Optional[str] = None, type_constructor : Optional[type] = None) -> None:
+        self._lock(0)
+        try:
+            self._read_directory()
+            if key not in self.directory:
+                raise KeyError(f"{key} not in blackboard.")
+            entry = dict(self.directory[key])
+            if description is not None:
+                entry["description"] = description
+            if type_constructor is not None:
+                entry["type_constructor"] = type_constructor
+            directory = dict(self.directory)
+            directory[key] = entry
+            self._write_directory(directory)
+        finally:
+            self._unlock(0)
+
+    def _entry(self, key : Any) -> dict:
+        self._refresh()
+        entry = self.directory.get(key)
+        if entry is None or entry["segment"] is None:
+            raise KeyError(f"Entry {key} not in blackboard.")
+        return entry
+
+    def _read(self, key : Any) -> Any:
+        started = time.monotonic()
+        attempt = -1
+        while True:
+            if attempt >= 0:
+                _wait_for_writer(attempt, started, self.read_timeout, f"Entry {key}")
+            attempt += 1
+            entry = self._entry(key)
+            buf = self._segment(entry).buf
+            seq, length = _HEADER.unpack_from(buf, 0)
+            if seq & 1:
+                continue
+            match entry["kind"]:
+                case "scalar":
+                    value = struct.unpack_from(entry["format"], buf, _HEADER.size)[0]
+                case "array" | "tensor":
+                    value = np.ndarray(entry["shape"], dtype=np.dtype(entry["dtype"]), buffer=buf, offset=_HEADER.size).copy()
+                case _:
+                    value = bytes(buf[_HEADER.size:_HEADER.size + length])
+            if _SEQ.unpack_from(buf, 0)[0] != seq:
+                continue
+            match entry["kind"]:
+                case "pickle":
+                    return pickle.loads(value)
+                case "tensor":
+                    import torch
+                    return torch.from_numpy(value)
+                case _:
+                    return value
+
+    def _raw_value(self, key : Any) -> Any:
+        return self._read(key)
+
+    def _encode(self, entry : dict, value : Any) -> bytes:
+        match entry["kind"]:
+            case "scalar":
+                return struct.pack(entry["format"], entry["type_constructor"](value))
+            case "bytes":
+                return bytes(value)
+            case "pickle":
+                return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        return b""
+
+    def __getitem__(self, key : Any) -> Any:
+        """
+        Get a copy of the value associated with the given key.
+
+        Args:
+            key (`Any`):
+                The key we want the value for.
+
+        Returns:
+            `Any` : The value in the blackboard corresponding to `key`.
+        """
+        value = self._read(key)
+        target_type = self.entry_mapping[key].type_constructor
+        if self.directory[key]["kind"] in ("pickle", "bytes") and type(value) != target_type:
+            return target_type(value)
+        return value
+
+    def __setitem__(self, key : Any, value : Any) -> None:
+        """
+        Write a value to shared memory. If `key` is new, its segment is
+        laid out for `value`.
+
+        Args:
+            key (`Any`):
+                Key to query on. Usually a `str`.
+            value (`Any`):
+                The value that `key` maps to.
+        """
+        self._refresh()
+        entry = self.directory.get(key)
+        if entry is None or entry["kind"] is None:
+            kind, layout = self._layout_for(value)
+            type_constructor = entry["type_constructor"] if entry is not None else type(value)
+            description = entry["description"] if entry is not None else "Autogenerated entry"
+            if kind == "scalar" and type_constructor not in _SCALAR_FORMATS:
+                kind, layout = "pickle", {"capacity" : 1024}
+            entry = self._declare(key, kind, type_constructor, description, **layout)
+
+        if entry["kind"] in ("array", "tensor"):
+            if _is_tensor(value):
+                value = value.detach().cpu().numpy()
+            value = np.asarray(value)
+            if value.shape != tuple(entry["shape"]) or value.dtype.str != entry["dtype"]:
+                raise ValueError(f"Entry {key} holds arrays of shape {tuple(entry['shape'])} and dtype {entry['dtype']}")
+            data = None
+        else:
+            data = self._encode(entry, value)
+
+        self._lock(entry["index"] + 1)
+        try:
+            entry = self._entry(key)
+            if data is not None and len(data) > entry["capacity"]:
+                self._lock(0)
+                try:
+                    self._read_directory()
+                    entry = self._allocate(key, self.directory[key], max(len(data), 2 * entry["capacity"]))
+                finally:
+                    self._unlock(0)
+            buf = self._segment(entry).buf
+            seq = _SEQ.unpack_from(buf, 0)[0]
+            _SEQ.pack_into(buf, 0, seq + 1)
+            if data is None:
+                target = np.ndarray(entry["shape"], dtype=np.dtype(entry["dtype"]), buffer=buf, offset=_HEADER.size)
+                target[...] = value
+                length = target.nbytes
+            else:
+                buf[_HEADER.size:_HEADER.size + len(data)] = data
+                length = len(data)
+            _HEADER.pack_into(buf, 0, seq + 2, length)
+        finally:
+            self._unlock(entry["index"] + 1)
+        self._log_write(key)
+
+    def __delitem__(self, key : Any) -> None:
+        """
+        Delete an entry from the blackboard, and free its segment.
+
+        Args:
+            key (`Any`):
+                The key we want to remove from the blackboard.
+        """
+        self._lock(0)
+        try:
+            self._read_directory()
+            if key not in self.directory:
+                raise KeyError(key)
+            segment_name = self.directory[key]["segment"]
+            directory = dict(self.directory)
+            del directory[key]
+            self._write_directory(directory)
+            if segment_name is not None:
+                self._unlink_segment(segment_name)
+        finally:
+            self._unlock(0)
+        self._log_delete(key)
+
+    def append(self, key : Any, value : Any, *args) -> None:
+        """
+        Append `value` to the list stored at `key`. The list is read,
+        extended and written back, which is not atomic across processes.
+
+        Args:
+            key (`Any`):
+                The key of the list.
+            value (`Any`):
+                The value to append.
+            *args:
+                Further arguments to the container's `append`.
+        """
+        values = self._read(key)
+        values.append(value, *args)
+        self[key] = values
+
+    def __contains__(self, key : Any) -> bool:
+        self._refresh()
+        entry = self.directory.get(key)
+        return entry is not None and entry["segment"] is not None
+
+    def __iter__(self) -> Iterator:
+        self._refresh()
+        return iter([key for key, entry in self.directory.items() if entry["segment"] is not None])
+
+    def __len__(self) -> int:
+        return len(list(iter(self)))
+
+    @property
+    def value_mapping(self) -> Dict[Any, Any]:
+        """
+        A snapshot of every key and value, as a plain `dict`.
+        """
+        return {key : self[key] for key in self}
+
+    def view(self, key : Any) -> Any:
+        """
+        Map the shared buffer of an array or tensor entry, without
+        copying. Writes to the view are seen by every process at once,
+        without the protection against partial reads that `[]` has.
+
+        Args:
+            key (`Any`):
+                The key of an array or tensor entry.
+
+        Returns:
+            `Any`: A `numpy.ndarray`, or a `torch.Tensor` for tensor
+            entries, backed by shared memory. The view is only valid
+            until the blackboard is closed.
+        """
+        entry = self._entry(key)
+        if entry["kind"] not in ("array", "tensor"):
+            raise TypeError(f"Entry {key} is not an array")
+        array = np.ndarray(entry["shape"], dtype=np.dtype(entry["dtype"]), buffer=self._segment(entry).buf, offset=_HEADER.size)
+        if entry["kind"] == "tensor":
+            import torch
+            return torch.from_numpy(array)
+        return array
+
+    def close(self) -> None:
+        """
+        Detach this process from the blackboard's shared memory. Views
+        returned by `view` must not be used afterwards.
+        """
+        for shm in self.segments.values():
+            shm.close()
+        self.segments = {}
+        if self.directory_shm is not None:
+            self.directory_shm.close()
+            self.directory_shm = None
+        if self.lock_fd is not None:
+            os.close(self.lock_fd)
+            self.lock_fd = None
+
+    def unlink(self) -> None:
+        """
+        Free the blackboard's shared memory. Call this once, from the
+        process that created the blackboard, when no process needs it
+        any more.
+        """
+        self._refresh()
+        segment_names = [entry["segment"] for entry in self.directory.values() if entry["segment"] is not None]
+        self.close()
+        for segment_name in segment_names:
+            self._unlink_segment(segment_name)
+        _Segment.unlink(self.name)
+        try:
+            os.unlink(self._lock_path(self.name))
+        except FileNotFoundError:
+            pass
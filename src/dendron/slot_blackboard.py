@@ -0,0 +1,149 @@
+from .blackboard import Blackboard, BlackboardEntryMetadata
+
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+class _Empty:
+    # Marks a slot whose key has no value. Pickled by reference, so that
+    # it stays a singleton.
+    def __repr__(self) -> str:
+        return "EMPTY"
+
+    def __reduce__(self) -> str:
+        return "EMPTY"
+
+EMPTY = _Empty()
+
+class SlotBlackboard(Blackboard):
+    """
+    A `Blackboard` that keeps its values in a list indexed by slot (see
+    `Blackboard.slot`), rather than in a dictionary keyed by name. A node
+    that resolves its keys to slots once can then read and write them
+    with `get_slot` and `set_slot` at the cost of a list index, without
+    hashing the key or looking up its metadata on every access.
+
+    Access by key works as for any `Blackboard`, and costs one dictionary
+    lookup to find the slot. `value_mapping` is a snapshot, built on
+    demand, rather than the live storage.
+
+    Slots hold raw values; `get_slot` applies the key's type constructor
+    like `[]` does, and skips it when the value already has that type.
+    """
+
+    def __init__(self) -> None:
+        self.entry_mapping = {}
+        self.print_len = 16
+        self._init_log()
+        self._init_slots()
+        # Per slot: the value (or EMPTY) and the type constructor of the
+        # key (or None if the key has no entry).
+        self.slot_values : List[Any] = []
+        self.slot_types : List[Optional[type]] = []
+        self.n_values = 0
+
+    def slot(self, key : Any) -> int:
+        slot = self.slot_ids.get(key)
+        if slot is None:
+            with self._slot_lock:
+                slot = self.slot_ids.get(key)
+                if slot is None:
+                    slot = len(self.slot_keys)
+                    self.slot_keys.append(key)
+                    self.slot_values.append(EMPTY)
+                    self.slot_types.append(None)
+                    # published last, so that a reader that finds the
+                    # slot also finds its value and type.
+                    self.slot_ids[key] = slot
+        return slot
+
+    def register_entry(self, entry : BlackboardEntryMetadata) -> None:
+        super().register_entry(entry)
+        self.slot_types[self.slot(entry.key)] = entry.type_constructor
+
+    def set_entry(self, key : Any, description : Optional[str] = None, type_constructor : Optional[Type] = None) -> None:
+        super().set_entry(key, description, type_constructor)
+        self.slot_types[self.slot_ids[key]] = self.entry_mapping[key].type_constructor
+
+    def get_slot(self, slot : int) -> Any:
+        value = self.slot_values[slot]
+        target_type = self.slot_types[slot]
+        if type(value) is target_type:
+            return value
+        if value is EMPTY:
+            raise KeyError(f"Entry {self.slot_keys[slot]} not in blackboard.")
+        return target_type(value)
+
+    def set_slot(self, slot : int, value : Any) -> None:
+        values = self.slot_values
+        if values[slot] is EMPTY:
+            key = self.slot_keys[slot]
+            if self.slot_types[slot] is None:
+                self.register_entry(BlackboardEntryMetadata(key, "Autogenerated entry", type(value)))
+            self.n_values += 1
+        values[slot] = value
+
+        # log the write (see Blackboard._log_write), inline since this is
+        # hot.
+        log = self.write_log
+        if log is not None:
+            key = self.slot_keys[slot]
+            with self._log_lock:
+                version = next(self._versions)
+                if self.delete_log:
+                    self.delete_log.pop(key, None)
+                if key in log:
+                    del log[key]
+                log[key] = version
+                self.version = version
+
+    def __getitem__(self, key : Any) -> Any:
+        slot = self.slot_ids.get(key)
+        if slot is None:
+            raise KeyError(f"Entry {key} not in blackboard.")
+        return self.get_slot(slot)
+
+    def __setitem__(self, key : Any, value : Any) -> None:
+        slot = self.slot_ids.get(key)
+        if slot is None:
+            slot = self.slot(key)
+        self.set_slot(slot, value)
+
+    def __delitem__(self, key : Any) -> None:
+        slot = self.slot_ids.get(key)
+        if slot is None or self.slot_values[slot] is EMPTY:
+            raise KeyError(key)
+        # the key keeps its slot, so that handles held by nodes stay valid.
+        self.slot_values[slot] = EMPTY
+        self.slot_types[slot] = None
+        del self.entry_mapping[key]
+        self.n_values -= 1
+        self._log_delete(key)
+
+    def append(self, key : Any, value : Any, *args) -> None:
+        self.slot_values[self.slot_ids[key]].append(value, *args)
+        self._log_write(key)
+
+    def _raw_value(self, key : Any) -> Any:
+        return self.slot_values[self.slot_ids[key]]
+
+    def __contains__(self, key : Any) -> bool:
+        slot = self.slot_ids.get(key)
+        return slot is not None and self.slot_values[slot] is not EMPTY
+
+    def __iter__(self) -> Iterator:
+        """
+        Get an iterator over the keys that hold values, in slot order.
+
+        Returns:
+            `Iterator`: The iterator over the keys.
+        """
+        return iter([key for key, value in zip(self.slot_keys, self.slot_values) if value is not EMPTY])
+
+    def __len__(self) -> int:
+        return self.n_values
+
+    @property
+    def value_mapping(self) -> Dict[Any, Any]:
+        """
+        A snapshot of every key and its raw value, as a plain `dict`.
+        """
+        return {key : value for key, value in zip(self.slot_keys, self.slot_values) if value is not EMPTY}
@@ -0,0 +1,348 @@
+from typing import Callable, List, Optional
+
+import math
+import random
+import threading
+import time
+
+class TimerHandle:
+    """
+    A timer scheduled with `TreeTimer.call_at` or `TreeTimer.call_later`.
+    Pass it to `TreeTimer.cancel` to cancel the timer.
+    """
+
+    __slots__ = ("deadline", "callback", "cancelled")
+
+    def __init__(self, deadline : float, callback : Callable[[], None]) -> None:
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+# Each level of the timer wheel has 2 ** WHEEL_BITS slots.
+WHEEL_BITS = 6
+WHEEL_SIZE = 1 << WHEEL_BITS
+WHEEL_MASK = WHEEL_SIZE - 1
+WHEEL_LEVELS = 6
+
+class TreeTimer:
+    """
+    Timers for the nodes of a `BehaviorTree`, on a monotonic clock. Nodes
+    schedule a callback for a point in time, and the tree runs every
+    callback that has come due at the start of each tick, on the ticking
+    thread. Nodes that are waiting on a timer can return `RUNNING` without
+    doing any work until their callback runs.
+
+    Timers are kept in a hierarchical timer wheel. Time is divided into
+    ticks of `resolution` seconds. The first level of the wheel has a slot
+    for each of the next 64 ticks, the second a slot for each of the next
+    64 spans of 64 ticks, and so on for six levels (about two years at the
+    default resolution; later timers wait in an overflow list). As time
+    advances, the timers in a slot of a higher level are moved down to the
+    lower levels. Scheduling and cancelling a timer take constant time
+    however many are pending, so hundreds of thousands of outstanding
+    `Timeout`s are cheap. Callbacks still run only once their deadline has
+    passed, not merely their tick.
+
+    Timers can be scheduled from any thread.
+
+    Args:
+        clock (`Callable[[], float]`):
+            The clock, in seconds. Defaults to `time.monotonic`.
+        resolution (`float`):
+            The length of a tick of the wheel, in seconds. Defaults to 
+            0.001.
+    """
+
+    def __init__(self, clock : Callable[[], float] = time.monotonic, resolution : float = 0.001) -> None:
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        self.clock = clock
+        self.resolution = resolution
+        self.wheel : List[List[List[TimerHandle]]] = [[[] for _ in range(WHEEL_SIZE)] for _ in range(WHEEL_LEVELS)]
+        # the number of timers (including cancelled ones not yet dropped)
+        # in each level of the wheel.
+        self.level_counts = [0] * WHEEL_LEVELS
+        self.overflow : List[TimerHandle] = []
+        self.n_pending = 0
+        # every timer due before this tick has been run.
+        self.base = self._tick(clock())
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.n_pending
+
+    def _tick(self, t : float) -> int:
+        return int(t // self.resolution)
+
+    def _place(self, handle : TimerHandle) -> None:
+        # Put a timer in the lowest level whose window contains its tick.
+        # Timers that are already due go in the current slot.
+        tick = max(self._tick(handle.deadline), self.base)
+        # the level is given by the highest bit where the tick differs
+        # from the base.
+        level = ((tick ^ self.base).bit_length() - 1) // WHEEL_BITS if tick != self.base else 0
+        if level < WHEEL_LEVELS:
+            self.wheel[level][(tick >> (WHEEL_BITS * level)) & WHEEL_MASK].append(handle)
+            self.level_counts[level] += 1
+        else:
+            self.overflow.append(handle)
+
+    def _cascade(self, tick : int) -> None:
+        # Called when the base reaches `tick`: move the timers of each 
+        # level whose window starts at `tick` down to the lower levels, 
+        # highest level first.
+        if tick & ((1 << (WHEEL_BITS * WHEEL_LEVELS)) - 1) == 0 and self.overflow:
+            handles, self.overflow = self.overflow, []
+            for handle in handles:
+                if not handle.cancelled:
+                    self._place(handle)
+        for level in range(WHEEL_LEVELS - 1, 0, -1):
+            if tick & ((1 << (WHEEL_BITS * level)) - 1) == 0:
+                slot = self.wheel[level][(tick >> (WHEEL_BITS * level)) & WHEEL_MASK]
+                if slot:
+                    handles = slot[:]
+                    slot.clear()
+                    self.level_counts[level] -= len(handles)
+                    for handle in handles:
+                        if not handle.cancelled:
+                            self._place(handle)
+
+    def _collect_due(self, now : float) -> List[TimerHandle]:
+        target = self._tick(now)
+        due = []
+        level0 = self.wheel[0]
+        while True:
+            slot = level0[self.base & WHEEL_MASK]
+            if slot:
+                if self.base < target:
+                    due.extend(slot)
+                    self.level_counts[0] -= len(slot)
+                    slot.clear()
+                else:
+                    keep = [handle for handle in slot if handle.deadline > now and not handle.cancelled]
+                    due.extend(handle for handle in slot if handle.deadline <= now)
+                    self.level_counts[0] -= len(slot) - len(keep)
+                    slot[:] = keep
+            if self.base >= target:
+                break
+
+            # Skip over empty levels: if levels below `level` are empty,
+            # nothing happens until the next window of `level` starts.
+            level = 0
+            while level < WHEEL_LEVELS and self.level_counts[level] == 0:
+                level += 1
+            if level == 0:
+                next_tick = self.base + 1
+            else:
+                span = WHEEL_BITS * level
+                next_tick = ((self.base >> span) + 1) << span
+            if next_tick > target:
+                self.base = target
+            else:
+                self.base = next_tick
+                self._cascade(next_tick)
+        return [handle for handle in due if not handle.cancelled]
+
+    def now(self) -> float:
+        """
+        Get the current time on this timer's clock.
+
+        Returns:
+            `float`: The time, in seconds.
+        """
+        return self.clock()
+
+    def call_at(self, deadline : float, callback : Callable[[], None]) -> TimerHandle:
+        """
+        Schedule `callback` to run at the first tick at or after
+        `deadline`.
+
+        Args:
+            deadline (`float`):
+                The time, on this timer's clock, to run the callback.
+            callback (`Callable[[], None]`):
+                The function to call.
+
+        Returns:
+            `TimerHandle`: A handle that can be used to cancel the timer.
+        """
+        handle = TimerHandle(deadline, callback)
+        with self._lock:
+            self._place(handle)
+            self.n_pending += 1
+        return handle
+
+    def call_later(self, delay : float, callback : Callable[[], None]) -> TimerHandle:
+        """
+        Schedule `callback` to run at the first tick at least `delay`
+        seconds from now.
+
+        Args:
+            delay (`float`):
+                The delay, in seconds.
+            callback (`Callable[[], None]`):
+                The function to call.
+
+        Returns:
+            `TimerHandle`: A handle that can be used to cancel the timer.
+        """
+        return self.call_at(self.clock() + delay, callback)
+
+    def cancel(self, handle : TimerHandle) -> None:
+        """
+        Cancel a timer. Cancelling a timer that has already run does
+        nothing. The timer is dropped from the wheel when its slot is 
+        next visited.
+
+        Args:
+            handle (`TimerHandle`):
+                The timer to cancel.
+        """
+        with self._lock:
+            if not handle.cancelled:
+                handle.cancelled = True
+                self.n_pending -= 1
+
+    def next_deadline(self) -> Optional[float]:
+        """
+        Get the deadline of the earliest pending timer.
+
+        Returns:
+            `Optional[float]`: The deadline, or `None` if no timers are
+            pending.
+        """
+        with self._lock:
+            if self.n_pending == 0:
+                return None
+            # Lower levels hold earlier timers than higher levels, and 
+            # within a level, later slots hold later timers.
+            for level in range(WHEEL_LEVELS):
+                if self.level_counts[level] == 0:
+                    continue
+                first = (self.base >> (WHEEL_BITS * level)) & WHEEL_MASK
+                if level > 0:
+                    first += 1
+                for i in range(first, WHEEL_SIZE):
+                    deadlines = [h.deadline for h in self.wheel[level][i] if not h.cancelled]
+                    if deadlines:
+                        return min(deadlines)
+            deadlines = [h.deadline for h in self.overflow if not h.cancelled]
+            return min(deadlines) if deadlines else None
+
+    def run_due(self, now : Optional[float] = None) -> int:
+        """
+        Run the callbacks of every timer whose deadline has passed, in
+        deadline order.
+
+        Args:
+            now (`Optional[float]`):
+                The current time. Defaults to reading the clock.
+
+        Returns:
+            `int`: The number of callbacks run.
+        """
+        if now is None:
+            now = self.clock()
+        n_run = 0
+        while True:
+            with self._lock:
+                if self.n_pending == 0:
+                    # only cancelled timers are left: drop them all.
+                    if self.overflow or any(self.level_counts):
+                        self.wheel = [[[] for _ in range(WHEEL_SIZE)] for _ in range(WHEEL_LEVELS)]
+                        self.level_counts = [0] * WHEEL_LEVELS
+                        self.overflow = []
+                    self.base = max(self.base, self._tick(now))
+                    return n_run
+                due = self._collect_due(now)
+                # mark the timers as run, so that cancelling them does 
+                # nothing.
+                for handle in due:
+                    handle.cancelled = True
+                self.n_pending -= len(due)
+            if not due:
+                return n_run
+            due.sort(key=lambda handle: handle.deadline)
+            for handle in due:
+                handle.callback()
+                n_run += 1
+
+class Backoff:
+    """
+    A schedule of delays between attempts: `initial * multiplier ** n`
+    before attempt `n + 1`, capped at `max_delay`, with optional jitter
+    so that many sessions retrying the same failure spread out.
+
+    With "full" jitter the delay is drawn uniformly from zero to the
+    scheduled delay. With "equal" jitter it is drawn from half the
+    scheduled delay to all of it. With "none" it is the scheduled delay.
+
+    Args:
+        initial (`float`):
+            The delay before the first retry, in seconds. Defaults to 0.1.
+        multiplier (`float`):
+            The factor applied to the delay after every attempt. Defaults
+            to 2.
+        max_delay (`float`):
+            The largest delay, in seconds. Defaults to 30.
+        jitter (`str`):
+            One of "full", "equal" or "none". Defaults to "full".
+        seed (`Optional[int]`):
+            A seed for the jitter, for reproducible schedules.
+    """
+
+    def __init__(self, initial : float = 0.1, multiplier : float = 2.0, max_delay : float = 30.0, jitter : str = "full", seed : Optional[int] = None) -> None:
+        if jitter not in ("full", "equal", "none"):
+            raise ValueError("jitter must be one of 'full', 'equal' or 'none'")
+        if initial < 0 or multiplier < 1 or max_delay < 0:
+            raise ValueError("delays must be non-negative and the multiplier at least 1")
+        self.initial = initial
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+
+        # The first attempt whose scheduled delay reaches max_delay, or
+        # None if the delay never grows. Powers of the multiplier past it
+        # are not computed, since they can overflow.
+        if initial >= max_delay:
+            self.capped_from = 0
+        elif initial == 0 or multiplier == 1:
+            self.capped_from = None
+        else:
+            self.capped_from = math.ceil(math.log(max_delay / initial, multiplier))
+
+    def delay(self, attempt : int) -> float:
+        """
+        Get the delay to wait after attempt number `attempt`, counting
+        from 0.
+
+        Args:
+            attempt (`int`):
+                The number of the attempt that just finished.
+
+        Returns:
+            `float`: The delay, in seconds.
+        """
+        if self.capped_from is not None and attempt >= self.capped_from:
+            base = self.max_delay
+        elif self.capped_from is None:
+            base = self.initial
+        else:
+            base = min(self.max_delay, self.initial * self.multiplier ** attempt)
+        match self.jitter:
+            case "full":
+                return self.rng.uniform(0, base)
+            case "equal":
+                return base / 2 + self.rng.uniform(0, base / 2)
+            case _:
+                return base
@@ -14,6 +14,47 @@ import logging
 
 BehaviorTree = typing.NewType("BehaviorTree", None)
 
+def forwarding(method : Callable) -> Callable:
+    """
+    Mark a `set_tree`, `set_blackboard`, `set_logger` or `set_log_level`
+    method that only sets an attribute of the node and forwards the call
+    to the node's children, so that `forward_to_subtree` can do the same
+    for the node without calling the method.
+    """
+    method.forwarding = True
+    return method
+
+def forward_to_subtree(root : "TreeNode", method_name : str, attr : str, value : Any) -> None:
+    """
+    Set `attr` to `value` on `root`, and call the method `method_name` of
+    each node below it with `value`, without recursion. Nodes whose
+    method is marked `forwarding` are handled here, as if the method had
+    been called, so that deep chains of control nodes and decorators do
+    not run into the recursion limit. Other nodes have their method
+    called, and forward the call themselves.
+
+    Args:
+        root (`TreeNode`):
+            The node whose (forwarding) method is running.
+        method_name (`str`):
+            The name of the method.
+        attr (`str`):
+            The attribute the method sets.
+        value (`Any`):
+            The value to set.
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node is not root and not getattr(getattr(type(node), method_name), "forwarding", False):
+            getattr(node, method_name)(value)
+            continue
+        setattr(node, attr, value)
+        if isinstance(node.children, list):
+            stack.extend(reversed(node.children))
+        elif getattr(node, "child_node", None) is not None:
+            stack.append(node.child_node)
+
 class TreeNode:
     """
     Base class for a node in a behavior tree.
@@ -24,6 +65,7 @@ class TreeNode:
     """
     
     def __init__(self) -> None:
+        self._name = None
         self.blackboard = None
         self.status = NodeStatus.IDLE
 
@@ -35,6 +77,28 @@ class TreeNode:
 
         self.tree = None
 
+        # Set by the tree: an id that is unique within the tree, and the
+        # tracer (if any) that observes this node's ticks.
+        self.node_id = None
+        self.tracer = None
+
+        # True if this node has run (or had its status set) since it was
+        # last reset. Parents only reset dirty children, so resetting a 
+        # subtree costs time in proportion to the nodes that actually ran.
+        self.dirty = False
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value : str) -> None:
+        # Names only have to be unique within a tree, so the tree 
+        # decides on the final name once the node is part of one.
+        if self.tree is not None:
+            value = self.tree.rename_node(self, value)
+        self._name = value
+
     def set_tree(self, tree : BehaviorTree) -> None:
         """
         Set the tree that contains this node.
@@ -44,7 +108,8 @@ class TreeNode:
                 The new tree this node is a part of.
         """
         self.tree = tree
-        self.set_blackboard(tree.blackboard)
+        if self.blackboard is None:
+            self.set_blackboard(tree.blackboard)
         for child in self.children():
             child.set_tree(tree)
 
@@ -57,35 +122,32 @@ class TreeNode:
     def set_log_level(self, new_level) -> None:
         raise NotImplementedError("set_log_level should be defined in subclass.")
 
-    def _get_level_str(self, new_level) -> str:
-        if self.logger is not None:
-            level_str = "None"  
-            match self.logger.level:    
-                case logging.DEBUG: 
-                    level_str = "debug" 
-                case logging.INFO:  
-                    level_str = "info"  
-                case logging.WARNING:   
-                    level_str = "warning"
-                case logging.ERROR: 
-                    level_str = "error" 
-                case logging.CRITICAL:  
-                    level_str = "critical"
-            return level_str
-
     def execute_tick(self) -> NodeStatus:
         """
         Performs pre-tick operations, calls the Node's tick() method, and 
         then performs post-tick operations. If logging is enabled, then this 
         is where log functions are called.
 
+        Whether the node's log level is enabled is checked once per tick, 
+        and log messages are only formatted if they are actually emitted.
+        If the tree has tracers attached, they are notified here as well.
+
         Returns:
             `dendron.basic_types.NodeStatus`: The status returned by the inner 
             call to tick().
         """
-        if self.logger is not None:
-            log_fn = getattr(self.logger, self._get_level_str(self.log_level))
-            log_fn(f"{self.name} - pre_tick")
+        logger = self.logger
+        log_enabled = False
+        if logger is not None:
+            level = self.log_level if self.log_level is not None else logger.level
+            log_enabled = logger.isEnabledFor(level)
+
+        if log_enabled:
+            logger.log(level, "%s - pre_tick", self.name)
+
+        tracer = self.tracer
+        if tracer is not None:
+            tracer.pre_tick(self)
 
         for f in self.pre_tick_fns:
             f()
@@ -95,9 +157,13 @@ class TreeNode:
         for f in self.post_tick_fns:
             f()
 
-        if self.logger is not None:
-            log_fn = getattr(self.logger, self._get_level_str(self.log_level))
-            log_fn(f"{self.name} - post_tick {self.status}")
+        self.dirty = True
+
+        if tracer is not None:
+            tracer.post_tick(self, self.status)
+
+        if log_enabled:
+            logger.log(level, "%s - post_tick %s", self.name, self.status)
 
         return self.status
 
@@ -113,7 +179,26 @@ class TreeNode:
         self.description = desc
 
     def halt_node(self) -> None:
-        raise NotImplementedError("Halt behavior is specified in subclass.")
+        """
+        Stop any work in progress and return to `IDLE`. By default this 
+        resets the node; nodes with work in flight, such as asynchronous
+        actions, override it to cancel that work.
+        """
+        self.reset()
+
+    def time_remaining(self) -> Optional[float]:
+        """
+        Get the time left before the deadline published by an enclosing
+        `Timeout` (see `BehaviorTree.push_deadline`). Long-running nodes
+        should stop, and fail, once it is used up.
+
+        Returns:
+            `Optional[float]`: The time left in seconds, which is negative
+            if the deadline has passed, or `None` if there is no deadline.
+        """
+        if self.tree is None:
+            return None
+        return self.tree.time_remaining()
 
     def set_blackboard(self, bb : Blackboard) -> None:
         """
@@ -145,13 +230,21 @@ class TreeNode:
 
     def set_status(self, new_status : NodeStatus) -> None:
         """
-        Set the node status to a new value.
+        Set the node status to a new value. This marks the node as dirty.
 
         Args:
             new_status (`dendron.basic_types.NodeStatus`):
                 The new NodeStatus.
         """
         self.status = new_status
+        self.dirty = True
+
+    def reset_status(self) -> None:
+        """
+        Set the status of this node to IDLE, without resetting any other
+        state.
+        """
+        self.status = NodeStatus.IDLE
 
     def node_type(self) -> NodeType:
         raise NotImplementedError("Type is specified in subclass.")
@@ -201,9 +294,14 @@ class TreeNode:
 
     def reset(self) -> None:
         """
-        Set the status of this node to IDLE.
+        Set the status of this node to IDLE and mark it clean.
+
+        Subclasses that override this should reset their children with
+        `reset_child` or `reset_children`, which skip children that are 
+        not dirty, and set `dirty` to `False` when done.
         """
         self.status = NodeStatus.IDLE
+        self.dirty = False
 
     def pretty_repr(self, depth = 0) -> str:
         """
@@ -0,0 +1,334 @@
+from .basic_types import NodeStatus
+
+from concurrent import futures
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import itertools
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import traceback
+import zlib
+
+import typing
+BehaviorTree = typing.NewType("BehaviorTree", None)
+
+@dataclass
+class TickResult:
+    """
+    The outcome of a tick request to a `TreePool`.
+
+    Args:
+        status (`Optional[NodeStatus]`):
+            The status returned by the root of the tree.
+        delta (`Dict[Any, Any]`):
+            The blackboard keys written by the tick, with their new values.
+        deleted (`List[Any]`):
+            The blackboard keys deleted by the tick.
+    """
+    status : Optional[NodeStatus]
+    delta : Dict[Any, Any] = field(default_factory=dict)
+    deleted : List[Any] = field(default_factory=list)
+
+def _tick(tree : BehaviorTree, op : str, updates : Optional[Dict[Any, Any]]) -> TickResult:
+    bb = tree.blackboard
+    if updates:
+        for key, value in updates.items():
+            bb[key] = value
+
+    checkpoint = bb.checkpoint()
+    if op == "tick":
+        status = tree.tick_once()
+    else:
+        status = tree.tick_while_running()
+    delta = bb.delta_since(checkpoint)
+    return TickResult(status, delta.values, delta.deleted)
+
+def _worker(requests, results) -> None:
+    trees : Dict[Any, BehaviorTree] = {}
+    while True:
+        message = requests.get()
+        if message is None:
+            break
+        request_id, op, session_id, payload = message
+        try:
+            payload = pickle.loads(payload)
+            match op:
+                case "add":
+                    trees[session_id] = payload
+                    result = None
+                case "remove":
+                    tree = trees.pop(session_id)
+                    tree.executor.shutdown(wait=False)
+                    result = None
+                case "get":
+                    result = trees[session_id]
+                case "tick" | "tick_while_running":
+                    result = _tick(trees[session_id], op, payload)
+                case _:
+                    raise ValueError(f"unknown request {op}")
+            # pickle here rather than in the queue's feeder thread, where
+            # a failure would be lost and the request never answered.
+            result = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            results.put((request_id, True, result))
+        except BaseException as ex:
+            # exceptions may not pickle, so send the traceback as text.
+            results.put((request_id, False, "".join(traceback.format_exception(ex))))
+    for tree in trees.values():
+        tree.executor.shutdown(wait=False)
+
+class TreePoolError(RuntimeError):
+    """
+    An exception raised while a `TreePool` worker handled a request, or
+    because the worker died before answering it. The message holds the
+    worker's traceback, or the worker's exit code.
+    """
+
+class TreePool:
+    """
+    Runs many `BehaviorTree`s in a pool of worker processes, so that
+    CPU-bound trees made of pure-Python conditions and actions tick in
+    parallel instead of taking turns holding the GIL.
+
+    Each tree belongs to a session. Sessions are sharded across the
+    workers by a hash of their id, so a session's tree always lives in
+    the same worker process and keeps its state between requests. Trees
+    are sent to their worker by pickling (see `BehaviorTree.__getstate__`),
+    so their nodes must be picklable; nodes should hold models by name in
+    the tree's registry rather than holding large objects directly.
+
+    Requests return `concurrent.futures.Future`s. A tick request carries
+    optional blackboard updates, applied before the tick, and resolves to
+    a `TickResult` with the root's status and the blackboard keys that
+    the tick wrote, taken from the blackboard's write log (see
+    `Blackboard.delta_since`), so a client can mirror a session's 
+    blackboard without fetching the whole tree.
+
+    If a worker process dies, the requests it had not answered fail with
+    `TreePoolError`, as do later requests for its sessions.
+
+    Args:
+        n_workers (`Optional[int]`):
+            The number of worker processes. Defaults to the number of CPUs.
+        mp_context (`Optional[multiprocessing.context.BaseContext]`):
+            The multiprocessing context used to start workers. Defaults to
+            the "spawn" context, which is safe with threads and CUDA.
+    """
+
+    def __init__(self, n_workers : Optional[int] = None, mp_context = None) -> None:
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if mp_context is None:
+            mp_context = multiprocessing.get_context("spawn")
+        self.n_workers = n_workers
+        self.results = mp_context.Queue()
+        self.requests = [mp_context.Queue() for _ in range(n_workers)]
+        self.workers = [
+            mp_context.Process(target=_worker, args=(q, self.results), name=f"dendron-pool-{i}", daemon=True)
+            for i, q in enumerate(self.requests)
+        ]
+        for worker in self.workers:
+            worker.start()
+
+        # The future and worker index of every request not yet answered,
+        # and the indices of the workers that died.
+        self.pending : Dict[int, Tuple[futures.Future, int]] = {}
+        self.dead_workers : Set[int] = set()
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self.closed = False
+        self.result_thread = threading.Thread(target=self._collect, name="dendron-pool-results", daemon=True)
+        self.result_thread.start()
+
+    def __enter__(self) -> "TreePool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _collect(self) -> None:
+        while True:
+            try:
+                message = self.results.get(timeout=0.1)
+            except queue.Empty:
+                if not self.closed:
+                    self._check_workers()
+                continue
+            if message is None:
+                break
+            self._resolve(message)
+
+    def _resolve(self, message : Tuple[int, bool, Any]) -> None:
+        request_id, ok, result = message
+        with self._lock:
+            entry = self.pending.pop(request_id, None)
+        if entry is None:
+            # already failed, as held by a worker that died.
+            return
+        fut = entry[0]
+        if not ok:
+            fut.set_exception(TreePoolError(result))
+            return
+        try:
+            fut.set_result(pickle.loads(result))
+        except Exception as ex:
+            fut.set_exception(TreePoolError(f"the result could not be unpickled: {ex!r}"))
+
+    def _check_workers(self) -> None:
+        # Fail the requests held by workers that died, once the answers
+        # they sent before dying have been read.
+        dead = [i for i, worker in enumerate(self.workers) if i not in self.dead_workers and not worker.is_alive()]
+        if not dead:
+            return
+        while True:
+            try:
+                message = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if message is not None:
+                self._resolve(message)
+        with self._lock:
+            self.dead_workers.update(dead)
+            lost = {request_id : entry for request_id, entry in self.pending.items() if entry[1] in dead}
+            for request_id in lost:
+                del self.pending[request_id]
+        for fut, i in lost.values():
+            fut.set_exception(TreePoolError(f"worker {i} died with exit code {self.workers[i].exitcode}"))
+
+    def shard(self, session_id : Any) -> int:
+        """
+        Get the index of the worker that holds a session.
+
+        Args:
+            session_id (`Any`):
+                The session id. Must be a `str`, `bytes` or `int`, so that
+                it shards the same way in every process.
+
+        Returns:
+            `int`: The worker index.
+        """
+        match session_id:
+            case int():
+                return session_id % self.n_workers
+            case str():
+                return zlib.crc32(session_id.encode("utf-8")) % self.n_workers
+            case bytes():
+                return zlib.crc32(session_id) % self.n_workers
+        raise TypeError("session ids must be str, bytes or int")
+
+    def _submit(self, op : str, session_id : Any, payload : Any = None) -> futures.Future:
+        if self.closed:
+            raise RuntimeError("the pool is closed")
+        shard = self.shard(session_id)
+        # pickle here, so that a payload that does not pickle raises to
+        # the caller.
+        payload = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        fut = futures.Future()
+        with self._lock:
+            if shard in self.dead_workers:
+                fut.set_exception(TreePoolError(f"worker {shard} died with exit code {self.workers[shard].exitcode}"))
+                return fut
+            request_id = next(self._ids)
+            self.pending[request_id] = (fut, shard)
+        self.requests[shard].put((request_id, op, session_id, payload))
+        return fut
+
+    def add_tree(self, session_id : Any, tree : BehaviorTree) -> futures.Future:
+        """
+        Send a tree to the worker for `session_id`, replacing any tree the
+        session already has.
+
+        Args:
+            session_id (`Any`):
+                The session id.
+            tree (`dendron.behavior_tree.BehaviorTree`):
+                The tree. It is pickled, so later changes to this copy do
+                not reach the worker.
+
+        Returns:
+            `concurrent.futures.Future`: Resolves to `None` once the
+            worker holds the tree.
+        """
+        return self._submit("add", session_id, tree)
+
+    def remove_tree(self, session_id : Any) -> futures.Future:
+        """
+        Drop the tree of a session.
+
+        Args:
+            session_id (`Any`):
+                The session id.
+
+        Returns:
+            `concurrent.futures.Future`: Resolves to `None` once the tree
+            is dropped.
+        """
+        return self._submit("remove", session_id)
+
+    def get_tree(self, session_id : Any) -> futures.Future:
+        """
+        Fetch a copy of the current state of a session's tree.
+
+        Args:
+            session_id (`Any`):
+                The session id.
+
+        Returns:
+            `concurrent.futures.Future`: Resolves to a copy of the tree.
+        """
+        return self._submit("get", session_id)
+
+    def tick(self, session_id : Any, updates : Optional[Dict[Any, Any]] = None) -> futures.Future:
+        """
+        Tick a session's tree once, as `BehaviorTree.tick_once`.
+
+        Args:
+            session_id (`Any`):
+                The session id.
+            updates (`Optional[Dict[Any, Any]]`):
+                Blackboard values to write before the tick.
+
+        Returns:
+            `concurrent.futures.Future`: Resolves to a `TickResult`.
+        """
+        return self._submit("tick", session_id, updates)
+
+    def tick_while_running(self, session_id : Any, updates : Optional[Dict[Any, Any]] = None) -> futures.Future:
+        """
+        Tick a session's tree until it stops running, as
+        `BehaviorTree.tick_while_running`. Other sessions on the same
+        worker wait until it is done.
+
+        Args:
+            session_id (`Any`):
+                The session id.
+            updates (`Optional[Dict[Any, Any]]`):
+                Blackboard values to write before the first tick.
+
+        Returns:
+            `concurrent.futures.Future`: Resolves to a `TickResult` whose
+            delta covers all of the ticks.
+        """
+        return self._submit("tick_while_running", session_id, updates)
+
+    def close(self) -> None:
+        """
+        Stop the workers, after they finish the requests already sent,
+        and drop their trees.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        for q in self.requests:
+            q.put(None)
+        for worker in self.workers:
+            worker.join()
+        self.results.put(None)
+        self.result_thread.join()
+        with self._lock:
+            pending, self.pending = self.pending, {}
+        for fut, _ in pending.values():
+            fut.set_exception(TreePoolError("the pool was closed"))
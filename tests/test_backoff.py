@@ -0,0 +1,130 @@
+from dendron import BehaviorTree, NodeStatus
+from dendron.actions import SimpleAction
+from dendron.decorators import RetryWithBackoff, RepeatWithBackoff, Retry
+from dendron.timers import Backoff, TreeTimer
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+def make_tree(decorator, clock):
+    tree = BehaviorTree("backoff-tree", decorator)
+    tree.timer = TreeTimer(clock)
+    return tree
+
+def flaky(n_failures):
+    calls = []
+    def callback():
+        calls.append(None)
+        return NodeStatus.FAILURE if len(calls) <= n_failures else NodeStatus.SUCCESS
+    return calls, callback
+
+def test_tree_timer_order_and_cancel():
+    clock = FakeClock()
+    timer = TreeTimer(clock)
+    fired = []
+    timer.call_at(2.0, lambda: fired.append("b"))
+    cancelled = timer.call_at(1.5, lambda: fired.append("x"))
+    timer.call_at(1.0, lambda: fired.append("a"))
+    timer.cancel(cancelled)
+
+    assert timer.run_due() == 0
+    assert timer.next_deadline() == 1.0
+    clock.t = 5.0
+    assert timer.run_due() == 2
+    assert fired == ["a", "b"]
+    assert timer.next_deadline() is None
+
+def test_retry_with_backoff_waits_between_attempts():
+    clock = FakeClock()
+    calls, callback = flaky(2)
+    node = RetryWithBackoff("retry", SimpleAction("flaky", callback), n_times=5, backoff=Backoff(initial=1.0, jitter="none"))
+    tree = make_tree(node, clock)
+
+    assert tree.tick_once() == NodeStatus.RUNNING
+    assert len(calls) == 1
+    # waiting: the child is not ticked again until the delay has passed.
+    clock.t = 0.5
+    assert tree.tick_once() == NodeStatus.RUNNING
+    assert len(calls) == 1
+
+    clock.t = 1.0
+    assert tree.tick_once() == NodeStatus.RUNNING
+    assert len(calls) == 2
+    # the second delay is twice the first.
+    clock.t = 2.9
+    assert tree.tick_once() == NodeStatus.RUNNING
+    assert len(calls) == 2
+    clock.t = 3.0
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert len(calls) == 3
+
+def test_retry_with_backoff_gives_up():
+    clock = FakeClock()
+    calls, callback = flaky(10)
+    node = RetryWithBackoff("retry", SimpleAction("flaky", callback), n_times=3, backoff=Backoff(initial=0.0))
+    tree = make_tree(node, clock)
+    statuses = [tree.tick_once() for _ in range(3)]
+    assert statuses == [NodeStatus.RUNNING, NodeStatus.RUNNING, NodeStatus.FAILURE]
+    assert len(calls) == 3
+
+def test_repeat_with_backoff():
+    clock = FakeClock()
+    calls = []
+    action = SimpleAction("action", lambda: calls.append(None) or NodeStatus.SUCCESS)
+    node = RepeatWithBackoff("repeat", action, n_times=3, backoff=Backoff(initial=0.5, multiplier=1.0, jitter="none"))
+    tree = make_tree(node, clock)
+
+    assert tree.tick_once() == NodeStatus.RUNNING
+    assert tree.tick_once() == NodeStatus.RUNNING
+    assert len(calls) == 1
+    clock.t = 0.5
+    assert tree.tick_once() == NodeStatus.RUNNING
+    clock.t = 1.0
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert len(calls) == 3
+
+    # a reset cancels a pending wait.
+    assert tree.tick_once() == NodeStatus.RUNNING
+    tree.reset()
+    assert node.wait_handle is None
+    assert tree.tick_once() == NodeStatus.RUNNING
+    assert len(calls) == 5
+
+def test_backoff_jitter_bounds():
+    backoff = Backoff(initial=1.0, multiplier=2.0, max_delay=5.0, jitter="equal", seed=1)
+    for attempt in range(10):
+        base = min(5.0, 2.0 ** attempt)
+        assert base / 2 <= backoff.delay(attempt) <= base
+
+def test_backoff_large_attempts():
+    assert Backoff(multiplier=10, jitter="none").delay(400) == 30.0
+    assert Backoff(multiplier=2, jitter="none").delay(1024) == 30.0
+    assert Backoff(multiplier=2, jitter="none").delay(10 ** 6) == 30.0
+    assert Backoff(initial=0.0, multiplier=10, jitter="none").delay(400) == 0.0
+    assert Backoff(initial=0.5, multiplier=1.0, jitter="none").delay(10 ** 6) == 0.5
+    # the cap is reached exactly where the schedule crosses it.
+    backoff = Backoff(initial=1.0, multiplier=2.0, max_delay=5.0, jitter="none")
+    assert [backoff.delay(attempt) for attempt in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+def test_retry_with_backoff_many_attempts():
+    clock = FakeClock()
+    n_failures = 2000
+    calls, callback = flaky(n_failures)
+    node = RetryWithBackoff("retry", SimpleAction("flaky", callback), n_times=n_failures + 1, backoff=Backoff(multiplier=10, jitter="none"))
+    tree = make_tree(node, clock)
+
+    while tree.tick_once() == NodeStatus.RUNNING:
+        clock.t += 30.0
+    assert len(calls) == n_failures + 1
+
+def test_blocking_retry_constructs():
+    calls, callback = flaky(2)
+    node = Retry("retry", SimpleAction("flaky", callback), n_times=5)
+    assert node.name == "retry"
+    tree = BehaviorTree("retry-tree", node)
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert len(calls) == 3
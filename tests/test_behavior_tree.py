@@ -0,0 +1,42 @@
+from dendron import BehaviorTree, NodeStatus, NodeType
+from dendron.actions import AlwaysSuccess, AlwaysFailure
+from dendron.controls import Sequence, Fallback
+from dendron.decorators import Inverter
+
+def test_node_index_by_name_and_path():
+    a = AlwaysSuccess("IndexA")
+    b = AlwaysFailure("IndexB")
+    seq = Sequence([a, b], name="IndexSeq")
+
+    tree = BehaviorTree("index-tree", seq)
+
+    assert tree.get_node_by_name("IndexA") is a
+    assert tree.get_node_by_path("IndexSeq/IndexB") is b
+    assert tree.get_node_path(a) == "IndexSeq/IndexA"
+    assert set(tree.nodes_of_type(NodeType.ACTION)) == {a, b}
+    assert list(tree.nodes_of_type(NodeType.CONTROL)) == [seq]
+
+def test_node_index_tracks_structure_changes():
+    seq = Sequence(name="ChangeSeq")
+    tree = BehaviorTree("change-tree", seq)
+
+    fallback = Fallback(name="ChangeFallback")
+    seq.add_child(fallback)
+    first = AlwaysSuccess("ChangeFirst")
+    fallback.add_children([first])
+    assert tree.get_node_by_path("ChangeSeq/ChangeFallback/ChangeFirst") is first
+    assert first.tree is tree
+
+    inverter = Inverter("ChangeInverter", AlwaysFailure("ChangeOld"))
+    seq.add_child(inverter)
+    assert tree.get_node_by_name("ChangeOld") is not None
+
+    new_child = AlwaysSuccess("ChangeNew")
+    inverter.set_child(new_child)
+    assert tree.get_node_by_name("ChangeOld") is None
+    assert tree.get_node_by_path("ChangeSeq/ChangeInverter/ChangeNew") is new_child
+
+    tree.set_root(AlwaysSuccess("ChangeRoot"))
+    assert tree.get_node_by_name("ChangeSeq") is None
+    assert list(tree.nodes_of_type(NodeType.ACTION)) == [tree.root]
+    assert tree.tick_once() == NodeStatus.SUCCESS
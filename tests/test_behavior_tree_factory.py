@@ -1,4 +1,9 @@
 from dendron import *
+from dendron.controls import Sequence
+
+import sys
+
+import pytest
 
 # moving away from XML-based tree factory, so marking this as deprecated
 # to remove from tests.
@@ -14,4 +19,74 @@ def deprecated_test_create_from_groot0():
 
     tree = factory.create_from_groot("tests/data/TestTree0.xml")
 
-    tree.pretty_print()
\ No newline at end of file
+    tree.pretty_print()
+
+def make_factory():
+    factory = BehaviorTreeFactory()
+    factory.register_simple_action("Action1", lambda: NodeStatus.SUCCESS)
+    factory.register_simple_condition("Precond1", lambda: NodeStatus.SUCCESS)
+    return factory
+
+def test_create_from_groot_forward_subtree(tmp_path):
+    xml = """<?xml version="1.0" encoding="UTF-8"?>
+<root BTCPP_format="4" main_tree_to_execute="Main">
+  <BehaviorTree ID="Main">
+    <Sequence>
+      <SubTree ID="Child"/>
+      <Inverter>
+        <SubTree ID="Child"/>
+      </Inverter>
+    </Sequence>
+  </BehaviorTree>
+  <BehaviorTree ID="Child">
+    <Sequence>
+      <Precond1 input_key="x"/>
+      <Action1/>
+    </Sequence>
+  </BehaviorTree>
+  <TreeNodesModel>
+    <Action ID="Action1"/>
+    <Condition ID="Precond1"/>
+  </TreeNodesModel>
+</root>
+"""
+    xml_file = tmp_path / "forward.xml"
+    xml_file.write_text(xml)
+
+    factory = make_factory()
+    tree = factory.create_from_groot(str(xml_file))
+
+    assert tree.tree_name == "Main"
+    assert tree.blackboard["input_key"] == "x"
+    root = tree.root
+    assert root.children_count() == 2
+    assert root.child(0).children_count() == 2
+    assert root.child(1).get_child().children_count() == 2
+    assert root.child(0) is not root.child(1).get_child()
+    assert tree.tick_once() == NodeStatus.FAILURE
+
+def test_create_from_groot_deep_tree(tmp_path):
+    # deeper than the interpreter allows recursive calls to go.
+    depth = sys.getrecursionlimit() + 500
+    xml = '<root BTCPP_format="4"><BehaviorTree ID="Deep">'
+    xml += "<Sequence>" * depth + "<Action1/>" + "</Sequence>" * depth
+    xml += "</BehaviorTree></root>"
+    xml_file = tmp_path / "deep.xml"
+    xml_file.write_text(xml)
+
+    factory = make_factory()
+    tree = factory.create_from_groot(str(xml_file))
+
+    node = tree.root
+    levels = 0
+    while isinstance(node, Sequence):
+        assert node.children_count() == 1
+        node = node.child(0)
+        levels += 1
+    assert levels == depth
+    assert node.node_type() == NodeType.ACTION
+
+def test_create_from_groot_subtree_cycle(tmp_path):
+    factory = make_factory()
+    with pytest.raises(RuntimeError):
+        factory.create_from_groot("tests/data/TestTree2.xml")
@@ -1,5 +1,7 @@
 from dendron.blackboard import *
 
+import threading
+
 def test_set_entry_new_description():
     bb = Blackboard()
     bb["age"] = 32
@@ -34,4 +36,74 @@ def test_set_entry_new_type_constructor():
     assert new_age_entry.description == "Autogenerated entry"
     assert new_age_entry.type_constructor == int
 
-    
\ No newline at end of file
+    
+def test_delta_since_checkpoint():
+    bb = Blackboard()
+    bb["a"] = 1
+    bb["b"] = "x"
+    bb["c"] = 3.0
+    cp = bb.checkpoint()
+
+    bb["b"] = "y"
+    bb["d"] = [1, 2]
+    del bb["c"]
+    delta = bb.delta_since(cp)
+    assert delta.values == {"b" : "y", "d" : [1, 2]}
+    assert delta.deleted == ["c"]
+    assert len(delta) == 3
+    assert len(bb.delta_since(bb.checkpoint())) == 0
+
+    # deltas travel as bytes and bring a copy up to date.
+    copy = Blackboard()
+    copy.apply_delta(BlackboardDelta.from_bytes(bb.delta_since(0).to_bytes()))
+    assert {k : copy[k] for k in copy} == {k : bb[k] for k in bb}
+
+    bb.set_entry("a", type_constructor=float)
+    bb["c"] = 4.0
+    cp = bb.checkpoint()
+    bb["a"] = 2
+    copy.apply_delta(bb.delta_since(0))
+    assert "c" in copy
+    assert copy.get_entry("a").type_constructor == float
+    copy.apply_delta(bb.delta_since(cp))
+    assert copy["a"] == 2.0
+
+class PausingLog(dict):
+    # A delete log that holds the thread named "slow" the first time it
+    # is checked, which is after the thread took a version for a write.
+    def __init__(self):
+        super().__init__()
+        self.paused = threading.Event()
+        self.go_on = threading.Event()
+
+    def __bool__(self):
+        if threading.current_thread().name == "slow" and not self.paused.is_set():
+            self.paused.set()
+            self.go_on.wait(5)
+        return len(self) > 0
+
+def test_deltas_with_concurrent_writers():
+    bb = Blackboard()
+    cp = bb.checkpoint()
+    bb.delete_log = log = PausingLog()
+    deltas = []
+
+    slow = threading.Thread(target=bb.__setitem__, args=("a", 1), name="slow")
+    fast = threading.Thread(target=bb.__setitem__, args=("b", 1))
+    reader = threading.Thread(target=lambda: deltas.append(bb.delta_since(cp)))
+    slow.start()
+    log.paused.wait(5)
+    # a later write, and a delta, while the first write is being logged.
+    fast.start()
+    fast.join(0.2)
+    reader.start()
+    reader.join(0.2)
+    log.go_on.set()
+    for t in (slow, fast, reader):
+        t.join()
+
+    mirror = Blackboard()
+    mirror.apply_delta(deltas[0])
+    mirror.apply_delta(bb.delta_since(deltas[0].version))
+    assert {k : mirror[k] for k in mirror} == {"a" : 1, "b" : 1}
+    assert list(bb.write_log.values()) == sorted(bb.write_log.values())
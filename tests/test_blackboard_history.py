@@ -0,0 +1,98 @@
+from dendron import ActionNode, BehaviorTree, NodeStatus
+from dendron.decorators import BlackboardHistory
+from dendron.history_buffer import HistoryBuffer
+from dendron.persistent_blackboard import PersistentBlackboard
+from dendron.timers import TreeTimer
+
+import numpy as np
+import pytest
+
+class Reader(ActionNode):
+    def __init__(self, name):
+        super().__init__(name)
+        self.input_key = "speed"
+
+    def tick(self):
+        return NodeStatus.SUCCESS
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+def test_ring_buffer_windows():
+    h = HistoryBuffer(4)
+    assert len(h) == 0 and len(h.last(3)) == 0
+    for i in range(6):
+        h.append(float(i), t=i)
+    assert h.values_array.dtype == np.float64
+    assert list(h.values()) == [2.0, 3.0, 4.0, 5.0]
+    assert list(h.last(3)) == [3.0, 4.0, 5.0]
+    assert h[0] == 2.0 and h[-1] == 5.0
+    assert h.n_appended == 6
+
+    values, times = h.between(3, 5)
+    assert list(values) == [3.0, 4.0] and list(times) == [3, 4]
+    assert list(h.between(0, 100)[0]) == [2.0, 3.0, 4.0, 5.0]
+    assert len(h.between(10, 20)[0]) == 0
+
+    frames = HistoryBuffer(2)
+    for i in range(3):
+        frames.append(np.full((2, 2), i, dtype=np.uint8))
+    assert frames.values().shape == (2, 2, 2)
+    assert frames.last(1)[0, 0, 0] == 2
+
+    words = HistoryBuffer(2)
+    words.append("a")
+    words.append({"b" : 1})
+    assert list(words) == ["a", {"b" : 1}]
+
+def test_mixed_values_are_not_coerced():
+    history = HistoryBuffer(8)
+    for value in (1, 2.7, True):
+        history.append(value)
+    assert history.values().tolist() == [1.0, 2.7, 1.0]
+
+    history.append("fast")
+    assert history.values().tolist() == [1.0, 2.7, 1.0, "fast"]
+
+    # an explicit dtype converts values.
+    history = HistoryBuffer(8, dtype=np.int64)
+    history.append(1)
+    history.append(2.7)
+    assert history.values().tolist() == [1, 2]
+
+    history = HistoryBuffer(8)
+    history.append(np.zeros(2, dtype=np.int8))
+    history.append(np.full(2, 0.5))
+    assert history.values().tolist() == [[0.0, 0.0], [0.5, 0.5]]
+    with pytest.raises(ValueError):
+        history.append(np.zeros(3))
+
+def test_history_is_bounded_and_downsampled():
+    clock = FakeClock()
+    node = BlackboardHistory("history", Reader("reader"), "speed", capacity=8, every=2)
+    tree = BehaviorTree("history-tree", node)
+    tree.timer = TreeTimer(clock)
+    for i in range(100):
+        clock.t = i / 10
+        tree.blackboard["speed"] = i
+        tree.tick_once()
+
+    history = tree.blackboard["reader/speed/history"]
+    assert len(history) == 8 and history.n_appended == 50
+    assert list(history.values()) == list(range(84, 100, 2))
+    assert list(history.between(9.0, 9.5)[0]) == [90, 92, 94]
+
+def test_history_persists(tmp_path):
+    with PersistentBlackboard(str(tmp_path)) as bb:
+        node = BlackboardHistory("history", Reader("reader"), "speed", capacity=4)
+        tree = BehaviorTree("history-tree", node, bb)
+        for i in range(6):
+            bb["speed"] = i
+            tree.tick_once()
+
+    with PersistentBlackboard(str(tmp_path)) as bb:
+        assert list(bb["reader/speed/history"].values()) == [2, 3, 4, 5]
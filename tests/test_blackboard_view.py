@@ -0,0 +1,113 @@
+from dendron import ActionNode, BehaviorTree, BehaviorTreeFactory, Blackboard, BlackboardView, NodeStatus
+from dendron.controls import Sequence
+from dendron.decorators import Inverter, SubTree
+
+import pytest
+
+class Double(ActionNode):
+    # reads "in" and writes "out", whatever they are bound to.
+    def tick(self):
+        self.blackboard["out"] = self.blackboard["in"] * 2
+        return NodeStatus.SUCCESS
+
+def test_view_routes_keys():
+    bb = Blackboard()
+    bb["speed"] = 1
+    bb["shared"] = "s"
+    view = BlackboardView(bb, {"in" : "speed"}, {"mode" : "fast"})
+    assert view["in"] == 1 and view["mode"] == "fast" and view["shared"] == "s"
+    view["in"] = 2
+    view["scratch"] = 0
+    assert bb["speed"] == 2 and bb["scratch"] == 0
+    assert "mode" not in bb and "in" not in bb
+    assert set(view) == {"in", "mode", "shared", "scratch"}
+
+    isolated = BlackboardView(bb, {"in" : "speed"}, isolated=True)
+    isolated["scratch"] = 1
+    assert bb["scratch"] == 0 and isolated["scratch"] == 1
+    assert "shared" not in isolated
+
+    # remapping through a view resolves to the root blackboard.
+    nested = BlackboardView(view, {"x" : "in"})
+    assert nested.routes["x"] == (bb, "speed")
+    nested["x"] = 5
+    assert bb["speed"] == 5
+
+def test_nested_view_lists_keys_once():
+    bb = Blackboard()
+    bb["a"] = 1
+    bb["b"] = 2
+    outer = BlackboardView(bb, {"x" : "a"})
+    inner = BlackboardView(outer, {"y" : "x"})
+    assert list(outer) == ["x", "b"]
+    assert list(inner) == ["y", "b"] and len(inner) == 2
+
+def test_view_deltas():
+    bb = Blackboard()
+    view = BlackboardView(bb, {"x" : "a"}, {"mode" : "fast"})
+    with pytest.raises(TypeError):
+        view.checkpoint()
+    with pytest.raises(TypeError):
+        view.delta_since(0)
+
+    # deltas are taken from the viewed blackboard, and applied through
+    # a view in its own key names.
+    source = Blackboard()
+    cp = source.checkpoint()
+    source["x"] = 1
+    source["scratch"] = 2
+    view.apply_delta(source.delta_since(cp))
+    assert bb.value_mapping == {"a" : 1, "scratch" : 2}
+
+    cp = source.checkpoint()
+    del source["x"]
+    view.apply_delta(source.delta_since(cp))
+    assert bb.value_mapping == {"scratch" : 2}
+
+def test_one_subtree_many_bindings():
+    bb = Blackboard()
+    bb["a"] = 1
+    bb["b"] = 10
+    root = Sequence([
+        SubTree("first", Double("double"), {"in" : "a", "out" : "a2"}),
+        SubTree("second", Double("double"), {"in" : "b", "out" : "b2"}),
+    ], "seq")
+    tree = BehaviorTree("view-tree", root, bb)
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert (bb["a2"], bb["b2"]) == (2, 20)
+    assert "in" not in bb and "out" not in bb
+
+    # nodes added later see the view too.
+    root.children[0].set_child(Inverter("inv", Double("double")))
+    tree.reset()
+    bb["a"] = 3
+    assert tree.tick_once() == NodeStatus.FAILURE
+    assert bb["a2"] == 6
+
+def test_factory_remaps_subtree_ports(tmp_path):
+    xml = """<?xml version="1.0" encoding="UTF-8"?>
+<root BTCPP_format="4" main_tree_to_execute="Main">
+  <BehaviorTree ID="Main">
+    <Sequence>
+      <SubTree ID="Doubler" in="{left}" out="{left_out}"/>
+      <SubTree ID="Doubler" in="ab" out="{text_out}"/>
+    </Sequence>
+  </BehaviorTree>
+  <BehaviorTree ID="Doubler">
+    <Double/>
+  </BehaviorTree>
+  <TreeNodesModel>
+    <Action ID="Double"/>
+  </TreeNodesModel>
+</root>
+"""
+    xml_file = tmp_path / "ports.xml"
+    xml_file.write_text(xml)
+
+    factory = BehaviorTreeFactory()
+    factory.register_action_type("Double", Double)
+    tree = factory.create_from_groot(str(xml_file))
+    tree.blackboard["left"] = 4
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert tree.blackboard["left_out"] == 8
+    assert tree.blackboard["text_out"] == "abab"
@@ -0,0 +1,49 @@
+from dendron import BehaviorTree, NodeStatus
+from dendron.actions import AlwaysSuccess, AsyncAction
+from dendron.controls import Sequence
+from dendron.instrumentation import ChromeTracer
+
+import json
+import threading
+import time
+
+def slow_job():
+    time.sleep(0.01)
+    return NodeStatus.SUCCESS
+
+def test_chrome_trace_export(tmp_path):
+    root = Sequence([AlwaysSuccess("quick"), AsyncAction("slow", slow_job)], name="root")
+    tree = BehaviorTree("chrome-tree", root)
+    tracer = ChromeTracer()
+    tree.add_tracer(tracer)
+
+    assert tree.tick_while_running() == NodeStatus.SUCCESS
+
+    trace_file = tmp_path / "trace.json"
+    tracer.save(str(trace_file))
+    events = json.loads(trace_file.read_text())["traceEvents"]
+
+    main_tid = threading.get_ident()
+    thread_names = {e["tid"] : e["args"]["name"] for e in events if e["name"] == "thread_name"}
+    assert main_tid in thread_names
+
+    depth = {}
+    for e in events:
+        if e["ph"] == "B":
+            depth[e["tid"]] = depth.get(e["tid"], 0) + 1
+        elif e["ph"] == "E":
+            depth[e["tid"]] -= 1
+            assert depth[e["tid"]] >= 0
+    assert all(d == 0 for d in depth.values())
+
+    ticks = [e for e in events if e["ph"] == "B" and e["name"] == "tick"]
+    assert len(ticks) >= 2
+
+    jobs = [e for e in events if e["ph"] == "B" and e["name"] == "root/slow job"]
+    assert len(jobs) == 1
+    assert jobs[0]["tid"] != main_tid
+    assert thread_names[jobs[0]["tid"]].startswith("ThreadPoolExecutor")
+
+    queued = [e for e in events if e["name"] == "queued"]
+    assert [e["ph"] for e in queued] == ["b", "e"]
+    assert queued[1]["ts"] >= queued[0]["ts"]
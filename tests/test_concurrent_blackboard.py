@@ -0,0 +1,94 @@
+from dendron import BehaviorTree, ConcurrentBlackboard, NodeStatus
+from dendron.actions import AsyncAction
+from dendron.controls import Sequence
+from dendron.dataflow import declare_access
+
+import pickle
+import threading
+
+def run_threads(n, target):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+def test_update_is_atomic():
+    bb = ConcurrentBlackboard(n_stripes=4)
+    bb["count"] = 0
+
+    def work(i):
+        for _ in range(2000):
+            bb.update("count", lambda v: v + 1)
+
+    run_threads(8, work)
+    assert bb["count"] == 16000
+
+def test_compare_and_set():
+    bb = ConcurrentBlackboard()
+    assert bb.compare_and_set("owner", ConcurrentBlackboard.MISSING, "a")
+    assert not bb.compare_and_set("owner", ConcurrentBlackboard.MISSING, "b")
+    assert not bb.compare_and_set("owner", "b", "c")
+    assert bb.compare_and_set("owner", "a", "c")
+    assert bb["owner"] == "c"
+
+    winners = []
+    bb["slot"] = ""
+    def claim(i):
+        if bb.compare_and_set("slot", "", str(i)):
+            winners.append(str(i))
+    run_threads(16, claim)
+    assert len(winners) == 1 and bb["slot"] == winners[0]
+
+def test_transaction_keeps_invariant():
+    bb = ConcurrentBlackboard()
+    bb.set_many({f"acct{i}" : 100 for i in range(4)})
+
+    def transfer(i):
+        src, dst = f"acct{i % 4}", f"acct{(i + 1) % 4}"
+        for _ in range(500):
+            with bb.transaction([src, dst]):
+                bb[src] = bb[src] - 1
+                bb[dst] = bb[dst] + 1
+
+    # collected here and checked after the join: an assertion in a
+    # thread would not fail the test.
+    sums = []
+    def audit(i):
+        for _ in range(500):
+            sums.append(sum(bb.get_many([f"acct{j}" for j in range(4)]).values()))
+
+    threads = [threading.Thread(target=transfer, args=(i,)) for i in range(8)]
+    threads.append(threading.Thread(target=audit, args=(0,)))
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(sums) == 500 and set(sums) == {400}
+    assert sum(bb.get_many([f"acct{i}" for i in range(4)]).values()) == 400
+
+def test_async_actions_share_blackboard():
+    bb = ConcurrentBlackboard()
+    barrier = threading.Barrier(4, timeout=5)
+
+    # the updates of "n" are atomic, so the actions only declare their
+    # own keys and the parallel Sequence runs them at the same time.
+    def make_work(i):
+        @declare_access(writes=[f"done{i}"])
+        def work():
+            barrier.wait()
+            for _ in range(1000):
+                bb.update("n", lambda v: v + 1, default=0)
+            bb[f"done{i}"] = True
+            return NodeStatus.SUCCESS
+        return work
+
+    seq = Sequence([AsyncAction(f"a{i}", make_work(i)) for i in range(4)], parallel=True)
+    tree = BehaviorTree("concurrent-tree", seq, bb)
+    assert tree.tick_while_running() == NodeStatus.SUCCESS
+    assert bb["n"] == 4000
+
+    copy = pickle.loads(pickle.dumps(bb))
+    assert copy["n"] == 4000
+    copy.update("n", lambda v: v + 1)
+    assert copy["n"] == 4001
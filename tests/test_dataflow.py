@@ -0,0 +1,78 @@
+from dendron import ActionNode, BehaviorTree, NodeStatus
+from dendron.actions import AlwaysSuccess, SimpleAction
+from dendron.controls import Fallback, Sequence
+from dendron.dataflow import BlackboardAccess, LocalKey, declare_access, node_access
+from dendron.decorators import Inverter, SubTree
+
+class Summarize(ActionNode):
+    # keys named like those of the LM actions.
+    def __init__(self, name, input_key, output_key):
+        super().__init__(name)
+        self.input_key = input_key
+        self.output_key = output_key
+
+    def tick(self):
+        self.blackboard[self.output_key] = self.blackboard[self.input_key][:10]
+        return NodeStatus.SUCCESS
+
+@declare_access(reads=["s1", "s2"], writes=["report"])
+def merge():
+    return NodeStatus.SUCCESS
+
+def test_node_access():
+    assert node_access(Summarize("s", "doc", "summary")) == BlackboardAccess.of(["doc"], ["summary"])
+    assert node_access(SimpleAction("m", merge)) == BlackboardAccess.of(["s1", "s2"], ["report"])
+    assert node_access(SimpleAction("u", lambda: NodeStatus.SUCCESS)).opaque
+    assert node_access(AlwaysSuccess("ok")).is_empty()
+    assert node_access(Sequence([], "seq")).is_empty()
+
+def test_tick_functions_count():
+    def untracked(self):
+        pass
+
+    @declare_access(writes=["speech_in"])
+    def set_next_speech(self):
+        self.blackboard["speech_in"] = self.blackboard["out"]
+
+    node = Summarize("chat", "in", "out")
+    node.add_post_tick(set_next_speech)
+    assert node_access(node) == BlackboardAccess.of(["in"], ["out", "speech_in"])
+    node.add_pre_tick(untracked)
+    assert node_access(node).opaque
+
+def test_tree_dataflow():
+    s1 = Summarize("s1", "doc1", "s1")
+    s2 = Summarize("s2", "doc2", "s2")
+    m = SimpleAction("merge", merge)
+    audit = Summarize("audit", "doc1", "unused")
+    root = Sequence([Sequence([s1, s2], "summaries"), m, Inverter("inv", audit)], "root")
+    flow = BehaviorTree("flow-tree", root).dataflow()
+
+    assert flow.subtree_access[root.children[0]] == BlackboardAccess.of(["doc1", "doc2"], ["s1", "s2"])
+    assert not flow.conflicts(s1, s2)
+    assert flow.conflicts(root.children[0], m)
+    assert flow.readers["doc1"] == [s1, audit]
+    assert flow.writers["s2"] == [s2]
+
+    edges = {(d.source.name, d.target.name, d.kind, d.keys) for d in flow.dependencies}
+    assert edges == {
+        ("s1", "merge", "raw", frozenset(["s1"])),
+        ("s2", "merge", "raw", frozenset(["s2"])),
+    }
+    assert set(flow.dead_writes()) == {"report", "unused"}
+
+    # an undeclared callback could touch anything.
+    root.add_child(SimpleAction("opaque", lambda: NodeStatus.SUCCESS))
+    flow = BehaviorTree("flow-tree", root).dataflow()
+    assert flow.dead_writes() == {}
+    assert flow.conflicts(root.children[-1], s1)
+
+def test_subtree_keys_are_translated():
+    inner = Summarize("inner", "in", "out")
+    sub = SubTree("sub", inner, {"in" : "doc"}, {"style" : "short"}, isolated=True)
+    root = Fallback([sub, Summarize("after", "out", "final")], "root")
+    flow = BehaviorTree("flow-tree", root).dataflow()
+
+    assert flow.access[inner] == BlackboardAccess.of(["doc"], [LocalKey(sub, "out")])
+    # "out" stays inside the isolated subtree.
+    assert not flow.conflicts(sub, root.children[1])
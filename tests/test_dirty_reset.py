@@ -0,0 +1,54 @@
+from dendron import BehaviorTree, NodeStatus
+from dendron.actions import AlwaysSuccess, AlwaysFailure, SimpleAction
+from dendron.controls import Sequence, Fallback
+
+class CountingSuccess(AlwaysSuccess):
+    def __init__(self, name):
+        super().__init__(name)
+        self.n_resets = 0
+
+    def reset(self):
+        self.n_resets += 1
+        super().reset()
+
+def test_reset_skips_children_that_did_not_run():
+    leaves = [CountingSuccess(f"leaf{i}") for i in range(10)]
+    fallback = Fallback(leaves, name="fallback")
+    tree = BehaviorTree("dirty-tree", fallback)
+
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert leaves[0].n_resets == 1
+    assert all(leaf.n_resets == 0 for leaf in leaves[1:])
+    assert not leaves[0].dirty
+
+    # the fallback reset itself when it finished, so a tree-level reset
+    # has nothing left to do below it.
+    tree.reset()
+    assert leaves[0].n_resets == 1
+
+def test_reset_after_partial_run():
+    first = CountingSuccess("first")
+    rest = [CountingSuccess(f"rest{i}") for i in range(5)]
+    seq = Sequence([first, AlwaysFailure("fails"), *rest], name="seq")
+    tree = BehaviorTree("dirty-tree", seq)
+
+    assert tree.tick_once() == NodeStatus.FAILURE
+    assert first.n_resets == 1
+    assert all(r.n_resets == 0 for r in rest)
+    assert seq.current_child_idx == 0
+
+    # a subtree that is still running is reset by its ancestors.
+    a = CountingSuccess("a")
+    waiting = SimpleAction("waiting", lambda: NodeStatus.RUNNING)
+    inner = Sequence([a, waiting], name="inner")
+    outer = Sequence([inner, CountingSuccess("after")], name="outer")
+    tree = BehaviorTree("nested", outer)
+    assert tree.tick_once() == NodeStatus.RUNNING
+    assert a.dirty and waiting.dirty and inner.dirty
+
+    tree.reset()
+    assert a.n_resets == 1
+    assert not (a.dirty or waiting.dirty or inner.dirty)
+    assert waiting.status == NodeStatus.IDLE
+    assert inner.current_child_idx == 0
+    assert outer.child(1).n_resets == 0
@@ -1,4 +1,8 @@
 from dendron import *
+from dendron.actions import AlwaysSuccess
+from dendron.controls import Sequence
+
+import logging
 
 # moving away from XML-based tree factory, so marking this as deprecated
 # to remove from tests.
@@ -20,3 +24,28 @@ def deprecated_test_logging0(capsys):
     captured = capsys.readouterr()
 
     assert "test output" in captured.err
+
+def test_logging_to_file(tmp_path):
+    log_file = tmp_path / "tree.log"
+
+    tree = BehaviorTree("logging-file-tree", Sequence([AlwaysSuccess("logged_action")]))
+    tree.enable_logging()
+    tree.set_log_filename(str(log_file))
+
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    tree.disable_logging()
+
+    contents = log_file.read_text()
+    assert "logged_action - pre_tick" in contents
+    assert "logged_action - post_tick NodeStatus.SUCCESS" in contents
+
+def test_filtered_logging_enqueues_nothing():
+    tree = BehaviorTree("logging-filtered-tree", AlwaysSuccess("quiet_action"))
+    tree.enable_logging()
+    tree.root.set_log_level(logging.DEBUG)
+    tree.logger.setLevel(logging.WARNING)
+
+    tree.tick_once()
+
+    assert tree.log_queue.empty()
+    tree.disable_logging()
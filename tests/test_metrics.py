@@ -0,0 +1,76 @@
+from dendron import BehaviorTree
+from dendron.actions import AlwaysSuccess, AlwaysFailure
+from dendron.controls import Sequence, Fallback
+from dendron.instrumentation import MetricsExporter
+
+import threading
+import urllib.request
+
+def make_tree():
+    root = Sequence([
+        AlwaysSuccess("first"),
+        Fallback([AlwaysFailure("fails"), AlwaysSuccess("recovers")], name="choice"),
+    ], name="root")
+    return BehaviorTree("metrics-tree", root)
+
+def test_render_openmetrics():
+    tree = make_tree()
+    exporter = MetricsExporter(tree)
+    for _ in range(3):
+        tree.tick_once()
+
+    text = exporter.render()
+    lines = text.splitlines()
+    assert lines[-1] == "# EOF"
+    assert "# TYPE dendron_ticks counter" in lines
+    assert 'dendron_ticks_total{tree="metrics-tree",status="SUCCESS"} 3' in lines
+    assert 'dendron_node_ticks_total{tree="metrics-tree",path="root/choice/fails",status="FAILURE"} 3' in lines
+    assert 'dendron_node_latency_seconds_count{tree="metrics-tree",path="root/first"} 3' in lines
+    assert 'dendron_running_nodes{tree="metrics-tree"} 0' in lines
+    assert 'dendron_executor_queue_depth{tree="metrics-tree"} 0' in lines
+
+def test_queue_depth_counts_waiting_jobs():
+    root = AlwaysSuccess("root")
+    tree = BehaviorTree("metrics-tree", root, num_workers=1)
+    exporter = MetricsExporter(tree)
+
+    # one job holds the only worker, so the others wait.
+    started = threading.Event()
+    release = threading.Event()
+    def block():
+        started.set()
+        release.wait(5)
+    jobs = [tree.submit(root, block)]
+    started.wait(5)
+    jobs += [tree.submit(root, lambda: None) for _ in range(2)]
+    assert 'dendron_executor_queue_depth{tree="metrics-tree"} 2' in exporter.render().splitlines()
+
+    assert jobs[2].cancel()
+    release.set()
+    for job in jobs[:2]:
+        job.result()
+    assert 'dendron_executor_queue_depth{tree="metrics-tree"} 0' in exporter.render().splitlines()
+
+def test_textfile_and_http(tmp_path):
+    tree = make_tree()
+    exporter = MetricsExporter(tree)
+    tree.tick_once()
+
+    prom_file = tmp_path / "dendron.prom"
+    exporter.write_textfile(str(prom_file))
+    text = prom_file.read_text()
+    assert "# TYPE dendron_ticks_total counter" in text
+    assert "# EOF" not in text
+    assert list(tmp_path.iterdir()) == [prom_file]
+
+    server = exporter.serve(port=0)
+    try:
+        host, port = server.server_address
+        request = urllib.request.Request(f"http://{host}:{port}/metrics", headers={"Accept" : "application/openmetrics-text"})
+        with urllib.request.urlopen(request) as response:
+            assert response.headers["Content-Type"].startswith("application/openmetrics-text")
+            body = response.read().decode("utf-8")
+        assert body.endswith("# EOF\n")
+        assert 'dendron_ticks_total{tree="metrics-tree",status="SUCCESS"} 1' in body
+    finally:
+        exporter.stop()
@@ -0,0 +1,41 @@
+from dendron import BehaviorTree
+from dendron.naming import NameScope
+from dendron.actions import AlwaysSuccess
+from dendron.controls import Sequence
+
+def test_name_scope_suffixes():
+    scope = NameScope()
+    assert scope.claim("a") == "a"
+    assert scope.claim("a") == "a_0"
+    assert scope.claim("a_1") == "a_1"
+    assert scope.claim("a") == "a_2"
+
+    scope.release("a")
+    assert "a" not in scope
+    assert scope.claim("a") == "a"
+    assert len(scope) == 4
+
+def test_names_are_unique_per_tree():
+    tree1 = BehaviorTree("names-1", Sequence([AlwaysSuccess("step"), AlwaysSuccess("step")], name="root"))
+    tree2 = BehaviorTree("names-2", Sequence([AlwaysSuccess("step")], name="root"))
+
+    assert [c.name for c in tree1.root.children] == ["step", "step_0"]
+    assert tree2.root.child(0).name == "step"
+    assert tree2.root.name == "root"
+
+def test_rename_updates_index_and_releases_names():
+    leaf = AlwaysSuccess("leaf")
+    seq = Sequence([leaf], name="root")
+    tree = BehaviorTree("rename", seq)
+
+    seq.name = "top"
+    assert tree.get_node_by_path("top/leaf") is leaf
+    assert tree.get_node_by_name("root") is None
+    assert "root" not in tree.names
+
+    seq.add_child(AlwaysSuccess("top"))
+    assert seq.child(1).name == "top_0"
+
+    tree.set_root(AlwaysSuccess("other"))
+    assert "leaf" not in tree.names
+    assert len(tree.names) == 1
@@ -0,0 +1,65 @@
+from dendron import BehaviorTree, NodeStatus
+from dendron.actions import AlwaysSuccess, AlwaysFailure
+from dendron.controls import Sequence, Fallback
+from dendron.instrumentation import LatencyHistogram, TickTracer
+
+import random
+
+def test_latency_histogram_precision():
+    h = LatencyHistogram()
+    values = [random.randrange(1, 10**9) for _ in range(10000)]
+    for v in values:
+        h.record(v)
+
+    values.sort()
+    for q in (0.5, 0.95, 0.99):
+        exact = values[int(q * len(values) + 0.5) - 1]
+        assert abs(h.percentile(q) - exact) <= exact / 64
+    assert h.percentile(1.0) == h.max == values[-1]
+    assert h.min == values[0]
+
+    for v in range(128):
+        low, high = h.bucket_bounds(h._index(v))
+        assert low == high == v
+    for v in (128, 1000, 123456789):
+        low, high = h.bucket_bounds(h._index(v))
+        assert low <= v <= high
+
+def test_tree_stats():
+    fails = AlwaysFailure("fails")
+    root = Sequence([
+        AlwaysSuccess("first"),
+        Fallback([fails, AlwaysSuccess("recovers")], name="choice"),
+    ], name="root")
+    tree = BehaviorTree("stats-tree", root)
+    assert tree.stats() == {}
+
+    tree.enable_stats()
+    for _ in range(10):
+        tree.tick_once()
+    fails.tracer.record_tokens(fails, 12, 3)
+
+    stats = tree.stats()
+    assert set(stats) == {"root", "root/first", "root/choice", "root/choice/fails", "root/choice/recovers"}
+    assert stats["root/choice/fails"]["count"] == 10
+    assert stats["root/choice/fails"]["status_counts"] == {"FAILURE" : 10}
+    assert stats["root/choice/fails"]["tokens_in"] == 12
+    assert stats["root/choice/fails"]["tokens_out"] == 3
+    assert stats["root"]["p50"] <= stats["root"]["p99"] <= stats["root"]["max"]
+    assert stats["root"]["p50"] >= stats["root/first"]["p50"]
+
+    tree.disable_stats()
+    assert tree.stats() == {}
+    assert fails.tracer is None
+
+def test_only_stats_want_tokens():
+    node = AlwaysSuccess("node")
+    tree = BehaviorTree("stats-tree", node)
+    tree.add_tracer(TickTracer(capacity=64))
+    assert not node.tracer.wants_tokens
+
+    # the tracers are grouped once stats are enabled.
+    tree.enable_stats()
+    assert node.tracer.wants_tokens
+    tree.disable_stats()
+    assert not node.tracer.wants_tokens
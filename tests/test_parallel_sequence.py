@@ -0,0 +1,194 @@
+from dendron import ActionNode, BehaviorTree, Blackboard, NodeStatus
+from dendron.actions import AlwaysFailure, SimpleAction
+from dendron.controls import Sequence
+from dendron.dataflow import BlackboardAccess, declare_access
+from dendron.decorators import Timeout
+from dendron.instrumentation import TickTracer, TraceDecoder
+from dendron.slot_blackboard import SlotBlackboard
+from dendron.timers import TreeTimer
+
+import threading
+
+class Summarize(ActionNode):
+    # meets the other Summarize nodes at a barrier, so that the test
+    # only passes if they run at the same time.
+    def __init__(self, name, input_key, output_key, barrier=None):
+        super().__init__(name)
+        self.input_key = input_key
+        self.output_key = output_key
+        self.barrier = barrier
+
+    def tick(self):
+        if self.barrier is not None:
+            self.barrier.wait()
+        self.blackboard[self.output_key] = self.blackboard[self.input_key][:3]
+        return NodeStatus.SUCCESS
+
+def test_independent_children_overlap():
+    barrier = threading.Barrier(3, timeout=5)
+    seq = Sequence([Summarize(f"s{i}", f"doc{i}", f"sum{i}", barrier) for i in range(3)], "seq", parallel=True)
+    tree = BehaviorTree("parallel-tree", seq)
+    for i in range(3):
+        tree.blackboard[f"doc{i}"] = f"document {i}"
+
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert [tree.blackboard[f"sum{i}"] for i in range(3)] == ["doc"] * 3
+    assert seq.current_child_idx == 0
+
+def test_groups_follow_conflicts():
+    a = Summarize("a", "doc", "x")
+    b = Summarize("b", "x", "y")
+    c = Summarize("c", "doc", "z")
+    d = SimpleAction("d", lambda: NodeStatus.SUCCESS)
+    seq = Sequence([a, b, c, d], "seq", parallel=True)
+
+    # b reads what a writes, and d's keys are unknown.
+    assert seq.plan_groups() == [1, 3, 3, 4]
+    assert Sequence([a, b, c], "seq", parallel=True).plan_groups() == [1, 3, 3]
+
+    # a child that touches no keys can join any group.
+    seq.add_child(AlwaysFailure("fail"))
+    assert seq.plan_groups() == [1, 3, 3, 5, 5]
+
+def test_tick_functions_feed_next_child():
+    # the pattern of the tutorial: a post-tick function passes the
+    # output of one node to the input of the next.
+    def set_next_speech(self):
+        self.blackboard["speech_in"] = " " + self.blackboard["out"]
+
+    chat = Summarize("chat", "in", "out")
+    chat.add_post_tick(set_next_speech)
+    speech = Summarize("speech", "speech_in", "speech_out")
+    seq = Sequence([chat, speech], "seq", parallel=True)
+    tree = BehaviorTree("parallel-tree", seq)
+    tree.blackboard["in"] = "hello"
+
+    assert seq.plan_groups() == [1, 2]
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert tree.blackboard["speech_out"] == " he"
+
+    # a declared tick function keeps the node in the analysis.
+    set_next_speech.declared_access = BlackboardAccess.of(["out"], ["speech_in"])
+    seq.group_ends = None
+    assert seq.plan_groups() == [1, 2]
+    other = Summarize("other", "doc", "summary")
+    seq.add_child(other)
+    assert seq.plan_groups() == [1, 3, 3]
+
+def test_finished_children_are_not_ticked_again():
+    ticks = {"slow" : 0, "fast" : 0}
+
+    @declare_access(writes=["slow"])
+    def slow():
+        ticks["slow"] += 1
+        return NodeStatus.RUNNING if ticks["slow"] == 1 else NodeStatus.SUCCESS
+
+    @declare_access(writes=["fast"])
+    def fast():
+        ticks["fast"] += 1
+        return NodeStatus.SUCCESS
+
+    seq = Sequence([SimpleAction("slow", slow), SimpleAction("fast", fast)], "seq", parallel=True)
+    tree = BehaviorTree("parallel-tree", seq)
+
+    assert tree.tick_once() == NodeStatus.RUNNING
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert ticks == {"slow" : 2, "fast" : 1}
+
+def test_first_failure_in_order_wins():
+    halted = []
+
+    @declare_access(writes=["a"])
+    def fail():
+        return NodeStatus.FAILURE
+
+    class Running(ActionNode):
+        def tick(self):
+            return NodeStatus.RUNNING
+
+        def halt_node(self):
+            halted.append(self.name)
+            super().halt_node()
+
+    running = Running("running")
+    running.declared_access = BlackboardAccess.of(writes=["b"])
+    seq = Sequence([SimpleAction("fail", fail), running], "seq", parallel=True)
+    tree = BehaviorTree("parallel-tree", seq)
+
+    assert tree.tick_once() == NodeStatus.FAILURE
+    assert halted == ["running"]
+    assert seq.current_child_idx == 0
+    assert not seq.finished
+
+def test_deadline_reaches_worker_threads():
+    seen = []
+
+    def observe(name):
+        @declare_access(writes=[name])
+        def cb():
+            seen.append(tree.time_remaining())
+            return NodeStatus.SUCCESS
+        return cb
+
+    seq = Sequence([SimpleAction(f"a{i}", observe(f"a{i}")) for i in range(3)], "seq", parallel=True)
+    tree = BehaviorTree("parallel-tree", Timeout("timeout", seq, 1000))
+    tree.timer = TreeTimer(lambda: 0.0)
+
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert seen == [1.0] * 3
+    assert tree.deadline() is None
+
+class Count(ActionNode):
+    # writes its key many times, to interleave with the other children.
+    def __init__(self, name, output_key, barrier):
+        super().__init__(name)
+        self.output_key = output_key
+        self.barrier = barrier
+
+    def tick(self):
+        self.barrier.wait()
+        for n in range(1000):
+            self.blackboard[self.output_key] = n
+            self.blackboard[f"{self.output_key}/{n % 10}"] = n
+        return NodeStatus.SUCCESS
+
+def test_deltas_see_every_parallel_write():
+    for bb in (Blackboard(), SlotBlackboard()):
+        barrier = threading.Barrier(4, timeout=5)
+        seq = Sequence([Count(f"c{i}", f"n{i}", barrier) for i in range(4)], "seq", parallel=True)
+        tree = BehaviorTree("parallel-tree", seq, bb)
+
+        # mirror the blackboard from deltas while the children write.
+        mirror = Blackboard()
+        cp = bb.checkpoint()
+        ticking = threading.Thread(target=tree.tick_once)
+        ticking.start()
+        while ticking.is_alive():
+            delta = bb.delta_since(cp)
+            mirror.apply_delta(delta)
+            cp = delta.version
+        ticking.join()
+        mirror.apply_delta(bb.delta_since(cp))
+
+        assert seq.status == NodeStatus.SUCCESS
+        assert {k : mirror[k] for k in mirror} == {k : bb[k] for k in bb}
+        assert len(set(bb.slot_ids.values())) == len(bb.slot_keys)
+
+def test_parallel_ticks_decode_per_thread(tmp_path):
+    barrier = threading.Barrier(3, timeout=5)
+    seq = Sequence([Summarize(f"s{i}", f"doc{i}", f"sum{i}", barrier) for i in range(3)], "seq", parallel=True)
+    tree = BehaviorTree("parallel-tree", seq)
+    for i in range(3):
+        tree.blackboard[f"doc{i}"] = f"document {i}"
+    tracer = TickTracer()
+    tree.add_tracer(tracer)
+
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    trace_file = tmp_path / "trace.bin"
+    tracer.dump(str(trace_file))
+
+    tick, = TraceDecoder(str(trace_file)).ticks()
+    steps = {step.path : step for step in tick.steps}
+    assert steps["seq"].depth == 0
+    assert all(steps[f"seq/s{i}"].depth == 1 and steps[f"seq/s{i}"].status == NodeStatus.SUCCESS for i in range(3))
+    assert len({steps[f"seq/s{i}"].thread for i in range(3)}) == 3
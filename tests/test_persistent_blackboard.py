@@ -0,0 +1,92 @@
+from dendron.blackboard import BlackboardEntryMetadata
+from dendron.persistent_blackboard import PersistentBlackboard, _Op, _read_records
+
+import os
+import pytest
+import threading
+
+def test_recovers_after_reopen(tmp_path):
+    with PersistentBlackboard(str(tmp_path)) as bb:
+        bb.register_entry(BlackboardEntryMetadata("speed", "Speed in m/s", float))
+        bb["speed"] = 3
+        bb["history"] = []
+        for i in range(5):
+            bb.append("history", i)
+        bb["gone"] = "x"
+        del bb["gone"]
+        bb.set_entry("history", description="Past speeds")
+
+    with PersistentBlackboard(str(tmp_path)) as bb:
+        assert bb["speed"] == 3.0 and type(bb["speed"]) is float
+        assert bb["history"] == [0, 1, 2, 3, 4]
+        assert bb.get_entry("history").description == "Past speeds"
+        assert "gone" not in bb.value_mapping and len(bb) == 2
+
+def test_torn_tail_is_dropped(tmp_path):
+    with PersistentBlackboard(str(tmp_path), durability="always") as bb:
+        bb["a"] = 1
+        bb["b"] = 2
+    # a crash in the middle of writing the last record.
+    log = os.path.join(str(tmp_path), "wal.0.log")
+    os.truncate(log, os.path.getsize(log) - 3)
+
+    with PersistentBlackboard(str(tmp_path)) as bb:
+        assert bb.value_mapping == {"a" : 1}
+        bb["c"] = 3
+    with PersistentBlackboard(str(tmp_path)) as bb:
+        assert bb.value_mapping == {"a" : 1, "c" : 3}
+
+def test_compaction(tmp_path):
+    with PersistentBlackboard(str(tmp_path), compact_bytes=4096) as bb:
+        for i in range(1000):
+            bb["counter"] = i
+        bb.flush()
+        bb.compact()
+        bb["after"] = True
+        assert bb.generation >= 1
+    assert os.path.exists(os.path.join(str(tmp_path), "snapshot.pkl"))
+    logs = [name for name in os.listdir(str(tmp_path)) if name.endswith(".log")]
+    assert len(logs) == 1
+
+    with PersistentBlackboard(str(tmp_path)) as bb:
+        assert bb.value_mapping == {"counter" : 999, "after" : True}
+
+def test_always_durability_compacts(tmp_path):
+    with PersistentBlackboard(str(tmp_path), durability="always", compact_bytes=1000) as bb:
+        assert bb.commit_thread is None
+        for i in range(500):
+            bb["counter"] = i
+            assert bb.log_bytes <= 1000
+        assert bb.generation >= 1
+    assert os.path.exists(os.path.join(str(tmp_path), "snapshot.pkl"))
+
+    with PersistentBlackboard(str(tmp_path)) as bb:
+        assert bb.value_mapping == {"counter" : 499}
+
+def test_one_owner_per_directory(tmp_path):
+    with PersistentBlackboard(str(tmp_path)):
+        with pytest.raises(RuntimeError):
+            PersistentBlackboard(str(tmp_path))
+
+def test_new_keys_are_registered_once(tmp_path):
+    with PersistentBlackboard(str(tmp_path)) as bb:
+        barrier = threading.Barrier(8)
+        def write(i):
+            barrier.wait()
+            for n in range(50):
+                bb[f"key{n}"] = i
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    records, _ = _read_records(os.path.join(str(tmp_path), "wal.0.log"))
+    entries = [record[1] for record in records if record[0] == _Op.ENTRY]
+    assert sorted(entries) == sorted(f"key{n}" for n in range(50))
+    # every key is registered before it is first set.
+    first_set = {}
+    for i, record in enumerate(records):
+        if record[0] == _Op.SET:
+            first_set.setdefault(record[1], i)
+    assert all(records.index((_Op.ENTRY, key, "Autogenerated entry", int)) < i for key, i in first_set.items())
@@ -0,0 +1,45 @@
+from dendron import BehaviorTree, NodeStatus
+from dendron.actions import SimpleAction
+
+import time
+
+def test_tick_at_rate_is_drift_free():
+    tree = BehaviorTree("rate-tree", SimpleAction("a", lambda: NodeStatus.RUNNING))
+    start = time.monotonic()
+    driver = tree.tick_at_rate(200, max_ticks=20)
+    elapsed = time.monotonic() - start
+
+    stats = driver.stats
+    assert stats.n_ticks == 20
+    assert stats.n_overruns == 0
+    # tick 19 is scheduled 95 ms after the first.
+    assert 0.095 <= elapsed < 0.2
+
+def test_overrun_policies():
+    def slow():
+        time.sleep(0.025)
+        return NodeStatus.RUNNING
+
+    tree = BehaviorTree("rate-tree", SimpleAction("slow", slow))
+    skip = tree.tick_at_rate(100, max_ticks=4)
+    assert skip.stats.n_overruns == 4
+    assert skip.stats.n_skipped >= 4
+
+    catch_up = tree.tick_at_rate(100, policy="catch_up", max_ticks=4)
+    assert catch_up.stats.n_skipped == 0
+    # late ticks start as soon as the previous one finishes.
+    assert catch_up.stats.jitter.max >= 0.02e9
+
+def test_threaded_driver_stops():
+    tree = BehaviorTree("rate-tree", SimpleAction("a", lambda: NodeStatus.SUCCESS))
+    driver = tree.tick_at_rate(1000, thread=True)
+    time.sleep(0.05)
+    driver.stop()
+    driver.join(1.0)
+    assert not driver.thread.is_alive()
+    assert driver.stats.n_ticks > 0
+    assert driver.status == NodeStatus.SUCCESS
+    assert driver.stats.summary()["n_ticks"] == driver.stats.n_ticks
+
+    done = tree.tick_at_rate(1000, stop_when_done=True)
+    assert done.stats.n_ticks == 1
@@ -0,0 +1,70 @@
+from dendron import BehaviorTree, NodeStatus
+from dendron.actions import GenerateAction
+from dendron.configs import HFLMConfig, LMActionConfig
+from dendron.replay_lm import LatencyModel, RecordingLM, ReplayLM
+
+from hflm import LM
+
+import time
+
+class EchoLM(LM):
+    def generate_until(self, requests, disable_tqdm=False):
+        time.sleep(0.01)
+        return [context.upper() for context, kwargs in requests]
+
+    def loglikelihood(self, requests, disable_tqdm=False):
+        return [(-float(len(c)), True) for p, c in requests]
+
+    def loglikelihood_rolling(self, requests, disable_tqdm=False):
+        return [(-1.0,) for r in requests]
+
+def make_tree(lm):
+    tree = BehaviorTree("replay-tree")
+    tree.set_model("echo", lm)
+    node = GenerateAction(HFLMConfig("echo", device="cpu"), LMActionConfig(node_name="generate"))
+    tree.set_root(node)
+    return tree
+
+def test_record_and_replay(tmp_path):
+    recorder = RecordingLM(EchoLM())
+    tree = make_tree(recorder)
+    tree.blackboard["in"] = "hello world"
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert recorder.loglikelihood([("a", "bc")]) == [(-2.0, True)]
+    assert len(recorder.records) == 2
+    assert recorder.records[0]["latency"] >= 0.01
+
+    recording = tmp_path / "calls.jsonl"
+    recorder.save(str(recording))
+
+    replay = ReplayLM(str(recording), latency=LatencyModel.none())
+    tree = make_tree(replay)
+    tree.blackboard["in"] = "hello world"
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert tree.blackboard["out"] == "HELLO WORLD"
+    assert replay.loglikelihood([("a", "bc")]) == [(-2.0, True)]
+    assert replay.n_misses == 0
+
+    # unrecorded prompts cycle through the recorded responses.
+    tree.blackboard["in"] = "something else"
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert tree.blackboard["out"] == "HELLO WORLD"
+    assert replay.n_misses == 1
+
+    strict = ReplayLM(str(recording), strict=True)
+    try:
+        strict.generate_until([("something else", {})])
+        assert False
+    except KeyError:
+        pass
+
+def test_replay_latency():
+    replay = ReplayLM(latency=LatencyModel.fixed(0.02))
+    replay.add("generate_until", ["prompt", {}], "response")
+    start = time.perf_counter()
+    assert replay.generate_until([("prompt", {})]) == ["response"]
+    assert time.perf_counter() - start >= 0.02
+
+    a = ReplayLM(latency=LatencyModel.lognormal(0.01, 0.5), seed=3)
+    b = ReplayLM(latency=LatencyModel.lognormal(0.01, 0.5), seed=3)
+    assert [a.latency.sample(a.rng, 0.0, 1) for _ in range(5)] == [b.latency.sample(b.rng, 0.0, 1) for _ in range(5)]
@@ -0,0 +1,97 @@
+from dendron import BehaviorTree, NodeStatus
+from dendron import ActionNode
+from dendron.blackboard import BlackboardEntryMetadata
+from dendron.shared_blackboard import SharedMemoryBlackboard
+
+from concurrent.futures import ProcessPoolExecutor
+
+import multiprocessing
+import numpy as np
+import pytest
+
+def brighten(bb):
+    # runs in a worker process, on a blackboard attached by unpickling.
+    image = bb.view("image")
+    image += 10
+    bb["n_frames"] = bb["n_frames"] + 1
+    bb["caption"] = "a brighter image " * 100
+    bb.close()
+
+class CountFrame(ActionNode):
+    def tick(self):
+        self.blackboard["n_frames"] = self.blackboard["n_frames"] + 1
+        return NodeStatus.SUCCESS
+
+def tick_in_worker(tree):
+    status = tree.tick_once()
+    tree.blackboard.close()
+    return status
+
+def test_values_round_trip():
+    with SharedMemoryBlackboard() as bb:
+        bb.register_entry(BlackboardEntryMetadata("speed", "Speed in m/s", float))
+        bb["speed"] = 3
+        assert bb["speed"] == 3.0 and type(bb["speed"]) is float
+        bb["flag"] = True
+        bb["blob"] = b"\x00\x01"
+        bb["meta"] = {"a" : [1, 2]}
+        bb["frame"] = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+        assert bb["flag"] is True
+        assert bb["blob"] == b"\x00\x01"
+        assert bb["meta"] == {"a" : [1, 2]}
+        assert np.array_equal(bb["frame"], np.arange(12, dtype=np.float32).reshape(3, 4))
+        assert sorted(bb) == ["blob", "flag", "frame", "meta", "speed"]
+
+        # buffers grow, arrays keep their layout.
+        bb["blob"] = bytes(100000)
+        assert len(bb["blob"]) == 100000
+        with pytest.raises(ValueError):
+            bb["frame"] = np.zeros((2, 2))
+
+        del bb["meta"]
+        assert "meta" not in bb and len(bb) == 4
+
+def test_zero_copy_across_processes():
+    ctx = multiprocessing.get_context("fork")
+    with SharedMemoryBlackboard() as bb:
+        bb.declare_array("image", (64, 64, 3), np.uint8)
+        bb["n_frames"] = 0
+        bb["caption"] = ""
+        view = bb.view("image")
+        view[...] = 1
+
+        p = ctx.Process(target=brighten, args=(bb,))
+        p.start()
+        p.join()
+        assert p.exitcode == 0
+        assert int(view[0, 0, 0]) == 11
+        assert bb["n_frames"] == 1
+        assert bb["caption"].startswith("a brighter image")
+        del view
+
+        # a whole tree can be sent to a worker process.
+        bb["n_frames"] = 0
+        tree = BehaviorTree("shared-tree", CountFrame("count"), bb)
+        with ProcessPoolExecutor(2, mp_context=ctx) as pool:
+            assert pool.submit(tick_in_worker, tree).result() == NodeStatus.SUCCESS
+        assert bb["n_frames"] == 1
+
+def test_reads_give_up_on_a_dead_writer():
+    with SharedMemoryBlackboard() as bb:
+        bb["x"] = 1
+        bb.read_timeout = 0.05
+        # a writer that died mid-write leaves the sequence number odd.
+        buf = bb._segment(bb.directory["x"]).buf
+        buf[0] += 1
+        with pytest.raises(TimeoutError):
+            bb["x"]
+        buf[0] += 1
+        assert bb["x"] == 1
+
+        bb.directory_shm.buf[0] += 1
+        with pytest.raises(TimeoutError):
+            bb["y"] = 2
+        bb.directory_shm.buf[0] += 1
+        bb["y"] = 2
+        assert bb["y"] == 2
@@ -0,0 +1,42 @@
+from dendron import Blackboard, BlackboardView, SlotBlackboard
+from dendron.blackboard import BlackboardEntryMetadata
+from dendron.slot_blackboard import EMPTY
+
+import pickle
+import pytest
+
+def test_slots_and_keys_agree():
+    bb = SlotBlackboard()
+    speed = bb.slot("speed")
+    assert "speed" not in bb and len(bb) == 0
+    with pytest.raises(KeyError):
+        bb.get_slot(speed)
+
+    bb.register_entry(BlackboardEntryMetadata("speed", "Speed in m/s", float))
+    bb.set_slot(speed, 3)
+    assert bb["speed"] == 3.0 and type(bb.get_slot(speed)) is float
+    bb["name"] = "robot"
+    assert bb.get_slot(bb.slot("name")) == "robot"
+    assert bb.value_mapping == {"speed" : 3, "name" : "robot"}
+
+    # deleted keys keep their slot.
+    del bb["speed"]
+    assert "speed" not in bb and len(bb) == 1
+    bb["speed"] = 5
+    assert bb.slot("speed") == speed and bb.get_slot(speed) == 5
+
+    cp = bb.checkpoint()
+    bb.set_slot(speed, 6)
+    assert bb.delta_since(cp).values == {"speed" : 6}
+
+    copy = pickle.loads(pickle.dumps(bb))
+    assert copy.value_mapping == bb.value_mapping
+    assert copy.slot_values[copy.slot("missing")] is EMPTY
+
+def test_slots_on_other_blackboards():
+    # every blackboard takes slots, falling back to access by key.
+    bb = Blackboard()
+    view = BlackboardView(bb, {"in" : "speed"})
+    slot = view.slot("in")
+    view.set_slot(slot, 2)
+    assert bb["speed"] == 2 and view.get_slot(slot) == 2
@@ -0,0 +1,73 @@
+from dendron import BehaviorTree, NodeStatus
+from dendron.actions import AlwaysSuccess, AlwaysFailure
+from dendron.controls import Sequence, Fallback
+from dendron.instrumentation import TickTracer, TraceDecoder, TraceEvent
+
+def make_tree():
+    root = Sequence([
+        AlwaysSuccess("first"),
+        Fallback([AlwaysFailure("fails"), AlwaysSuccess("recovers")], name="choice"),
+    ], name="root")
+    return BehaviorTree("traced-tree", root)
+
+def test_tick_tracer_round_trip(tmp_path):
+    tree = make_tree()
+    tracer = TickTracer(capacity=1024)
+    tree.add_tracer(tracer)
+
+    tree.tick_once()
+    tree.tick_once()
+    assert tracer.n_recorded == 2 * (2 + 2 * 5)
+
+    trace_file = tmp_path / "trace.bin"
+    tracer.dump(str(trace_file))
+
+    decoder = TraceDecoder(str(trace_file))
+    assert len(decoder) == tracer.n_recorded
+    assert decoder.dropped == 0
+
+    ticks = decoder.ticks()
+    assert len(ticks) == 2
+    for tick in ticks:
+        assert tick.status == NodeStatus.SUCCESS
+        assert [s.path for s in tick.steps] == [
+            "root", "root/first", "root/choice", "root/choice/fails", "root/choice/recovers"
+        ]
+        assert [s.status for s in tick.steps] == [
+            NodeStatus.SUCCESS, NodeStatus.SUCCESS, NodeStatus.SUCCESS, NodeStatus.FAILURE, NodeStatus.SUCCESS
+        ]
+        assert [s.depth for s in tick.steps] == [0, 1, 1, 2, 2]
+        assert tick.steps[0].duration_ns >= tick.steps[2].duration_ns >= 0
+
+def test_tick_tracer_ring_buffer_wraps(tmp_path):
+    tree = make_tree()
+    tracer = TickTracer(capacity=16)
+    tree.add_tracer(tracer)
+
+    for _ in range(5):
+        tree.tick_once()
+
+    trace_file = tmp_path / "trace.bin"
+    tracer.dump(str(trace_file))
+    decoder = TraceDecoder(str(trace_file))
+
+    assert len(decoder) == 16
+    assert decoder.dropped == 5 * 12 - 16
+
+    events = list(decoder.events())
+    assert events[-1].event == TraceEvent.TICK_END
+    timestamps = [e.timestamp_ns for e in events]
+    assert timestamps == sorted(timestamps)
+
+    ticks = decoder.ticks()
+    assert ticks[-1].status == NodeStatus.SUCCESS
+    assert len(ticks[-1].steps) == 5
+
+def test_remove_tracer():
+    tree = make_tree()
+    tracer = TickTracer(capacity=64)
+    tree.add_tracer(tracer)
+    tree.remove_tracer(tracer)
+    tree.tick_once()
+    assert tracer.n_recorded == 0
+    assert tree.root.tracer is None
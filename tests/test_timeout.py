@@ -0,0 +1,104 @@
+from dendron import BehaviorTree, NodeStatus
+from dendron.actions import AsyncAction, GenerateAction, SimpleAction
+from dendron.configs import HFLMConfig, LMActionConfig
+from dendron.controls import Sequence
+from dendron.decorators import Timeout
+from dendron.replay_lm import LatencyModel, ReplayLM
+from dendron.timers import TreeTimer
+
+import threading
+import time
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+def test_deadline_is_published_to_the_subtree():
+    clock = FakeClock()
+    seen = []
+
+    def slow():
+        seen.append(node.time_remaining())
+        clock.t += 2.0
+        return NodeStatus.SUCCESS
+
+    node = SimpleAction("slow", slow)
+    tree = BehaviorTree("timeout-tree", Timeout("outer", Timeout("inner", node, 5000), 1000))
+    tree.timer = TreeTimer(clock)
+
+    # the inner limit is later, so the outer one is in force.
+    assert tree.tick_once() == NodeStatus.FAILURE
+    assert seen == [1.0]
+    assert tree.deadline() is None
+    assert node.time_remaining() is None
+
+def test_expired_deadline_halts_running_child():
+    clock = FakeClock()
+    halted = []
+
+    class Running(SimpleAction):
+        def halt_node(self):
+            halted.append(self.name)
+            super().halt_node()
+
+    child = Sequence([Running("a", lambda: NodeStatus.RUNNING)], "seq")
+    tree = BehaviorTree("timeout-tree", Timeout("timeout", child, 100))
+    tree.timer = TreeTimer(clock)
+
+    assert tree.tick_once() == NodeStatus.RUNNING
+    clock.t = 0.05
+    assert tree.tick_once() == NodeStatus.RUNNING
+    clock.t = 0.2
+    assert tree.tick_once() == NodeStatus.FAILURE
+    assert halted == ["a"]
+    assert child.status == NodeStatus.IDLE
+
+    # the next tick starts a new time limit.
+    assert tree.tick_once() == NodeStatus.RUNNING
+
+def test_async_child_future_is_cancelled():
+    release = threading.Event()
+    started = threading.Event()
+    ran = []
+
+    def blocker():
+        started.set()
+        release.wait()
+        return NodeStatus.SUCCESS
+
+    def queued():
+        ran.append(None)
+        return NodeStatus.SUCCESS
+
+    # one worker: the second job waits in the queue behind the first.
+    tree = BehaviorTree("timeout-tree", num_workers=1)
+    tree.executor.submit(blocker)
+    started.wait()
+    node = AsyncAction("queued", queued)
+    tree.set_root(Timeout("timeout", node, 20))
+
+    assert tree.tick_once() == NodeStatus.RUNNING
+    fut = node.fut
+    time.sleep(0.03)
+    assert tree.tick_once() == NodeStatus.FAILURE
+    assert fut.cancelled()
+    release.set()
+    tree.executor.shutdown(wait=True)
+    assert ran == []
+
+def test_generation_stops_at_deadline():
+    lm = ReplayLM(latency=LatencyModel.fixed(5.0))
+    lm.add("generate_until", ["hello", {}], "hello there")
+    tree = BehaviorTree("timeout-tree")
+    tree.set_model("replay", lm)
+    node = GenerateAction(HFLMConfig("replay", device="cpu"), LMActionConfig(node_name="generate"))
+    tree.set_root(Timeout("timeout", node, 50))
+    tree.blackboard["in"] = "hello"
+
+    start = time.monotonic()
+    assert tree.tick_once() == NodeStatus.FAILURE
+    assert time.monotonic() - start < 1.0
+    assert "out" not in tree.blackboard
@@ -0,0 +1,110 @@
+from dendron import BehaviorTree, NodeStatus
+from dendron.actions import AsyncAction, SimpleAction
+from dendron.controls import Fallback
+from dendron.decorators import Cooldown, Delay, Throttle
+from dendron.timers import TreeTimer
+
+import random
+import time
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+def make_tree(root, clock):
+    tree = BehaviorTree("wheel-tree", root)
+    tree.timer = TreeTimer(clock)
+    return tree
+
+def counter(status=NodeStatus.SUCCESS):
+    calls = []
+    def callback():
+        calls.append(None)
+        return status
+    return calls, callback
+
+def test_wheel_runs_timers_at_their_deadlines():
+    # deadlines from sub-tick to far beyond the first levels of the wheel.
+    clock = FakeClock()
+    timer = TreeTimer(clock)
+    rng = random.Random(0)
+    fired = []
+    deadlines = [rng.choice([1e-4, 1.0, 100.0, 1e5, 1e9]) * rng.random() for _ in range(2000)]
+    handles = [timer.call_at(d, lambda d=d: fired.append(d)) for d in deadlines]
+    cancelled = set(handles[::3])
+    for handle in cancelled:
+        timer.cancel(handle)
+    live = sorted(h.deadline for h in handles if h not in cancelled)
+    assert len(timer) == len(live)
+    assert timer.next_deadline() == live[0]
+
+    for now in [5e-5, 0.5, 50.0, 5e4, 5e8, 1e9]:
+        clock.t = now
+        timer.run_due()
+        assert fired == [d for d in live if d <= now]
+    assert len(timer) == 0
+    assert timer.next_deadline() is None
+
+def test_delay_waits_before_ticking_child():
+    clock = FakeClock()
+    calls, callback = counter()
+    tree = make_tree(Delay("delay", SimpleAction("a", callback), 100), clock)
+
+    assert tree.tick_once() == NodeStatus.RUNNING
+    clock.t = 0.05
+    assert tree.tick_once() == NodeStatus.RUNNING
+    assert calls == []
+    clock.t = 0.1
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert len(calls) == 1
+    # the next run waits again.
+    assert tree.tick_once() == NodeStatus.RUNNING
+
+def test_throttle_limits_child_rate():
+    clock = FakeClock()
+    calls, callback = counter()
+    tree = make_tree(Throttle("throttle", SimpleAction("a", callback), 100), clock)
+
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    tree.reset()
+    assert tree.tick_once() == NodeStatus.RUNNING
+    assert len(calls) == 1
+    clock.t = 0.1
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert len(calls) == 2
+
+def test_cooldown_fails_until_cooled_down():
+    clock = FakeClock()
+    calls, callback = counter()
+    fallback_calls, fallback = counter()
+    root = Fallback([Cooldown("cooldown", SimpleAction("a", callback), 1000), SimpleAction("b", fallback)], "fallback")
+    tree = make_tree(root, clock)
+
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert (len(calls), len(fallback_calls)) == (1, 1)
+    clock.t = 1.0
+    assert tree.tick_once() == NodeStatus.SUCCESS
+    assert (len(calls), len(fallback_calls)) == (2, 1)
+
+def test_tick_while_running_sleeps_between_ticks():
+    ticks = []
+
+    def slow():
+        time.sleep(0.05)
+        return NodeStatus.SUCCESS
+
+    node = AsyncAction("slow", slow)
+    node.pre_tick_fns.append(lambda: ticks.append(None))
+    tree = BehaviorTree("wheel-tree", node)
+    assert tree.tick_while_running() == NodeStatus.SUCCESS
+    # one tick to start the job and one when it finishes, not a spin.
+    assert len(ticks) <= 3
+
+    tree = BehaviorTree("wheel-tree", Delay("delay", SimpleAction("a", lambda: NodeStatus.SUCCESS), 50))
+    start = time.monotonic()
+    assert tree.tick_while_running() == NodeStatus.SUCCESS
+    assert time.monotonic() - start >= 0.05
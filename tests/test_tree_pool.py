@@ -0,0 +1,96 @@
+from dendron import ActionNode, BehaviorTree, NodeStatus
+from dendron.controls import Sequence
+from dendron.tree_pool import TreePool, TreePoolError
+
+import multiprocessing
+import os
+import pickle
+import pytest
+
+class Count(ActionNode):
+    def tick(self):
+        bb = self.blackboard
+        bb["count"] = bb["count"] + bb["step"]
+        bb["pid"] = os.getpid()
+        return NodeStatus.SUCCESS if bb["count"] >= 3 else NodeStatus.RUNNING
+
+class Fail(ActionNode):
+    def tick(self):
+        raise ValueError("boom")
+
+class Unpicklable(ActionNode):
+    def tick(self):
+        self.blackboard["callback"] = lambda: None
+        return NodeStatus.SUCCESS
+
+class Die(ActionNode):
+    def tick(self):
+        os._exit(3)
+
+def make_tree(name):
+    tree = BehaviorTree(name, Sequence([Count("count")]))
+    tree.blackboard["count"] = 0
+    tree.blackboard["step"] = 1
+    tree.blackboard["unused"] = "x" * 1000
+    return tree
+
+def test_sessions_keep_state_in_their_worker():
+    with TreePool(2, mp_context=multiprocessing.get_context("fork")) as pool:
+        sessions = ["alpha", "beta", "gamma", "delta"]
+        for s in sessions:
+            pool.add_tree(s, make_tree(s)).result()
+
+        results = [pool.tick(s).result() for s in sessions]
+        assert all(r.status == NodeStatus.RUNNING for r in results)
+        # only the keys the tick wrote come back.
+        assert set(results[0].delta) == {"count", "pid"}
+        assert results[0].delta["count"] == 1
+
+        # updates are applied before the tick.
+        result = pool.tick("alpha", {"step" : 5}).result()
+        assert result.status == NodeStatus.SUCCESS
+        assert result.delta["count"] == 6 and "step" not in result.delta
+
+        result = pool.tick_while_running("beta").result()
+        assert result.status == NodeStatus.SUCCESS
+        assert result.delta["count"] == 3
+
+        pids = {pool.tick(s).result().delta["pid"] for s in sessions}
+        assert len(pids) == 2 and os.getpid() not in pids
+
+        tree = pool.get_tree("beta").result()
+        assert tree.blackboard["count"] >= 3
+
+        pool.remove_tree("gamma").result()
+        with pytest.raises(TreePoolError):
+            pool.tick("gamma").result()
+
+def test_worker_exceptions_are_reported():
+    with TreePool(1, mp_context=multiprocessing.get_context("fork")) as pool:
+        pool.add_tree(7, BehaviorTree("fail", Fail("fail"))).result()
+        with pytest.raises(TreePoolError, match="boom"):
+            pool.tick(7).result()
+        # the worker keeps serving.
+        pool.add_tree(8, make_tree("ok")).result()
+        assert pool.tick(8).result().status == NodeStatus.RUNNING
+
+def test_unpicklable_results_are_reported():
+    with TreePool(1, mp_context=multiprocessing.get_context("fork")) as pool:
+        pool.add_tree(1, BehaviorTree("unpicklable", Unpicklable("unpicklable"))).result()
+        with pytest.raises(TreePoolError, match="pickle"):
+            pool.tick(1).result(timeout=10)
+        # requests that do not pickle fail in the caller.
+        with pytest.raises((AttributeError, pickle.PicklingError)):
+            pool.tick(1, {"callback" : lambda: None})
+        assert pool.get_tree(2).exception(timeout=10) is not None
+
+def test_dead_workers_fail_their_requests():
+    with TreePool(2, mp_context=multiprocessing.get_context("fork")) as pool:
+        pool.add_tree(0, BehaviorTree("die", Die("die"))).result()
+        pool.add_tree(1, make_tree("ok")).result()
+        with pytest.raises(TreePoolError, match="exit code 3"):
+            pool.tick(0).result(timeout=10)
+        with pytest.raises(TreePoolError, match="exit code 3"):
+            pool.tick(0).result(timeout=10)
+        # the other worker keeps serving.
+        assert pool.tick(1).result(timeout=10).status == NodeStatus.RUNNING